@@ -0,0 +1,89 @@
+"""Per-object memory and decode time of the Booking model.
+
+Compares the slotted, lazily-parsed models against the previous plain
+dataclass layout that parsed both dates eagerly.
+
+    python -m benchmarks.bench_booking_model [count]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from models.booking import Booking, FrozenBooking
+
+
+@dataclass
+class LegacyBookingDates:
+    checkin: date
+    checkout: date
+
+
+@dataclass
+class LegacyBooking:
+    firstname: str
+    lastname: str
+    totalprice: int
+    depositpaid: bool
+    bookingdates: LegacyBookingDates
+    additionalneeds: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data):
+        booking_dates = LegacyBookingDates(
+            checkin=date.fromisoformat(data['bookingdates']['checkin']),
+            checkout=date.fromisoformat(data['bookingdates']['checkout'])
+        )
+        return cls(
+            firstname=data['firstname'],
+            lastname=data['lastname'],
+            totalprice=data['totalprice'],
+            depositpaid=data['depositpaid'],
+            bookingdates=booking_dates,
+            additionalneeds=data.get('additionalneeds')
+        )
+
+
+def sample_payloads(count):
+    return [{
+        'firstname': f"Guest{n}",
+        'lastname': f"Family{n % 100}",
+        'totalprice': 100 + n % 400,
+        'depositpaid': n % 2 == 0,
+        'bookingdates': {'checkin': f"2025-{1 + n % 12:02d}-{1 + n % 28:02d}",
+                         'checkout': f"2026-{1 + n % 12:02d}-{1 + n % 28:02d}"},
+        'additionalneeds': 'Breakfast',
+    } for n in range(count)]
+
+
+def bytes_per_object(model, payloads):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [model.from_dict(payload) for payload in payloads]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # Exclude the list holding the objects
+    return (allocated - sys.getsizeof(objects)) / len(objects)
+
+
+def decode_us(model, payloads, repeat=5):
+    best = min(timeit.repeat(lambda: [model.from_dict(p) for p in payloads], number=1, repeat=repeat))
+    return best / len(payloads) * 1e6
+
+
+def main(count=100_000):
+    payloads = sample_payloads(count)
+    print(f"{'model':<16}{'bytes/object':>14}{'decode us':>12}{'decode+dates us':>18}")
+    for model in (LegacyBooking, Booking, FrozenBooking):
+        with_dates = min(timeit.repeat(
+            lambda: [model.from_dict(p).bookingdates.checkin for p in payloads], number=1, repeat=3))
+        print(f"{model.__name__:<16}{bytes_per_object(model, payloads):>14.0f}"
+              f"{decode_us(model, payloads):>12.2f}{with_dates / count * 1e6:>18.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,131 @@
+"""Micro-benchmarks of the framework's own per-test overhead, with no network.
+
+Covers model (de)serialization, assertions, test data generation, bug
+reporting and BaseAPIClient._make_request against an in-process stub adapter.
+
+    python -m benchmarks.bench_hot_paths run [--output FILE] [--samples N] [-k SUBSTRING]
+    python -m benchmarks.bench_hot_paths compare BASELINE CURRENT [--threshold 0.10] [--metric min_us]
+
+`compare` exits with status 1 when any benchmark is slower than the baseline by
+more than the threshold. It compares the fastest sample by default, which is far
+less sensitive to a noisy machine than the median.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import Callable, Dict
+
+from requests.adapters import BaseAdapter
+
+from benchmarks.harness import compare, measure, save_results
+from clients.base_client import BaseAPIClient
+from clients.circuit_breaker import CircuitBreaker
+from clients.in_memory_transport import build_response
+from clients.limiter import AIMDLimiter, RequestLimiter
+from clients.retry import RetryPolicy
+from models.booking import Booking
+from tests.data.test_data import BookingTestData
+from utils.assertions import APIAssertions
+from utils.bug_reporter import BugReporter
+
+PAYLOAD_DIR = os.path.join(os.path.dirname(__file__), 'payloads')
+STUB_URL = 'http://bench.local'
+
+
+class StubAdapter(BaseAdapter):
+    """Answers every request with a canned body, so only client-side overhead is timed"""
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):
+        return build_response(request, 200, {'Content-Type': 'application/json'}, self.body, self)
+
+    def close(self):
+        pass
+
+
+def stub_client(body: bytes, **policies) -> BaseAPIClient:
+    client = BaseAPIClient(STUB_URL, **policies)
+    client.mount(STUB_URL, StubAdapter(body))
+    return client
+
+
+def failure_messages():
+    """Failure texts of a few distinct shapes, varying in ids and timestamps like real ones"""
+    for n in itertools.count():
+        yield (f"test_filter_by_checkin_date[{n % 40}]",
+               f"tests/test_booking_filters.py:{40 + n % 3}: in test_filter_by_checkin_date\n"
+               f"AssertionError: Booking {1000 + n} missing from results at 2026-01-{1 + n % 28:02d}T10:00:00Z "
+               f"(request {n:08x}-1234-5678-9abc-def012345678)")
+
+
+def benchmarks() -> Dict[str, Callable[[], object]]:
+    with open(os.path.join(PAYLOAD_DIR, 'booking.json'), 'rb') as f:
+        booking_body = f.read()
+    booking_data = json.loads(booking_body)
+    booking = Booking.from_dict(booking_data)
+    valid_booking = BookingTestData.valid_booking()
+
+    reporter = BugReporter()
+    messages = failure_messages()
+
+    plain_client = stub_client(booking_body)
+    guarded_client = stub_client(booking_body, retry_policy=RetryPolicy(),
+                                 circuit_breaker=CircuitBreaker(),
+                                 limiter=RequestLimiter(AIMDLimiter(max_limit=32)))
+
+    return {
+        'Booking.from_dict': lambda: Booking.from_dict(booking_data),
+        'Booking.to_dict': booking.to_dict,
+        'assert_booking_equality[dict-vs-model]': lambda: APIAssertions.assert_booking_equality(booking_data, booking),
+        'BookingTestData.valid_booking': BookingTestData.valid_booking,
+        'BookingTestData.updated_booking_data': lambda: BookingTestData.updated_booking_data(valid_booking),
+        'BugReporter.add_auto_detected_bug': lambda: reporter.add_auto_detected_bug(*next(messages)),
+        '_make_request[GET]': lambda: plain_client._make_request('GET', '/booking/1'),
+        '_make_request[POST json]': lambda: plain_client._make_request('POST', '/booking', json=booking_data),
+        '_make_request[GET retry+breaker+limiter]': lambda: guarded_client._make_request('GET', '/booking/1'),
+    }
+
+
+def run(output: str = None, samples: int = 30, pattern: str = None) -> str:
+    results = {}
+    print(f"{'benchmark':<44}{'min us':>10}{'median us':>12}{'p99 us':>10}")
+    for name, func in benchmarks().items():
+        if pattern and pattern not in name:
+            continue
+        stats = results[name] = measure(func, samples=samples)
+        print(f"{name:<44}{stats['min_us']:>10.3f}{stats['median_us']:>12.3f}{stats['p99_us']:>10.3f}")
+    filename = save_results(results, output)
+    print(f"Results written to {filename}")
+    return filename
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_hot_paths')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='Run the benchmarks and save the results as JSON')
+    run_parser.add_argument('--output', help='Result file (default: reports/benchmark_<timestamp>.json)')
+    run_parser.add_argument('--samples', type=int, default=30)
+    run_parser.add_argument('-k', dest='pattern', help='Only run benchmarks whose name contains this')
+    compare_parser = commands.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='Allowed relative slowdown before flagging (default: 0.10)')
+    compare_parser.add_argument('--metric', default='min_us',
+                                choices=('min_us', 'median_us', 'mean_us', 'p90_us', 'p99_us'))
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        run(args.output, args.samples, args.pattern)
+        return 0
+    return 1 if compare(args.baseline, args.current, args.threshold, args.metric) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Decode/encode time of each installed JSON backend on recorded API payloads.
+
+The /booking list payload is replicated up to the requested id count to model
+a busy environment.
+
+    python -m benchmarks.bench_json_codec [booking_ids]
+"""
+
+import os
+import sys
+import timeit
+
+from utils.json_codec import available_codecs
+
+PAYLOAD_DIR = os.path.join(os.path.dirname(__file__), 'payloads')
+
+
+def load_payloads(list_size):
+    payloads = {}
+    for name in ('booking', 'create_booking', 'booking_list'):
+        with open(os.path.join(PAYLOAD_DIR, f"{name}.json"), 'rb') as f:
+            payloads[name] = f.read()
+    # Scale the recorded list by repeating its entries with fresh ids
+    body = payloads.pop('booking_list')
+    entry_size = body.count(b'bookingid')
+    payloads[f"booking_list[{list_size}]"] = (
+        b'[' + b','.join(b'{"bookingid":%d}' % n for n in range(1, list_size + 1)) + b']'
+        if list_size > entry_size else body)
+    return payloads
+
+
+def best_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main(list_size=200_000):
+    payloads = load_payloads(list_size)
+    codecs = available_codecs()
+    print(f"{'payload':<24}{'bytes':>10}" + ''.join(f"{name + ' us':>14}" for name in codecs))
+    for name, body in payloads.items():
+        number = max(1, 200_000 // len(body))
+        row = f"{name:<24}{len(body):>10}"
+        for codec in codecs.values():
+            row += f"{best_us(lambda: codec.loads(body), number):>14.1f}"
+        print(row)
+
+    decoded = next(iter(codecs.values())).loads(payloads['create_booking'])['booking']
+    row = f"{'encode booking':<24}{'':>10}"
+    for codec in codecs.values():
+        row += f"{best_us(lambda: codec.dumps(decoded), 10_000):>14.2f}"
+    print(row)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
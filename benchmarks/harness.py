@@ -0,0 +1,109 @@
+"""Timing, result files and regression comparison for the benchmark suites"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict
+
+# Calls per sample are scaled until one sample takes at least this long
+MIN_SAMPLE_SECONDS = 0.005
+
+
+def calibrate(func: Callable[[], object]) -> int:
+    """Calls per sample so that timer resolution and loop overhead are negligible"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= MIN_SAMPLE_SECONDS:
+            return number
+        number *= 2
+
+
+def measure(func: Callable[[], object], samples: int = 30, warmup: int = 3) -> Dict[str, float]:
+    """Per-call time statistics in microseconds over `samples` timed batches"""
+    number = calibrate(func)
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - started) / number * 1e6)
+
+    timings.sort()
+    return {
+        'min_us': round(timings[0], 4),
+        'median_us': round(statistics.median(timings), 4),
+        'mean_us': round(statistics.fmean(timings), 4),
+        'p90_us': round(timings[min(len(timings) - 1, int(0.9 * len(timings)))], 4),
+        'p99_us': round(timings[min(len(timings) - 1, int(0.99 * len(timings)))], 4),
+        'max_us': round(timings[-1], 4),
+        'stdev_us': round(statistics.stdev(timings), 4) if len(timings) > 1 else 0.0,
+        'calls_per_sample': number,
+        'samples': samples,
+    }
+
+
+def machine_info() -> Dict[str, object]:
+    """Where the numbers came from; results are only comparable on similar machines"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor() or None,
+        'cpu_count': os.cpu_count(),
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def save_results(results: Dict[str, Dict[str, float]], filename: str = None) -> str:
+    if not filename:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        filename = f"reports/benchmark_{timestamp}.json"
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    with open(filename, 'w') as f:
+        json.dump({'machine': machine_info(), 'benchmarks': results}, f, indent=2)
+    return filename
+
+
+def compare(baseline_file: str, current_file: str, threshold: float = 0.10,
+            metric: str = 'min_us') -> bool:
+    """Print current vs baseline per benchmark; True when any one is slower by more than threshold"""
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    with open(current_file) as f:
+        current = json.load(f)
+
+    for key in ('python', 'machine', 'cpu_count'):
+        if baseline['machine'].get(key) != current['machine'].get(key):
+            print(f"warning: {key} differs ({baseline['machine'].get(key)} vs {current['machine'].get(key)})")
+
+    regressed = False
+    print(f"{'benchmark':<44}{'baseline ' + metric:>20}{'current ' + metric:>20}{'change':>10}")
+    for name, stats in current['benchmarks'].items():
+        before = baseline['benchmarks'].get(name)
+        if before is None:
+            print(f"{name:<44}{'-':>20}{stats[metric]:>20.3f}{'new':>10}")
+            continue
+        change = stats[metric] / before[metric] - 1 if before[metric] else 0.0
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f"{name:<44}{before[metric]:>20.3f}{stats[metric]:>20.3f}{change:>+10.1%}{flag}")
+    return regressed
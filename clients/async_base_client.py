@@ -0,0 +1,89 @@
+import httpx
+import logging
+from config.headers import DEFAULT_HEADERS
+from utils.json_codec import JSONCodec, get_codec
+from utils.metrics import network_clock
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseAPIClient:
+    """asyncio counterpart of BaseAPIClient backed by a pooled httpx.AsyncClient"""
+
+    def __init__(self, base_url: str = None, timeout: int = 30,
+                 max_connections: int = 100, max_keepalive_connections: int = 20,
+                 transport: httpx.AsyncBaseTransport = None, json_codec: JSONCodec = None):
+        self.base_url = base_url
+        self.json_codec = json_codec or get_codec()
+        self.transport = transport
+        self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections)
+        self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared AsyncClient, created lazily so it binds to the running event loop"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(base_url=self.base_url or '',
+                                             headers=DEFAULT_HEADERS,
+                                             timeout=self.timeout,
+                                             limits=self.limits,
+                                             transport=self.transport)
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        if kwargs.get('json') is not None:
+            kwargs['content'] = self.json_codec.dumps(kwargs.pop('json'))
+
+        logger.info(f"Making async {method} request to {self.base_url}{endpoint}")
+
+        try:
+            network_clock.enter()
+            try:
+                response = await self.client.request(method, endpoint, **kwargs)
+            finally:
+                network_clock.exit()
+            logger.info(f"Response status: {response.status_code}")
+            return response
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
+    def decode_json(self, response: httpx.Response):
+        """Decode a JSON body straight from the raw bytes with the configured codec"""
+        return self.json_codec.loads(response.content)
+
+    async def get(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._make_request('GET', endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._make_request('POST', endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._make_request('PUT', endpoint, **kwargs)
+
+    async def patch(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._make_request('PATCH', endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._make_request('DELETE', endpoint, **kwargs)
+
+    async def ping_health_check(self) -> bool:
+        """Health check endpoint"""
+        try:
+            response = await self._make_request('GET', '/ping')
+            return response.status_code == 201
+        except httpx.HTTPError:
+            return False
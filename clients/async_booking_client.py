@@ -0,0 +1,136 @@
+import asyncio
+import httpx
+from typing import List, Optional, Dict, Any
+from clients.async_base_client import AsyncBaseAPIClient
+from clients.cassette import AsyncCassetteTransport, Cassette
+from clients.in_memory_transport import InMemoryBookerTransport
+from config.environments import Config
+from models.booking import Booking, BookingResponse, AuthRequest
+
+
+class AsyncBookingAPIClient(AsyncBaseAPIClient):
+    """asyncio version of BookingAPIClient with the same method surface"""
+
+    def __init__(self, config: Config = None, timeout: int = 30,
+                 max_connections: int = 100, max_keepalive_connections: int = 20):
+        if not config:
+            config = Config()
+
+        base_url = Config.get_base_url()
+        transport = InMemoryBookerTransport() if Config.get_transport() == 'memory' else None
+        cassette_settings = Config.get_cassette_settings()
+        if cassette_settings['mode']:
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(
+                    max_connections=max_connections, max_keepalive_connections=max_keepalive_connections))
+            transport = AsyncCassetteTransport(Cassette.shared(cassette_settings['path'], cassette_settings['mode']),
+                                               cassette_settings['mode'], transport)
+        super().__init__(base_url, timeout, max_connections, max_keepalive_connections, transport)
+        self.config = config
+        self._auth_token = None
+        self._auth_lock = asyncio.Lock()
+
+    async def get_auth_token(self, username: str, password: str) -> str:
+        """Get authentication token"""
+        auth_request = AuthRequest(username=username, password=password)
+        response = await self._make_request('POST', '/auth', json=auth_request.to_dict())
+
+        if response.status_code == 200:
+            response_data = self.decode_json(response)
+            if 'token' not in response_data:
+                raise Exception(f"Authentication failed: No token in response")
+            self._auth_token = response_data['token']
+            return self._auth_token
+        else:
+            raise Exception(f"Authentication failed: {response.status_code} - {response.text}")
+
+    async def _get_auth_headers(self) -> Dict[str, str]:
+        """Get authentication headers, obtaining token once for all concurrent callers"""
+        if not self._auth_token:
+            async with self._auth_lock:
+                if not self._auth_token:
+                    credentials = Config.get_auth_credentials()
+                    await self.get_auth_token(credentials['username'], credentials['password'])
+
+        return {
+            'Cookie': f'token={self._auth_token}',
+            'Authorization': f'Basic {self._auth_token}'
+        }
+
+    async def get_all_booking_ids(self) -> List[int]:
+        """Get all booking IDs"""
+        return await self.get_booking_ids()
+
+    async def get_booking_ids(self, firstname: Optional[str] = None,
+                              lastname: Optional[str] = None,
+                              checkin: Optional[str] = None,
+                              checkout: Optional[str] = None) -> List[int]:
+        """Get list of booking IDs with optional filters"""
+        params = {k: v for k, v in locals().items()
+                 if k != 'self' and v is not None}
+        response = await self._make_request('GET', '/booking', params=params)
+
+        if response.status_code == 200:
+            return [booking['bookingid'] for booking in self.decode_json(response)]
+        else:
+            raise Exception(f"Failed to get booking IDs: {response.status_code} - {response.text}")
+
+    async def filter_bookings_by_name(self, firstname: str = None, lastname: str = None) -> List[int]:
+        """Filter bookings by name"""
+        return await self.get_booking_ids(firstname=firstname, lastname=lastname)
+
+    async def filter_bookings_by_dates(self, checkin: str = None, checkout: str = None) -> List[int]:
+        """Filter bookings by check-in/check-out dates"""
+        return await self.get_booking_ids(checkin=checkin, checkout=checkout)
+
+    async def get_booking_by_id(self, booking_id: int) -> Booking:
+        """Get booking by ID"""
+        response = await self._make_request('GET', f'/booking/{booking_id}')
+
+        if response.status_code == 200:
+            return Booking.from_dict(self.decode_json(response))
+        else:
+            raise Exception(f"Failed to get booking {booking_id}: {response.status_code} - {response.text}")
+
+    async def create_booking(self, booking_data: Dict[str, Any]) -> BookingResponse:
+        """Create a new booking"""
+        response = await self._make_request('POST', '/booking', json=booking_data)
+
+        if response.status_code == 200:
+            data = self.decode_json(response)
+            booking = Booking.from_dict(data['booking'])
+            return BookingResponse(bookingid=data['bookingid'], booking=booking)
+        else:
+            raise Exception(f"Failed to create booking: {response.status_code} - {response.text}")
+
+    async def update_booking(self, booking_id: int, booking_data: Dict[str, Any]) -> Booking:
+        """Update existing booking"""
+        headers = await self._get_auth_headers()
+
+        response = await self._make_request('PUT', f'/booking/{booking_id}',
+                                            json=booking_data, headers=headers)
+
+        if response.status_code == 200:
+            return Booking.from_dict(self.decode_json(response))
+        else:
+            raise Exception(f"Failed to update booking {booking_id}: {response.status_code} - {response.text}")
+
+    async def partial_update_booking(self, booking_id: int, updates: Dict[str, Any]) -> Booking:
+        """Partially update existing booking"""
+        headers = await self._get_auth_headers()
+
+        response = await self._make_request('PATCH', f'/booking/{booking_id}',
+                                            json=updates, headers=headers)
+
+        if response.status_code == 200:
+            return Booking.from_dict(self.decode_json(response))
+        else:
+            raise Exception(f"Failed to partially update booking {booking_id}: {response.status_code} - {response.text}")
+
+    async def delete_booking(self, booking_id: int) -> bool:
+        """Delete booking"""
+        headers = await self._get_auth_headers()
+
+        response = await self._make_request('DELETE', f'/booking/{booking_id}', headers=headers)
+
+        return response.status_code in [200, 201, 204]
@@ -1,17 +1,88 @@
 import requests
 import logging
+import threading
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from clients.cassette import Cassette, CassetteAdapter, CassetteMissError
+from clients.circuit_breaker import FAILURE_STATUSES, CircuitBreaker
+from clients.limiter import RequestLimiter
+from clients.retry import RETRYABLE_STATUSES, HedgePolicy, RetryBudget, RetryPolicy
 from config.headers import DEFAULT_HEADERS
+from utils.json_codec import JSONCodec, get_codec
+from utils.metrics import LatencyRecorder, endpoint_template, network_clock
 
 logger = logging.getLogger(__name__)
 
 
 class BaseAPIClient:
-    def __init__(self, base_url: str = None, timeout: int = 30):
+    def __init__(self, base_url: str = None, timeout: float = 30, connect_timeout: float = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 json_codec: JSONCodec = None, retry_policy: RetryPolicy = None,
+                 hedge_policy: HedgePolicy = None, limiter: RequestLimiter = None,
+                 circuit_breaker: CircuitBreaker = None):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.timeout = timeout
-        
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        self.json_codec = json_codec or get_codec()
+        # requests only honours timeouts passed per request, as a (connect, read) tuple
+        self.timeout = (connect_timeout if connect_timeout is not None else timeout, timeout)
+
+        # One adapter (and therefore one urllib3 pool) shared by every per-thread session
+        self.adapter = HTTPAdapter(pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize,
+                                   pool_block=pool_block)
+        self._adapters = {'http://': self.adapter, 'https://': self.adapter}
+        self._sessions = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._local = threading.local()
+        self.latency = LatencyRecorder()
+        self.retry_policy = retry_policy
+        self.hedge_policy = hedge_policy
+        self.limiter = limiter if limiter is not None and limiter.enabled else None
+        self.circuit_breaker = circuit_breaker
+        self._hedge_workers = pool_maxsize
+        self._hedge_executor = None
+        self._cassette = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Session for the calling thread; all sessions share the mounted adapters"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            with self._sessions_lock:
+                for prefix, adapter in self._adapters.items():
+                    session.mount(prefix, adapter)
+                self._sessions.add(session)
+            self._local.session = session
+        return session
+
+    def mount(self, prefix: str, adapter: requests.adapters.BaseAdapter):
+        """Mount a transport adapter on every existing and future per-thread session"""
+        with self._sessions_lock:
+            self._adapters[prefix] = adapter
+            for session in self._sessions:
+                session.mount(prefix, adapter)
+
+    def use_cassette(self, cassette: Cassette, mode: str):
+        """Record every request/response through the current adapter, or replay from the cassette"""
+        inner = self.session.get_adapter(self.base_url)
+        self.mount(self.base_url, CassetteAdapter(cassette, mode, inner))
+        self._cassette = cassette
+
+    def close(self):
+        """Close all per-thread sessions and the shared connection pool"""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+
+    def _make_request(self, method: str, endpoint: str, retry: bool = True, **kwargs) -> requests.Response:
         url = f"{self.base_url}{endpoint}"
         
         # Add default headers
@@ -19,17 +90,161 @@ class BaseAPIClient:
         for key, value in DEFAULT_HEADERS.items():
             headers.setdefault(key, value)
         kwargs['headers'] = headers
+        kwargs.setdefault('timeout', self.timeout)
+        if kwargs.get('json') is not None:
+            kwargs['data'] = self.json_codec.dumps(kwargs.pop('json'))
         
         logger.info(f"Making {method} request to {url}")
         
-        try:
-            response = self.session.request(method, url, **kwargs)
+        policy = self.retry_policy if retry else None
+        breaker = self.circuit_breaker
+        if policy:
+            policy.budget.deposit()
+        attempt = 0
+        while True:
+            # Fails within microseconds while the backend is known to be down
+            probe = breaker.before_request() if breaker else False
+            try:
+                response = self._send(method, url, endpoint, policy.budget if policy else None, **kwargs)
+            except CassetteMissError:
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if breaker:
+                    breaker.record_failure(f"{method} {url}: {e}")
+                probe = False
+                if policy and policy.can_retry(method, attempt) and policy.budget.withdraw():
+                    logger.warning(f"Retrying {method} {url} after error: {e}")
+                    time.sleep(policy.delay(attempt))
+                    attempt += 1
+                    continue
+                logger.error(f"Request failed: {e}")
+                raise
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request failed: {e}")
+                raise
+            else:
+                if breaker:
+                    if response.status_code in FAILURE_STATUSES:
+                        breaker.record_failure(f"{method} {url}: {response.status_code}")
+                    else:
+                        breaker.record_success()
+                probe = False
+            finally:
+                if probe:
+                    # A cassette miss, redirect loop or other error says nothing about the backend
+                    breaker.release_probe()
+
+            if (policy and response.status_code in RETRYABLE_STATUSES
+                    and policy.can_retry(method, attempt) and policy.budget.withdraw()):
+                logger.warning(f"Retrying {method} {url} after status {response.status_code}")
+                response.close()
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+
             logger.info(f"Response status: {response.status_code}")
             return response
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise
+
+    def _send(self, method: str, url: str, endpoint: str, budget: RetryBudget = None,
+              **kwargs) -> requests.Response:
+        """One attempt, hedged for GETs when a hedge policy is set and a retry budget can pay for it"""
+        delay = None
+        # Both hedged copies would be recorded under one key, and a replay would need them both
+        if self.hedge_policy and self._cassette is None and budget is not None and method.upper() == 'GET':
+            delay = self.hedge_policy.delay_for(self.latency.histogram(method, endpoint))
+
+        limiter_key = f"{method.upper()} {endpoint_template(endpoint)}"
+        if self.limiter:
+            self.limiter.acquire()
+        status = None
+        started = time.perf_counter()
+        network_clock.enter()
+        try:
+            if delay is None:
+                response = self.session.request(method, url, **kwargs)
+            else:
+                response = self._hedged_request(method, url, delay, budget, limiter_key, kwargs)
+            status = response.status_code
+        finally:
+            network_clock.exit()
+            elapsed = time.perf_counter() - started
+            if self.limiter:
+                self.limiter.release(limiter_key, elapsed, status)
+        self.latency.record(method, endpoint, elapsed)
+        return response
+
+    def _hedged_request(self, method: str, url: str, delay: float, budget: RetryBudget,
+                        limiter_key: str, kwargs: dict) -> requests.Response:
+        """Send the request, plus a second copy if no answer arrives within delay; first success wins.
+
+        A 5xx response only wins if the other copy fails too. The second copy is only sent
+        when the retry budget and the limiter both have room for it right away, and it is
+        released to the limiter with its own outcome.
+        """
+        if self._hedge_executor is None:
+            with self._sessions_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(max_workers=self._hedge_workers,
+                                                              thread_name_prefix='hedge')
+
+        def send():
+            return self.session.request(method, url, **kwargs)
+
+        def send_hedge():
+            status = None
+            started = time.perf_counter()
+            try:
+                response = send()
+                status = response.status_code
+                return response
+            finally:
+                if self.limiter:
+                    self.limiter.release(limiter_key, time.perf_counter() - started, status)
+
+        primary = self._hedge_executor.submit(send)
+        wait([primary], timeout=delay)
+        if primary.done() or not budget.withdraw():
+            return primary.result()
+        if self.limiter and not self.limiter.try_acquire():
+            logger.debug(f"Not hedging {method} {url}: concurrency or rate limit reached")
+            return primary.result()
+
+        logger.info(f"Hedging {method} {url} after {delay * 1000:.0f}ms")
+        pending = {primary, self._hedge_executor.submit(send_hedge)}
+        winner = fallback = error = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                response = future.result()
+                if winner is None and response.status_code < 500:
+                    winner = response
+                elif winner is None and fallback is None:
+                    fallback = response
+                else:
+                    response.close()
+
+        # The slower copy cannot be cancelled mid-flight; release its connection when it lands
+        for future in pending:
+            future.add_done_callback(_close_response)
+        if winner is None:
+            if fallback is None:
+                raise error
+            return fallback
+        if fallback is not None:
+            fallback.close()
+        return winner
     
+    def decode_json(self, response: requests.Response):
+        """Decode a JSON body straight from the raw bytes with the configured codec"""
+        return self.json_codec.loads(response.content)
+
+    def latency_snapshot(self) -> dict:
+        """Latency percentiles per method and endpoint template"""
+        return self.latency.snapshot()
+
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         return self._make_request('GET', endpoint, **kwargs)
     
@@ -45,10 +260,17 @@ class BaseAPIClient:
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         return self._make_request('DELETE', endpoint, **kwargs)
 
-    def ping_health_check(self) -> bool:
-        """Health check endpoint"""
+    def ping_health_check(self, timeout: float = None) -> bool:
+        """Health check endpoint; with a timeout the probe is a single attempt bounded by it"""
+        kwargs = {'timeout': timeout, 'retry': False} if timeout else {}
         try:
-            response = self._make_request('GET', '/ping')
+            response = self._make_request('GET', '/ping', **kwargs)
             return response.status_code == 201
-        except:
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Health check failed: {e}")
             return False
+
+
+def _close_response(future):
+    if future.exception() is None:
+        future.result().close()
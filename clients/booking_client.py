@@ -1,20 +1,63 @@
-from typing import List, Optional, Dict, Any
+import threading
+from array import array
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Set, Tuple, Union
 from clients.base_client import BaseAPIClient
+from clients.cassette import Cassette
+from clients.circuit_breaker import CircuitBreaker
+from clients.in_memory_transport import InMemoryBookerAdapter
+from clients.limiter import RequestLimiter
+from clients.retry import HedgePolicy, RetryPolicy
 from config.environments import Config
-from models.booking import Booking, BookingResponse, AuthRequest, AuthResponse, BookingDates
+from models.booking import Booking, BookingResponse, AuthRequest, AuthResponse, BookingDates, BulkItemResult
+from utils.cache import LRUCache
+from utils.concurrency import ConcurrencyUtils
+from utils.json_stream import iter_int_field
+from utils.token_cache import TokenCache
 from datetime import date
 
 
 class BookingAPIClient(BaseAPIClient):
+    DEFAULT_BULK_WORKERS = 8
 
-    def __init__(self, config: Config = None, timeout: int = 30):
+    # Booking ids deleted through any client of a backend, keyed by base URL
+    _deleted_registry: Dict[str, Set[int]] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, config: Config = None, timeout: float = None,
+                 cache_size: int = 0, cache_ttl: float = 30.0, **http_settings):
         if not config:
             config = Config()
 
         base_url = Config.get_base_url()
-        super().__init__(base_url, timeout)
+        settings = Config.get_http_settings()
+        if timeout is not None:
+            settings['timeout'] = timeout
+        retry_settings = Config.get_retry_settings()
+        hedge_delay = retry_settings.pop('hedge_delay')
+        settings['retry_policy'] = RetryPolicy(**retry_settings)
+        settings['hedge_policy'] = HedgePolicy(hedge_delay) if hedge_delay is not None else None
+        settings['limiter'] = RequestLimiter.shared(base_url, **Config.get_limiter_settings())
+        health_settings = Config.get_health_settings()
+        settings['circuit_breaker'] = CircuitBreaker.shared(base_url, health_settings['failure_threshold'],
+                                                            health_settings['reset_timeout'])
+        settings.update(http_settings)
+        super().__init__(base_url, **settings)
+        if Config.get_transport() == 'memory':
+            self.mount(base_url, InMemoryBookerAdapter())
+        cassette_settings = Config.get_cassette_settings()
+        if cassette_settings['mode']:
+            self.use_cassette(Cassette.shared(cassette_settings['path'], cassette_settings['mode']),
+                              cassette_settings['mode'])
         self.config = config
         self._auth_token = None
+        credentials = Config.get_auth_credentials()
+        self.token_cache = TokenCache.shared(f"{base_url}|{credentials['username']}",
+                                             **Config.get_token_cache_settings())
+        # Opt-in read cache of parsed bookings, kept coherent with writes made through this client
+        self.cache: Optional[LRUCache[Booking]] = LRUCache(cache_size, cache_ttl) if cache_size else None
+        # Bookings deleted through any client in this process, so cleanup does not send a second DELETE
+        with self._registry_lock:
+            self.deleted_booking_ids: Set[int] = self._deleted_registry.setdefault(base_url, set())
 
     def get_auth_token(self, username: str, password: str) -> str:
         """Get authentication token"""
@@ -22,7 +65,7 @@ class BookingAPIClient(BaseAPIClient):
         response = self._make_request('POST', '/auth', json=auth_request.to_dict())
 
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = self.decode_json(response)
             if 'token' not in response_data:
                 raise Exception(f"Authentication failed: No token in response")
             self._auth_token = response_data['token']
@@ -30,17 +73,31 @@ class BookingAPIClient(BaseAPIClient):
         else:
             raise Exception(f"Authentication failed: {response.status_code} - {response.text}")
 
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers, obtaining token if needed"""
-        if not self._auth_token:
-            credentials = Config.get_auth_credentials()
-            self.get_auth_token(credentials['username'], credentials['password'])
+    def _fetch_auth_token(self) -> str:
+        credentials = Config.get_auth_credentials()
+        return self.get_auth_token(credentials['username'], credentials['password'])
+
+    def _get_auth_headers(self, token: str = None) -> Dict[str, str]:
+        """Get authentication headers, taking the token from the shared cache if not given"""
+        if token is None:
+            token = self.token_cache.get(self._fetch_auth_token)
+        self._auth_token = token
 
         return {
-            'Cookie': f'token={self._auth_token}',
-            'Authorization': f'Basic {self._auth_token}'
+            'Cookie': f'token={token}',
+            'Authorization': f'Basic {token}'
         }
 
+    def _make_authenticated_request(self, method: str, endpoint: str, **kwargs):
+        """Send with auth headers, refreshing the token once if the server answers 403"""
+        token = self.token_cache.get(self._fetch_auth_token)
+        response = self._make_request(method, endpoint, headers=self._get_auth_headers(token), **kwargs)
+
+        if response.status_code == 403:
+            self.token_cache.invalidate(token)
+            response = self._make_request(method, endpoint, headers=self._get_auth_headers(), **kwargs)
+        return response
+
     def get_all_booking_ids(self) -> List[int]:
         """Get all booking IDs"""
         return self.get_booking_ids()
@@ -55,10 +112,36 @@ class BookingAPIClient(BaseAPIClient):
         response = self._make_request('GET', '/booking', params=params)
 
         if response.status_code == 200:
-            return [booking['bookingid'] for booking in response.json()]
+            return [booking['bookingid'] for booking in self.decode_json(response)]
         else:
             raise Exception(f"Failed to get booking IDs: {response.status_code} - {response.text}")
 
+    def iter_booking_ids(self, firstname: Optional[str] = None,
+                         lastname: Optional[str] = None,
+                         checkin: Optional[str] = None,
+                         checkout: Optional[str] = None,
+                         chunk_size: int = 64 * 1024) -> Iterator[int]:
+        """Stream booking IDs with optional filters, yielding them as the body arrives"""
+        params = {k: v for k, v in (('firstname', firstname), ('lastname', lastname),
+                                    ('checkin', checkin), ('checkout', checkout)) if v is not None}
+        response = self._make_request('GET', '/booking', params=params, stream=True)
+
+        try:
+            if response.status_code != 200:
+                raise Exception(f"Failed to get booking IDs: {response.status_code} - {response.text}")
+            yield from iter_int_field(response.iter_content(chunk_size), 'bookingid')
+        finally:
+            response.close()
+
+    def collect_booking_ids(self, into: str = 'array', **filters) -> Union[array, Set[int]]:
+        """Collect streamed booking IDs into a compact array('I') or a set"""
+        ids = self.iter_booking_ids(**filters)
+        if into == 'array':
+            return array('I', ids)
+        if into == 'set':
+            return set(ids)
+        raise ValueError(f"Unknown collection type: {into}. Available: ['array', 'set']")
+
     def filter_bookings_by_name(self, firstname: str = None, lastname: str = None) -> List[int]:
         """Filter bookings by name (legacy method)"""
         return self.get_booking_ids(firstname=firstname, lastname=lastname)
@@ -67,64 +150,102 @@ class BookingAPIClient(BaseAPIClient):
         """Filter bookings by check-in/check-out dates"""
         return self.get_booking_ids(checkin=checkin, checkout=checkout)
 
-    def get_booking_by_id(self, booking_id: int) -> Booking:
-        """Get booking by ID"""
+    def cache_stats(self) -> Dict[str, float]:
+        """Hit/miss counters of the booking read cache (empty when caching is off)"""
+        return self.cache.stats() if self.cache else {}
+
+    def get_booking_by_id(self, booking_id: int, use_cache: bool = True) -> Booking:
+        """Get booking by ID, served from the read cache when enabled.
+
+        Cached bookings are returned as copies, so a caller mutating one cannot
+        change what later reads see. use_cache=False always asks the server; the
+        fresh booking still refills the cache.
+        """
+        if self.cache:
+            cached = self.cache.get(booking_id) if use_cache else None
+            if cached is not None:
+                return cached.copy()
+            version = self.cache.version(booking_id)
+
         response = self._make_request('GET', f'/booking/{booking_id}')
 
         if response.status_code == 200:
-            return Booking.from_dict(response.json())
+            booking = Booking.from_dict(self.decode_json(response))
+            if self.cache:
+                self.cache.fill(booking_id, booking.copy(), version)
+            return booking
         else:
             raise Exception(f"Failed to get booking {booking_id}: {response.status_code} - {response.text}")
 
+    def booking_exists(self, booking_id: int) -> bool:
+        """Check whether a booking exists without parsing it"""
+        response = self._make_request('GET', f'/booking/{booking_id}')
+
+        if response.status_code in [200, 404]:
+            return response.status_code == 200
+        raise Exception(f"Failed to check booking {booking_id}: {response.status_code} - {response.text}")
+
     def create_booking(self, booking_data: Dict[str, Any]) -> BookingResponse:
         """Create a new booking"""
         response = self._make_request('POST', '/booking', json=booking_data)
 
         if response.status_code == 200:
-            data = response.json()
+            data = self.decode_json(response)
             booking = Booking.from_dict(data['booking'])
+            # A server that reuses ids must not have its new booking skipped by cleanup
+            self.deleted_booking_ids.discard(data['bookingid'])
             return BookingResponse(bookingid=data['bookingid'], booking=booking)
         else:
             raise Exception(f"Failed to create booking: {response.status_code} - {response.text}")
 
     def update_booking(self, booking_id: int, booking_data: Dict[str, Any]) -> Booking:
         """Update existing booking"""
-        headers = self._get_auth_headers()
-
-        response = self._make_request('PUT', f'/booking/{booking_id}',
-                                    json=booking_data, headers=headers)
-
-        if response.status_code == 200:
-            return Booking.from_dict(response.json())
-        else:
-            raise Exception(f"Failed to update booking {booking_id}: {response.status_code} - {response.text}")
+        return self._write('PUT', booking_id, booking_data, "update")
 
     def partial_update_booking(self, booking_id: int, updates: Dict[str, Any]) -> Booking:
         """Partially update existing booking"""
-        headers = self._get_auth_headers()
-
-        response = self._make_request('PATCH', f'/booking/{booking_id}',
-                                    json=updates, headers=headers)
-
-        if response.status_code == 200:
-            return Booking.from_dict(response.json())
-        else:
-            raise Exception(f"Failed to partially update booking {booking_id}: {response.status_code} - {response.text}")
+        return self._write('PATCH', booking_id, updates, "partially update")
 
     def delete_booking(self, booking_id: int) -> bool:
         """Delete booking"""
-        headers = self._get_auth_headers()
+        try:
+            response = self._make_authenticated_request('DELETE', f'/booking/{booking_id}')
+        finally:
+            self._invalidate(booking_id)
+
+        deleted = response.status_code in [200, 201, 204]
+        if deleted:
+            self.deleted_booking_ids.add(booking_id)
+        return deleted
+
+    def _write(self, method: str, booking_id: int, payload: Dict[str, Any], action: str) -> Booking:
+        """PUT or PATCH a booking; any outcome but a parsed 200 drops the cached copy"""
+        try:
+            response = self._make_authenticated_request(method, f'/booking/{booking_id}', json=payload)
+            if response.status_code == 200:
+                return self._write_through(booking_id, Booking.from_dict(self.decode_json(response)))
+        except BaseException:
+            # A timeout can arrive after the server already applied the write
+            self._invalidate(booking_id)
+            raise
+        self._invalidate(booking_id)
+        raise Exception(f"Failed to {action} booking {booking_id}: {response.status_code} - {response.text}")
 
-        response = self._make_request('DELETE', f'/booking/{booking_id}', headers=headers)
+    def _write_through(self, booking_id: int, booking: Booking) -> Booking:
+        if self.cache:
+            self.cache.put(booking_id, booking.copy())
+        return booking
 
-        return response.status_code in [200, 201, 204]
+    def _invalidate(self, booking_id: int):
+        if self.cache:
+            self.cache.invalidate(booking_id)
 
     def update_booking_without_auth(self, booking_id: int, booking_data: Dict[str, Any]) -> Booking:
         """Update booking without authentication (for negative testing)"""
         response = self._make_request('PUT', f'/booking/{booking_id}', json=booking_data)
 
         if response.status_code == 200:
-            return Booking.from_dict(response.json())
+            return self._write_through(booking_id, Booking.from_dict(self.decode_json(response)))
         else:
             raise Exception(f"Failed to update booking {booking_id}: {response.status_code} - {response.text}")
 
@@ -133,6 +254,36 @@ class BookingAPIClient(BaseAPIClient):
         response = self._make_request('DELETE', f'/booking/{booking_id}')
 
         if response.status_code in [200, 201, 204]:
+            self._invalidate(booking_id)
             return True
         else:
             raise Exception(f"Failed to delete booking {booking_id}: {response.status_code} - {response.text}")
+
+    def _run_bulk(self, func, items, max_workers: Optional[int]) -> List[BulkItemResult]:
+        return ConcurrencyUtils.run_bounded(func, items, max_workers or self.DEFAULT_BULK_WORKERS)
+
+    def create_bookings(self, payloads: Iterable[Dict[str, Any]],
+                        max_workers: Optional[int] = None) -> List[BulkItemResult]:
+        """Create many bookings in parallel; results are in input order with per-item errors"""
+        return self._run_bulk(self.create_booking, payloads, max_workers)
+
+    def get_bookings(self, booking_ids: Iterable[int], max_workers: Optional[int] = None,
+                     use_cache: bool = True) -> List[BulkItemResult]:
+        """Fetch many bookings in parallel; results are in input order with per-item errors"""
+        return self._run_bulk(lambda booking_id: self.get_booking_by_id(booking_id, use_cache),
+                              booking_ids, max_workers)
+
+    def update_bookings(self, updates: Iterable[Tuple[int, Dict[str, Any]]],
+                        max_workers: Optional[int] = None) -> List[BulkItemResult]:
+        """Update many (booking_id, booking_data) pairs in parallel; results are in input order"""
+        return self._run_bulk(lambda update: self.update_booking(*update), updates, max_workers)
+
+    def delete_bookings(self, booking_ids: Iterable[int],
+                        max_workers: Optional[int] = None) -> List[BulkItemResult]:
+        """Delete many bookings in parallel; a rejected delete is reported as that item's error"""
+        def _delete(booking_id):
+            if not self.delete_booking(booking_id):
+                raise Exception(f"Failed to delete booking {booking_id}")
+            return True
+
+        return self._run_bulk(_delete, booking_ids, max_workers)
@@ -0,0 +1,246 @@
+"""Record/replay of HTTP interactions through a cassette file"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+
+from clients.in_memory_transport import build_response
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """Replay found no recorded interaction for a request"""
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    """Match key: method, normalized path, sorted query parameters and a body hash"""
+    parts = urlsplit(url)
+    path = '/' + '/'.join(segment for segment in parts.path.split('/') if segment)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, str):
+        body = body.encode()
+    if body:
+        try:
+            # Hash canonical JSON so codec whitespace and key order do not matter
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode()
+        except ValueError:
+            pass
+    digest = hashlib.sha1(body).hexdigest()[:16] if body else '-'
+    return f"{method.upper()} {path}?{query} {digest}"
+
+
+def shard_path(path: str, worker: str) -> str:
+    """Per-worker cassette path, e.g. cassettes/prod.gw0.jsonl.gz for cassettes/prod.jsonl.gz"""
+    if path.endswith('.jsonl.gz'):
+        return f"{path[:-len('.jsonl.gz')]}.{worker}.jsonl.gz"
+    return f"{path}.{worker}"
+
+
+class Cassette:
+    """Interactions grouped by request key in a gzip JSON-lines file.
+
+    The first line is a header holding run metadata; each further line is one
+    interaction. Loading builds a key -> interactions index, so replay lookups are a
+    dict access. Repeated requests with the same key replay their recorded responses
+    in order, and the last one keeps repeating once they run out.
+
+    Each interaction also records the scope (test node id or session fixture) active
+    when it was made. Replay looks in the current scope first, so a test replays its own
+    responses no matter which other tests ran before it, and falls back to the whole
+    cassette for requests made outside their recorded scope.
+    """
+
+    _shared: Dict[str, 'Cassette'] = {}
+    _shared_lock = threading.Lock()
+    # Tests run one at a time per process, so a single process-wide scope is enough
+    scope: Optional[str] = None
+
+    def __init__(self, path: str, metadata: Dict[str, Any] = None):
+        self.path = path
+        self.metadata = metadata or {}
+        self._interactions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._scoped: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+        self._cursors: Dict[Any, int] = defaultdict(int)
+        self._recorded = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def set_scope(cls, scope: Optional[str]) -> Optional[str]:
+        """Make `scope` current for recording and replay; returns the previous scope"""
+        previous, cls.scope = cls.scope, scope
+        return previous
+
+    @classmethod
+    def shared(cls, path: str, mode: str) -> 'Cassette':
+        """Process-wide cassette per path, loaded from disk for replay"""
+        with cls._shared_lock:
+            cassette = cls._shared.get(path)
+            if cassette is None:
+                cassette = cls.load(path) if mode == 'replay' else cls(path)
+                cls._shared[path] = cassette
+            return cassette
+
+    @classmethod
+    def save_all(cls):
+        with cls._shared_lock:
+            for cassette in cls._shared.values():
+                if cassette._recorded:
+                    cassette.save()
+
+    @classmethod
+    def read_metadata(cls, path: str) -> Dict[str, Any]:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.loads(f.readline()).get('metadata', {})
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('version') != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version in {path}: {header.get('version')}")
+            cassette = cls(path, header.get('metadata'))
+            for line in f:
+                interaction = json.loads(line)
+                cassette._add(interaction.pop('key'), interaction)
+        logger.info(f"Loaded cassette {path} with {len(cassette)} interactions")
+        return cassette
+
+    @classmethod
+    def merge(cls, path: str, shard_paths: List[str], metadata: Dict[str, Any] = None) -> 'Cassette':
+        """Combine per-worker cassettes into one at path and remove the shards"""
+        merged = cls(path, metadata)
+        for shard in shard_paths:
+            for key, entries in cls.load(shard)._interactions.items():
+                for interaction in entries:
+                    merged._add(key, interaction)
+        merged.save()
+        for shard in shard_paths:
+            os.remove(shard)
+        return merged
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._interactions.values())
+
+    def replay(self, key: str):
+        """(status, headers, body bytes) of the next recorded response for key"""
+        interaction = self.play(key)
+        if interaction is None:
+            raise CassetteMissError(f"No recorded interaction for {key} in {self.path}")
+        content = (base64.b64decode(interaction['body_b64']) if 'body_b64' in interaction
+                   else interaction['body'].encode('utf-8'))
+        return interaction['status'], interaction['headers'], content
+
+    def record(self, key: str, status: int, headers: Dict[str, str], content: bytes):
+        interaction = {'status': status, 'headers': headers}
+        try:
+            interaction['body'] = content.decode('utf-8')
+        except UnicodeDecodeError:
+            interaction['body_b64'] = base64.b64encode(content).decode('ascii')
+        if self.scope is not None:
+            interaction['scope'] = self.scope
+        with self._lock:
+            self._add(key, interaction)
+            self._recorded += 1
+
+    def play(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            index = (self.scope, key)
+            entries = self._scoped.get(index)
+            if not entries:
+                index, entries = key, self._interactions.get(key)
+            if not entries:
+                return None
+            cursor = self._cursors[index]
+            self._cursors[index] = cursor + 1
+            return entries[min(cursor, len(entries) - 1)]
+
+    def _add(self, key: str, interaction: Dict[str, Any]):
+        self._interactions[key].append(interaction)
+        if interaction.get('scope') is not None:
+            self._scoped[(interaction['scope'], key)].append(interaction)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock, gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION, 'metadata': self.metadata}) + '\n')
+            for key, entries in self._interactions.items():
+                for interaction in entries:
+                    f.write(json.dumps({'key': key, **interaction}, separators=(',', ':')) + '\n')
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved cassette {self.path} with {len(self)} interactions")
+
+
+class CassetteAdapter(BaseAdapter):
+    """Records responses from an inner adapter, or replays them with no network at all"""
+
+    def __init__(self, cassette: Cassette, mode: str, inner: BaseAdapter = None):
+        super().__init__()
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode: {mode}. Available: ['record', 'replay']")
+        if mode == 'record' and inner is None:
+            raise ValueError("Recording needs an inner adapter to send requests through")
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = request_key(request.method, request.url, request.body)
+
+        if self.mode == 'replay':
+            status, headers, content = self.cassette.replay(key)
+            return build_response(request, status, headers, content, self)
+
+        response = self.inner.send(request, stream=False, timeout=timeout, verify=verify,
+                                   cert=cert, proxies=proxies)
+        headers = {'Content-Type': response.headers.get('Content-Type', '')}
+        self.cassette.record(key, response.status_code, headers, response.content)
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """httpx counterpart of CassetteAdapter for AsyncBookingAPIClient"""
+
+    def __init__(self, cassette: Cassette, mode: str, inner: httpx.AsyncBaseTransport = None):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode: {mode}. Available: ['record', 'replay']")
+        if mode == 'record' and inner is None:
+            raise ValueError("Recording needs an inner transport to send requests through")
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, str(request.url), await request.aread())
+
+        if self.mode == 'replay':
+            status, headers, content = self.cassette.replay(key)
+            return httpx.Response(status, headers=headers, content=content)
+
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        headers = {'Content-Type': response.headers.get('Content-Type', '')}
+        self.cassette.record(key, response.status_code, headers, content)
+        return httpx.Response(response.status_code, headers=response.headers, content=content)
+
+    async def aclose(self):
+        if self.inner is not None:
+            await self.inner.aclose()
@@ -0,0 +1,98 @@
+"""Circuit breaker that fails requests fast once the backend is known to be down"""
+
+import logging
+import threading
+import time
+from typing import Dict
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Responses meaning the backend (or its gateway) is down, as opposed to rejecting the request
+FAILURE_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Closed -> open after `failure_threshold` consecutive failures (or an explicit trip).
+
+    While open every request fails immediately with CircuitOpenError. After
+    `reset_timeout` seconds one probe request is let through (half-open); its
+    success closes the circuit and its failure opens it again. A probe that ends
+    in any other error is released, so the next request becomes the probe.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+    _registry: Dict[str, 'CircuitBreaker'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.reason = None
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> 'CircuitBreaker':
+        """Process-wide breaker for one key (base URL), so every client sees the same state"""
+        with cls._registry_lock:
+            breaker = cls._registry.get(key)
+            if breaker is None:
+                breaker = cls._registry[key] = cls(failure_threshold, reset_timeout)
+            return breaker
+
+    def before_request(self) -> bool:
+        """Raise CircuitOpenError unless a request may be sent now; True when it is the half-open probe"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            raise CircuitOpenError(f"Circuit open: {self.reason}")
+
+    def release_probe(self):
+        """Let another probe through after one that ended without a success or failure being recorded"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Circuit closed: backend is answering again")
+            self.state = self.CLOSED
+            self.reason = None
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self, reason: str):
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open(reason)
+
+    def trip(self, reason: str):
+        """Open the circuit now, e.g. after a failed health check"""
+        with self._lock:
+            self._open(reason)
+
+    def _open(self, reason: str):
+        if self.state != self.OPEN:
+            logger.warning(f"Circuit opened for {self.reset_timeout:.0f}s: {reason}")
+        self.state = self.OPEN
+        self.reason = reason
+        self._opened_at = time.monotonic()
+        self._probing = False
@@ -0,0 +1,223 @@
+"""In-process Restful Booker stand-in, mountable on BaseAPIClient.session"""
+
+import io
+import json
+import secrets
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from config.environments import Config
+from utils.booking_index import BookingIndex
+
+BOOKING_FIELDS = ('firstname', 'lastname', 'totalprice', 'depositpaid', 'bookingdates')
+
+REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 403: 'Forbidden',
+           404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+def build_response(request, status: int, headers: Dict[str, str], content: bytes,
+                   connection: BaseAdapter) -> Response:
+    """requests.Response for a body held in memory, streamable through iter_content"""
+    response = Response()
+    response.status_code = status
+    response.reason = REASONS.get(status, '')
+    response.headers = CaseInsensitiveDict(headers)
+    response.headers['Content-Length'] = str(len(content))
+    response.raw = io.BytesIO(content)
+    response.encoding = 'utf-8'
+    response.url = request.url
+    response.request = request
+    response.connection = connection
+    return response
+
+
+class RestfulBookerStandIn:
+    """Implements /auth, /booking, /booking/{id} and /ping against an indexed in-memory store"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, seed_bookings: int = 10):
+        self.store = BookingIndex()
+        self._tokens = set()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self.seed(seed_bookings)
+
+    @classmethod
+    def shared(cls) -> 'RestfulBookerStandIn':
+        """Process-wide instance so every client in a test run sees the same bookings"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def seed(self, count: int):
+        """Load count generated bookings, bulk-sorting the indexes once"""
+        bookings = []
+        with self._lock:
+            for n in range(count):
+                booking_id = self._next_id
+                self._next_id += 1
+                bookings.append((booking_id, {
+                    'firstname': f"Seed{n % 1000}",
+                    'lastname': f"Guest{n % 997}",
+                    'totalprice': 100 + n % 500,
+                    'depositpaid': n % 2 == 0,
+                    'bookingdates': {
+                        'checkin': f"{2018 + n % 8}-{1 + n % 12:02d}-{1 + n % 28:02d}",
+                        'checkout': f"{2018 + n % 8}-{1 + n % 12:02d}-{1 + (n + 3) % 28:02d}",
+                    },
+                    'additionalneeds': 'Breakfast',
+                }))
+        self.store.put_many(bookings)
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers,
+               body: Optional[bytes]) -> Tuple[int, str, bytes]:
+        """Route one request; returns (status, content type, body bytes)"""
+        parts = [part for part in path.split('/') if part]
+        try:
+            if parts == ['ping'] and method == 'GET':
+                return self._text(201)
+            if parts == ['auth'] and method == 'POST':
+                return self._auth(self._load(body))
+            if parts == ['booking']:
+                if method == 'GET':
+                    return self._list(query)
+                if method == 'POST':
+                    return self._create(self._load(body))
+            if len(parts) == 2 and parts[0] == 'booking' and parts[1].isdigit():
+                booking_id = int(parts[1])
+                if method == 'GET':
+                    return self._get(booking_id)
+                if not self._authorized(headers):
+                    return self._text(403)
+                if method == 'PUT':
+                    return self._update(booking_id, self._load(body))
+                if method == 'PATCH':
+                    return self._patch(booking_id, self._load(body))
+                if method == 'DELETE':
+                    return self._text(201) if self.store.remove(booking_id) else self._text(405)
+            return self._text(404)
+        except (ValueError, KeyError, TypeError):
+            return self._text(500)
+
+    def _auth(self, data: Dict[str, Any]):
+        credentials = Config.get_auth_credentials()
+        if (data.get('username') == credentials['username']
+                and data.get('password') == credentials['password']):
+            token = secrets.token_hex(8)[:15]
+            with self._lock:
+                self._tokens.add(token)
+            return self._json(200, {'token': token})
+        return self._json(200, {'reason': 'Bad credentials'})
+
+    def _authorized(self, headers) -> bool:
+        cookie = headers.get('Cookie') or ''
+        for part in cookie.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == 'token' and value in self._tokens:
+                return True
+        return headers.get('Authorization') == 'Basic YWRtaW46cGFzc3dvcmQxMjM='
+
+    def _list(self, query: Dict[str, str]):
+        filters = {name: query.get(name) or None for name in ('firstname', 'lastname', 'checkin', 'checkout')}
+        return self._json(200, [{'bookingid': booking_id} for booking_id in self.store.query(**filters)])
+
+    def _get(self, booking_id: int):
+        booking = self.store.get(booking_id)
+        return self._json(200, booking) if booking is not None else self._text(404)
+
+    def _create(self, data: Dict[str, Any]):
+        booking = self._validated(data)
+        with self._lock:
+            booking_id = self._next_id
+            self._next_id += 1
+        self.store.put(booking_id, booking)
+        return self._json(200, {'bookingid': booking_id, 'booking': booking})
+
+    def _update(self, booking_id: int, data: Dict[str, Any]):
+        if booking_id not in self.store:
+            return self._text(405)
+        try:
+            booking = self._validated(data)
+        except (KeyError, TypeError):
+            return self._text(400)
+        self.store.put(booking_id, booking)
+        return self._json(200, booking)
+
+    def _patch(self, booking_id: int, updates: Dict[str, Any]):
+        current = self.store.get(booking_id)
+        if current is None:
+            return self._text(405)
+        booking = dict(current)
+        for key, value in updates.items():
+            if key == 'bookingdates' and isinstance(value, dict):
+                booking['bookingdates'] = {**current['bookingdates'], **value}
+            elif key in BOOKING_FIELDS or key == 'additionalneeds':
+                booking[key] = value
+        self.store.put(booking_id, booking)
+        return self._json(200, booking)
+
+    @staticmethod
+    def _validated(data: Dict[str, Any]) -> Dict[str, Any]:
+        booking = {field: data[field] for field in BOOKING_FIELDS}
+        booking['bookingdates'] = {'checkin': data['bookingdates']['checkin'],
+                                   'checkout': data['bookingdates']['checkout']}
+        if 'additionalneeds' in data:
+            booking['additionalneeds'] = data['additionalneeds']
+        return booking
+
+    @staticmethod
+    def _load(body: Optional[bytes]) -> Dict[str, Any]:
+        data = json.loads(body) if body else {}
+        if not isinstance(data, dict):
+            raise TypeError("Expected a JSON object")
+        return data
+
+    @staticmethod
+    def _json(status: int, payload) -> Tuple[int, str, bytes]:
+        return status, 'application/json; charset=utf-8', json.dumps(payload).encode()
+
+    @staticmethod
+    def _text(status: int) -> Tuple[int, str, bytes]:
+        return status, 'text/plain; charset=utf-8', REASONS[status].encode()
+
+
+class InMemoryBookerAdapter(BaseAdapter):
+    """requests transport adapter that answers from a RestfulBookerStandIn"""
+
+    def __init__(self, app: RestfulBookerStandIn = None):
+        super().__init__()
+        self.app = app or RestfulBookerStandIn.shared()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        status, content_type, content = self.app.handle(
+            request.method, url.path, dict(parse_qsl(url.query, keep_blank_values=True)),
+            request.headers, body)
+
+        return build_response(request, status, {'Content-Type': content_type}, content, self)
+
+    def close(self):
+        pass
+
+
+class InMemoryBookerTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers from a RestfulBookerStandIn, for AsyncBookingAPIClient"""
+
+    def __init__(self, app: RestfulBookerStandIn = None):
+        self.app = app or RestfulBookerStandIn.shared()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        status, content_type, content = self.app.handle(
+            request.method, request.url.path, dict(request.url.params), request.headers, body)
+        return httpx.Response(status, headers={'Content-Type': content_type}, content=content)
@@ -0,0 +1,173 @@
+"""Client-side load control: AIMD concurrency limit and token-bucket rate cap"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Caps the request rate at `rate` per second with bursts of up to `burst` requests"""
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available now, without waiting"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class AIMDLimiter:
+    """Concurrency limit that grows additively and shrinks multiplicatively.
+
+    Each successful response raises the limit by 1/limit (about +1 per round trip of
+    the whole window). A 429/503, a connection error or a latency above
+    `latency_tolerance` times the smoothed latency of that endpoint cuts the limit by
+    `backoff_ratio`, at most once per window: responses to requests sent before the
+    last cut do not cut again.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 32,
+                 backoff_ratio: float = 0.5, latency_tolerance: float = 2.0,
+                 smoothing: float = 0.1, min_samples: int = 10):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._inflight = 0
+        self._last_cut = 0.0
+        self._baselines: Dict[str, list] = {}
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def acquire(self):
+        """Block until fewer than `limit` requests are in flight"""
+        with self._cond:
+            while self._inflight >= int(self._limit):
+                self._cond.wait()
+            self._inflight += 1
+
+    def try_acquire(self) -> bool:
+        """Take a slot if fewer than `limit` requests are in flight, without waiting"""
+        with self._cond:
+            if self._inflight >= int(self._limit):
+                return False
+            self._inflight += 1
+            return True
+
+    def cancel(self):
+        """Give back a slot that was never used for a request, without recording an outcome"""
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    def release(self, key: str, latency: float, status: Optional[int]):
+        """Record the outcome of one request; status is None when it raised"""
+        now = time.monotonic()
+        with self._cond:
+            self._inflight -= 1
+            if status is None or status in OVERLOAD_STATUSES or self._latency_jumped(key, latency):
+                if now - latency >= self._last_cut:
+                    self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                    self._last_cut = now
+                    logger.info(f"Concurrency limit cut to {self.limit} ({key}: status={status}, "
+                                f"{latency * 1000:.0f}ms)")
+            elif status < 500:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def _latency_jumped(self, key: str, latency: float) -> bool:
+        baseline = self._baselines.get(key)
+        if baseline is None:
+            self._baselines[key] = [latency, 1]
+            return False
+        average, samples = baseline
+        # Jumps are still blended in, so a lasting shift becomes the new baseline within a few samples
+        baseline[0] = average + self.smoothing * (latency - average)
+        baseline[1] = samples + 1
+        return samples >= self.min_samples and latency > self.latency_tolerance * average
+
+
+class RequestLimiter:
+    """AIMD concurrency limit plus rate cap, shared by every client talking to one backend"""
+
+    _registry: Dict[str, 'RequestLimiter'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, concurrency: AIMDLimiter = None, rate: TokenBucket = None):
+        self.concurrency = concurrency
+        self.rate = rate
+
+    @classmethod
+    def shared(cls, key: str, initial_concurrency: int = 4, max_concurrency: int = 0,
+               rate_limit: float = 0.0) -> 'RequestLimiter':
+        """Process-wide limiter for one key (base URL); a 0 setting disables that control"""
+        with cls._registry_lock:
+            limiter = cls._registry.get(key)
+            if limiter is None:
+                limiter = cls._registry[key] = cls(
+                    AIMDLimiter(initial_concurrency, max_limit=max_concurrency) if max_concurrency else None,
+                    TokenBucket(rate_limit) if rate_limit else None)
+            return limiter
+
+    @property
+    def enabled(self) -> bool:
+        return self.concurrency is not None or self.rate is not None
+
+    def acquire(self):
+        if self.concurrency:
+            self.concurrency.acquire()
+        if self.rate:
+            self.rate.acquire()
+
+    def try_acquire(self) -> bool:
+        """Admit one request only if neither control would make it wait, e.g. for an optional hedge"""
+        if self.concurrency and not self.concurrency.try_acquire():
+            return False
+        if self.rate and not self.rate.try_acquire():
+            if self.concurrency:
+                self.concurrency.cancel()
+            return False
+        return True
+
+    def release(self, key: str, latency: float, status: Optional[int]):
+        if self.concurrency:
+            self.concurrency.release(key, latency, status)
@@ -0,0 +1,82 @@
+"""Retry and hedging policies used by BaseAPIClient._make_request"""
+
+import random
+import threading
+from typing import Optional, Union
+
+from utils.metrics import LatencyHistogram
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """Token bucket limiting retries and hedges to a fraction of regular traffic.
+
+    Every first attempt deposits `ratio` tokens and every retry or hedge spends one,
+    so during an outage extra load stays around `ratio` of normal load instead of
+    multiplying it. `reserve` tokens are available up front so a quiet client can
+    still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0, capacity: float = 100.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        """Take one token; False when the budget is exhausted"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for idempotent methods"""
+
+    def __init__(self, retries: int = 2, backoff: float = 0.2, backoff_max: float = 5.0,
+                 budget_ratio: float = 0.2, budget: RetryBudget = None):
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.budget = budget or RetryBudget(budget_ratio)
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Whether attempt number `attempt` (0 = first) may be followed by another one"""
+        return method.upper() in IDEMPOTENT_METHODS and attempt < self.retries
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before the retry that follows attempt `attempt`: uniform in [0, base * 2**attempt]"""
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+
+class HedgePolicy:
+    """When to send a second copy of a slow GET.
+
+    `delay` is a fixed number of seconds, or 'auto' to use the given percentile of the
+    endpoint's recorded latency once at least `min_samples` requests have been seen.
+    """
+
+    def __init__(self, delay: Union[float, str] = 'auto', percentile: float = 95, min_samples: int = 20):
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+
+    def delay_for(self, histogram: Optional[LatencyHistogram]) -> Optional[float]:
+        """Seconds to wait before hedging, or None when there is no basis to hedge yet"""
+        if self.delay != 'auto':
+            return float(self.delay)
+        if histogram is None or histogram.count < self.min_samples:
+            return None
+        return histogram.percentile(self.percentile)
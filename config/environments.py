@@ -4,13 +4,23 @@ import os
 class Config:
     ENVIRONMENTS = {
         'prod': {
-            'base_url': 'https://restful-booker.herokuapp.com'
+            'base_url': 'https://restful-booker.herokuapp.com',
+            'max_concurrency': 16,
+            'rate_limit': 20
         },
         'dev': {
-            'base_url': 'https://dev.restful-booker.herokuapp.com'
+            'base_url': 'https://dev.restful-booker.herokuapp.com',
+            'max_concurrency': 32,
+            'rate_limit': 50
         },
         'staging': {
-            'base_url': 'https://staging.restful-booker.herokuapp.com'
+            'base_url': 'https://staging.restful-booker.herokuapp.com',
+            'max_concurrency': 32,
+            'rate_limit': 50
+        },
+        'memory': {
+            'base_url': 'http://restful-booker.local',
+            'transport': 'memory'
         }
     }
     
@@ -22,6 +32,12 @@ class Config:
             raise ValueError(f"Unknown environment: {env}. Available: {list(cls.ENVIRONMENTS.keys())}")
         return cls.ENVIRONMENTS[env]['base_url']
     
+    @classmethod
+    def get_transport(cls) -> str:
+        """Get transport for current environment: 'http', or 'memory' for the in-process stand-in"""
+        cls.get_base_url()
+        return cls.ENVIRONMENTS[os.getenv('TEST_ENV', 'prod')].get('transport', 'http')
+
     @classmethod
     def get_auth_credentials(cls) -> dict:
         """Get authentication credentials"""
@@ -29,3 +45,96 @@ class Config:
             'username': os.getenv('API_USERNAME', 'admin'),
             'password': os.getenv('API_PASSWORD', 'password123')
         }
+
+    @classmethod
+    def get_http_settings(cls) -> dict:
+        """Get HTTP connection pool and timeout settings"""
+        return {
+            'timeout': float(os.getenv('HTTP_READ_TIMEOUT', '30')),
+            'connect_timeout': float(os.getenv('HTTP_CONNECT_TIMEOUT', '5')),
+            'pool_connections': int(os.getenv('HTTP_POOL_CONNECTIONS', '10')),
+            'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', '20')),
+            'pool_block': os.getenv('HTTP_POOL_BLOCK', 'false').lower() in ('1', 'true', 'yes')
+        }
+
+    @classmethod
+    def get_retry_settings(cls) -> dict:
+        """Get retry/hedging settings; hedge_delay is None (off), 'auto' (p95 latency) or seconds"""
+        hedge_delay = os.getenv('HTTP_HEDGE_DELAY') or None
+        if hedge_delay not in (None, 'auto'):
+            hedge_delay = float(hedge_delay)
+        return {
+            'retries': int(os.getenv('HTTP_RETRIES', '2')),
+            'backoff': float(os.getenv('HTTP_RETRY_BACKOFF', '0.2')),
+            'backoff_max': float(os.getenv('HTTP_RETRY_BACKOFF_MAX', '5')),
+            'budget_ratio': float(os.getenv('HTTP_RETRY_BUDGET', '0.2')),
+            'hedge_delay': hedge_delay
+        }
+
+    @classmethod
+    def get_limiter_settings(cls) -> dict:
+        """Get this process's share of the environment's concurrency and rate limits (0 = unlimited).
+
+        Defaults come from ENVIRONMENTS; under pytest-xdist they are split across workers.
+        Replaying a cassette sends nothing to the backend, so no limits apply.
+        """
+        cls.get_base_url()
+        environment = cls.ENVIRONMENTS[os.getenv('TEST_ENV', 'prod')]
+        max_concurrency = int(os.getenv('HTTP_MAX_CONCURRENCY', environment.get('max_concurrency', 0)))
+        rate_limit = float(os.getenv('HTTP_RATE_LIMIT', environment.get('rate_limit', 0)))
+        if cls.get_cassette_settings()['mode'] == 'replay':
+            max_concurrency, rate_limit = 0, 0.0
+
+        workers = int(os.getenv('PYTEST_XDIST_WORKER_COUNT', '1'))
+        return {
+            'initial_concurrency': int(os.getenv('HTTP_INITIAL_CONCURRENCY', '4')),
+            'max_concurrency': -(-max_concurrency // workers),
+            'rate_limit': rate_limit / workers
+        }
+
+    @classmethod
+    def get_health_settings(cls) -> dict:
+        """Get the session health gate and circuit breaker settings.
+
+        The gate is skipped when replaying a cassette, since no backend is contacted.
+        """
+        return {
+            'gate': os.getenv('HEALTH_GATE', 'true').lower() in ('1', 'true', 'yes')
+                    and cls.get_cassette_settings()['mode'] != 'replay',
+            'deadline': float(os.getenv('HEALTH_CHECK_DEADLINE', '3')),
+            'failure_threshold': int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5')),
+            'reset_timeout': float(os.getenv('CIRCUIT_RESET_TIMEOUT', '30'))
+        }
+
+    @classmethod
+    def get_cache_settings(cls) -> dict:
+        """Get booking read cache settings; a size of 0 disables the cache"""
+        return {
+            'cache_size': int(os.getenv('BOOKING_CACHE_SIZE', '0')),
+            'cache_ttl': float(os.getenv('BOOKING_CACHE_TTL', '30'))
+        }
+
+    @classmethod
+    def get_token_cache_settings(cls) -> dict:
+        """Get auth token cache settings.
+
+        The on-disk cache is skipped for the in-memory stand-in and while recording or
+        replaying a cassette: a token reused from an earlier run would keep POST /auth
+        out of the recording, and replay would then depend on what is left in the temp dir.
+        """
+        return {
+            'persist': os.getenv('AUTH_TOKEN_CACHE', 'true').lower() in ('1', 'true', 'yes')
+                       and cls.get_transport() != 'memory'
+                       and not os.getenv('BOOKER_CASSETTE_MODE'),
+            'ttl': float(os.getenv('AUTH_TOKEN_TTL', '600')),
+            'directory': os.getenv('AUTH_TOKEN_CACHE_DIR') or None
+        }
+
+    @classmethod
+    def get_cassette_settings(cls) -> dict:
+        """Get record/replay cassette settings; mode is None, 'record' or 'replay'"""
+        env = os.getenv('TEST_ENV', 'prod')
+        return {
+            'mode': os.getenv('BOOKER_CASSETTE_MODE') or None,
+            'path': os.getenv('BOOKER_CASSETTE', f'cassettes/{env}.jsonl.gz')
+        }
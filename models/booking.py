@@ -1,27 +1,67 @@
 from dataclasses import dataclass
-from typing import Optional
-from datetime import date
+from typing import Any, Optional, Union
+from datetime import date, datetime
+
 
-@dataclass
 class BookingDates:
-    checkin: date
-    checkout: date
-    
+    """Immutable check-in/check-out dates, kept as ISO strings and parsed on first access.
+
+    Raw strings are not validated, so a malformed date from the server only fails
+    when it is read as a date.
+    """
+
+    __slots__ = ('_checkin', '_checkout', '_checkin_raw', '_checkout_raw')
+
+    def __init__(self, checkin: Union[date, str], checkout: Union[date, str]):
+        self._checkin, self._checkin_raw = self._split('checkin', checkin)
+        self._checkout, self._checkout_raw = self._split('checkout', checkout)
+
+    @staticmethod
+    def _split(name: str, value: Union[date, str]):
+        """(parsed date or None, ISO string) for a date or an ISO string"""
+        if isinstance(value, str):
+            return None, value
+        if isinstance(value, datetime):
+            value = value.date()
+        if isinstance(value, date):
+            return value, value.isoformat()
+        raise TypeError(f"{name} must be a date or an ISO date string, got {type(value).__name__}: {value!r}")
+
+    @property
+    def checkin(self) -> date:
+        if self._checkin is None:
+            self._checkin = date.fromisoformat(self._checkin_raw)
+        return self._checkin
+
+    @property
+    def checkout(self) -> date:
+        if self._checkout is None:
+            self._checkout = date.fromisoformat(self._checkout_raw)
+        return self._checkout
+
     def to_dict(self):
         return {
-            'checkin': self.checkin.isoformat(),
-            'checkout': self.checkout.isoformat()
+            'checkin': self._checkin_raw,
+            'checkout': self._checkout_raw
         }
 
-@dataclass
-class Booking:
-    firstname: str
-    lastname: str
-    totalprice: int
-    depositpaid: bool
-    bookingdates: BookingDates
-    additionalneeds: Optional[str] = None
-    
+    def __eq__(self, other):
+        if not isinstance(other, BookingDates):
+            return NotImplemented
+        return (self._checkin_raw, self._checkout_raw) == (other._checkin_raw, other._checkout_raw)
+
+    def __hash__(self):
+        return hash((self._checkin_raw, self._checkout_raw))
+
+    def __repr__(self):
+        return f"BookingDates(checkin={self._checkin_raw!r}, checkout={self._checkout_raw!r})"
+
+
+class BookingBase:
+    """Serialization shared by the mutable and frozen booking models"""
+
+    __slots__ = ()
+
     def to_dict(self):
         return {
             'firstname': self.firstname,
@@ -31,22 +71,46 @@ class Booking:
             'bookingdates': self.bookingdates.to_dict(),
             'additionalneeds': self.additionalneeds
         }
-    
+
     @classmethod
     def from_dict(cls, data):
-        booking_dates = BookingDates(
-            checkin=date.fromisoformat(data['bookingdates']['checkin']),
-            checkout=date.fromisoformat(data['bookingdates']['checkout'])
-        )
+        dates = data['bookingdates']
         return cls(
-            firstname=data['firstname'],
-            lastname=data['lastname'],
-            totalprice=data['totalprice'],
-            depositpaid=data['depositpaid'],
-            bookingdates=booking_dates,
-            additionalneeds=data.get('additionalneeds')
+            data['firstname'],
+            data['lastname'],
+            data['totalprice'],
+            data['depositpaid'],
+            BookingDates(dates['checkin'], dates['checkout']),
+            data.get('additionalneeds')
         )
 
+    def copy(self):
+        """Independent copy; the immutable booking dates are shared"""
+        return type(self)(self.firstname, self.lastname, self.totalprice, self.depositpaid,
+                          self.bookingdates, self.additionalneeds)
+
+
+@dataclass(slots=True)
+class Booking(BookingBase):
+    firstname: str
+    lastname: str
+    totalprice: int
+    depositpaid: bool
+    bookingdates: BookingDates
+    additionalneeds: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenBooking(BookingBase):
+    """Immutable, hashable booking for holding large reconciliation sets"""
+    firstname: str
+    lastname: str
+    totalprice: int
+    depositpaid: bool
+    bookingdates: BookingDates
+    additionalneeds: Optional[str] = None
+
+
 @dataclass
 class BookingResponse:
     bookingid: int
@@ -66,3 +130,14 @@ class AuthRequest:
 @dataclass
 class AuthResponse:
     token: str
+
+
+@dataclass
+class BulkItemResult:
+    item: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
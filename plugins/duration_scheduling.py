@@ -0,0 +1,129 @@
+"""Duration-aware pytest-xdist scheduling.
+
+Every run records each test's duration (setup + call + teardown) in the pytest
+cache. With --dist-durations the controller hands work to xdist workers
+longest-first (LPT): whichever worker frees up next takes the longest unit left,
+which keeps one slow test from landing at the end of the run.
+
+Tests that use one of the fixtures listed in the `duration_group_fixtures` ini
+option (or carry an xdist_group mark) form a single unit, so an expensive
+session fixture such as the synced booking_mirror is built on one worker only.
+"""
+
+import logging
+from collections import OrderedDict, defaultdict
+from statistics import median
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "restful_booker/test_durations"
+DEFAULT_DURATION = 1.0
+# Weight of the latest run when blending it into the stored duration
+SMOOTHING = 0.5
+
+
+def base_nodeid(nodeid: str) -> str:
+    """Node id without the '@group' suffix added for grouped tests"""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+def pytest_addoption(parser):
+    parser.addoption("--dist-durations", action="store_true", default=False,
+                     help="Schedule xdist work longest-first using durations recorded by earlier runs")
+    parser.addini("duration_group_fixtures", type="linelist", default=["booking_mirror"],
+                  help="Fixtures whose tests are kept on one worker by --dist-durations")
+
+
+def _group_name(item, fixtures) -> str:
+    mark = item.get_closest_marker("xdist_group")
+    if mark:
+        return mark.args[0] if mark.args else mark.kwargs.get("name", "default")
+    for fixture in fixtures:
+        if fixture in item.fixturenames:
+            return fixture
+    return None
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    # Workers tag grouped tests the same way xdist's loadgroup does, so the scheduler sees the group
+    if not (hasattr(config, "workerinput") and config.getoption("dist_durations")):
+        return
+    fixtures = config.getini("duration_group_fixtures")
+    for item in items:
+        group = _group_name(item, fixtures)
+        if group and base_nodeid(item.nodeid) == item.nodeid:
+            item._nodeid = f"{item.nodeid}@{group}"
+
+
+class DurationStore:
+    """Per-test durations kept in the pytest cache, blended with each new run"""
+
+    def __init__(self, config):
+        self.cache = getattr(config, "cache", None)
+        self.durations = dict(self.cache.get(CACHE_KEY, {})) if self.cache else {}
+        # Tests never seen before are assumed to take the median known duration
+        self.fallback = median(self.durations.values()) if self.durations else DEFAULT_DURATION
+        self._observed = defaultdict(float)
+
+    def estimate(self, nodeid: str) -> float:
+        return self.durations.get(base_nodeid(nodeid), self.fallback)
+
+    def pytest_runtest_logreport(self, report):
+        self._observed[base_nodeid(report.nodeid)] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if self.cache is None or not self._observed:
+            return
+        for nodeid, duration in self._observed.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = duration if previous is None else (
+                SMOOTHING * duration + (1 - SMOOTHING) * previous)
+        self.fallback = median(self.durations.values())
+        self.cache.set(CACHE_KEY, {nodeid: round(duration, 4) for nodeid, duration in self.durations.items()})
+
+
+def pytest_configure(config):
+    # Reports from every worker reach the controller, so it alone records durations
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationStore(config), "duration_store")
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("dist_durations"):
+        return None
+    from xdist.scheduler import LoadScopeScheduling
+
+    class DurationScheduling(LoadScopeScheduling):
+        """Each test (or fixture group) is a unit; units are handed out longest-first"""
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self.store = config.pluginmanager.get_plugin("duration_store")
+            self._ordered = False
+
+        def _split_scope(self, nodeid):
+            if nodeid.rfind("@") > nodeid.rfind("]"):
+                return nodeid.rsplit("@", 1)[1]
+            return nodeid
+
+        def _unit_duration(self, work_unit) -> float:
+            return sum(self.store.estimate(nodeid) for nodeid in work_unit)
+
+        def _assign_work_unit(self, node):
+            if not self._ordered:
+                # The full work queue exists by the first assignment; order it once
+                self.workqueue = OrderedDict(sorted(self.workqueue.items(),
+                                                    key=lambda unit: -self._unit_duration(unit[1])))
+                self._ordered = True
+                longest = next(iter(self.workqueue.items()))
+                logger.info(f"Scheduling {len(self.workqueue)} units longest-first; longest is "
+                            f"{longest[0]} (~{self._unit_duration(longest[1]):.2f}s)")
+            super()._assign_work_unit(node)
+
+    return DurationScheduling(config, log)
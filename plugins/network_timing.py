@@ -0,0 +1,120 @@
+"""pytest plugin splitting each test phase into network time and local time.
+
+Network time is the wall time during which an API client request was in flight
+(see utils.metrics.network_clock); local time is everything else, e.g. fixture
+code, data generation and assertions. Each phase is attached to the test report
+as a user property, so the numbers survive the trip from xdist workers to the
+controller, which writes a JSON summary and adds columns to the HTML report.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from utils.metrics import network_clock
+
+logger = logging.getLogger(__name__)
+
+PROPERTY_NAME = "network_timing"
+PHASES = ("setup", "call", "teardown")
+
+
+def _timed_phase(item, when):
+    started = time.perf_counter()
+    network_started = network_clock.elapsed()
+    yield
+    wall = time.perf_counter() - started
+    network = min(network_clock.elapsed() - network_started, wall)
+    item.user_properties.append((PROPERTY_NAME, {"when": when, "wall": wall, "network": network}))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield from _timed_phase(item, "setup")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield from _timed_phase(item, "call")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield from _timed_phase(item, "teardown")
+
+
+def phase_breakdown(report) -> dict:
+    """{phase: {wall, network, local}} from the timing properties on a report"""
+    breakdown = {}
+    for name, value in getattr(report, "user_properties", ()):
+        if name != PROPERTY_NAME:
+            continue
+        wall, network = value["wall"], value["network"]
+        breakdown[value["when"]] = {"wall": round(wall, 6), "network": round(network, 6),
+                                    "local": round(wall - network, 6)}
+    return breakdown
+
+
+def _sum(breakdown: dict, phases, key: str) -> float:
+    return round(sum(breakdown[phase][key] for phase in phases if phase in breakdown), 6)
+
+
+class NetworkTimingReport:
+    """Collects the per-phase breakdown of every finished test for the JSON summary and HTML columns"""
+
+    def __init__(self, config):
+        self.config = config
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        # Merged across phase reports, so the teardown is included however the reports are consumed
+        breakdown = phase_breakdown(report)
+        if breakdown:
+            self.tests.setdefault(report.nodeid, {}).update(breakdown)
+
+    def pytest_sessionfinish(self, session):
+        if not self.tests:
+            return
+
+        totals = {phase: {key: round(sum(t[phase][key] for t in self.tests.values() if phase in t), 6)
+                          for key in ("wall", "network", "local")}
+                  for phase in PHASES}
+        summary = {"tests": self.tests, "totals": totals}
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        filename = f"reports/network_timing_{timestamp}.json"
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Network timing summary written to {filename}")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_table_header(self, cells):
+        from py.xml import html
+
+        cells.insert(3, html.th("Call Network (s)", class_="sortable", col="call-network"))
+        cells.insert(4, html.th("Call Local (s)", class_="sortable", col="call-local"))
+        cells.insert(5, html.th("Fixture Network (s)", class_="sortable", col="fixture-network"))
+        cells.insert(6, html.th("Fixture Local (s)", class_="sortable", col="fixture-local"))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_table_row(self, report, cells):
+        from py.xml import html
+
+        # The row is built from one phase's report; the collected breakdown has setup, call and teardown
+        breakdown = self.tests.get(report.nodeid) or phase_breakdown(report)
+        fixture_phases = ("setup", "teardown")
+        cells.insert(3, html.td(f"{_sum(breakdown, ('call',), 'network'):.3f}", class_="col-call-network"))
+        cells.insert(4, html.td(f"{_sum(breakdown, ('call',), 'local'):.3f}", class_="col-call-local"))
+        cells.insert(5, html.td(f"{_sum(breakdown, fixture_phases, 'network'):.3f}", class_="col-fixture-network"))
+        cells.insert(6, html.td(f"{_sum(breakdown, fixture_phases, 'local'):.3f}", class_="col-fixture-local"))
+
+
+def pytest_configure(config):
+    # Workers forward their reports; only the controller (or a plain run) writes the summary
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(NetworkTimingReport(config), "network_timing_report")
@@ -0,0 +1,38 @@
+"""Per-test scopes for reproducible test data and cassette replay.
+
+Every test gets its own test data stream (seeded from TEST_DATA_SEED and its node
+id) and its own cassette scope, so it sends the same requests and replays its own
+responses whether it runs alone, in the full suite or on any xdist worker. Session
+and module fixtures get a scope named after the fixture, whichever test builds them.
+
+This is a plugin rather than conftest hooks: pytest_fixture_setup for session
+fixtures is dispatched from the session node, which does not see tests/conftest.py.
+"""
+
+import pytest
+
+from clients.cassette import Cassette
+from plugins.duration_scheduling import base_nodeid
+from tests.data.test_data import reseed, restore
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    # Before any fixture of the test runs
+    scope = base_nodeid(item.nodeid)
+    reseed(scope)
+    Cassette.set_scope(scope)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if fixturedef.scope == 'function':
+        yield
+        return
+    scope = f"{fixturedef.scope}:{fixturedef.argname}"
+    previous_rng, previous_scope = reseed(scope), Cassette.set_scope(scope)
+    try:
+        yield
+    finally:
+        restore(previous_rng)
+        Cassette.set_scope(previous_scope)
@@ -1,27 +1,106 @@
 import pytest
 import os
+import json
+import glob
+import shutil
 import logging
+from datetime import datetime, timezone
 from clients.booking_client import BookingAPIClient
+from clients.cassette import Cassette, shard_path
 from config.environments import Config
+from utils.booking_mirror import BookingMirror
+from utils.booking_pool import BookingLeasePool
 from utils.bug_reporter import BugReporter
+from utils.cleanup import BookingSweeper
 from tests.data.test_data import BookingTestData
 
+pytest_plugins = ["plugins.network_timing", "plugins.duration_scheduling", "plugins.replay_scope"]
+
 logger = logging.getLogger(__name__)
 bug_reporter = BugReporter()
+bug_shard_dir_key = pytest.StashKey[str]()
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_session():
-    """Setup test session"""
-    yield
+def pytest_addoption(parser):
+    parser.addoption("--filter-oracle", action="store", type=int, default=0, metavar="N",
+                     help="Check N random filter combinations against the vectorized filter oracle")
+    parser.addoption("--mirror-all", action="store_true", default=False,
+                     help="Mirror every booking on the server for filter checks, not just the ones this session created")
+    parser.addoption("--load-test", action="store_true", default=False,
+                     help="Run load tests against a real backend (they always run against the in-memory stand-in)")
+    parser.addoption("--cassette-mode", action="store", choices=("record", "replay"), default=None,
+                     help="Record API interactions to a cassette, or replay them with no network")
+    parser.addoption("--cassette", action="store", default=None, metavar="PATH",
+                     help="Cassette file (default: cassettes/<TEST_ENV>.jsonl.gz)")
+
+
+def pytest_configure(config):
+    mode = config.getoption("--cassette-mode")
+    if mode:
+        os.environ['BOOKER_CASSETTE_MODE'] = mode
+    if config.getoption("--cassette"):
+        os.environ['BOOKER_CASSETTE'] = config.getoption("--cassette")
+
+    workerinput = getattr(config, 'workerinput', None)
+    settings = Config.get_cassette_settings()
+    if settings['mode'] == 'record' and workerinput:
+        # Each xdist worker records its own shard; the controller merges them at the end
+        os.environ['BOOKER_CASSETTE'] = shard_path(settings['path'], workerinput['workerid'])
+        settings = Config.get_cassette_settings()
+    if settings['mode'] == 'record':
+        # Pin generated test data so the recorded request bodies can be matched on replay
+        os.environ.setdefault('TEST_DATA_SEED', datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S"))
+        os.environ.setdefault('TEST_DATA_TODAY', datetime.now().strftime("%Y-%m-%d"))
+        cassette = Cassette.shared(settings['path'], 'record')
+        cassette.metadata.update({'test_data_seed': os.environ['TEST_DATA_SEED'],
+                                  'test_data_today': os.environ['TEST_DATA_TODAY']})
+    elif settings['mode'] == 'replay':
+        metadata = Cassette.read_metadata(settings['path'])
+        os.environ['TEST_DATA_SEED'] = metadata['test_data_seed']
+        os.environ['TEST_DATA_TODAY'] = metadata['test_data_today']
+
+    # xdist workers append their bugs to a per-worker shard for the controller to merge
+    if workerinput and workerinput.get('bug_shard_dir'):
+        bug_reporter.shard_path = os.path.join(workerinput['bug_shard_dir'], f"{workerinput['workerid']}.jsonl")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand every xdist worker the shared bug shard directory"""
+    config = node.config
+    if bug_shard_dir_key not in config.stash:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        shard_dir = os.path.abspath(f"reports/bug_shards_{timestamp}_{os.getpid()}")
+        os.makedirs(shard_dir, exist_ok=True)
+        config.stash[bug_shard_dir_key] = shard_dir
+    node.workerinput['bug_shard_dir'] = config.stash[bug_shard_dir_key]
+
+
+def pytest_sessionfinish(session, exitstatus):
+    Cassette.save_all()
+
+    # Workers only write their shard; the controller (or a plain run) writes the report
+    if hasattr(session.config, 'workerinput'):
+        return
+
+    settings = Config.get_cassette_settings()
+    shards = sorted(glob.glob(shard_path(settings['path'], 'gw*'))) if settings['mode'] == 'record' else []
+    if shards:
+        Cassette.merge(settings['path'], shards, Cassette.shared(settings['path'], 'record').metadata)
+
+    shard_dir = session.config.stash.get(bug_shard_dir_key, None)
+    reporter = BugReporter.merge_shards(shard_dir) if shard_dir else bug_reporter
 
     # Generate reports at end of session only if there are bugs
-    if bug_reporter.bugs:
-        bug_reporter.generate_excel_report()
-        logger.info(f"Generated bug report with {len(bug_reporter.bugs)} bugs")
+    if reporter.bugs:
+        reporter.generate_excel_report()
+        logger.info(f"Generated bug report with {len(reporter.bugs)} bugs")
     else:
         logger.info("No bugs detected - skipping report generation")
 
+    if shard_dir:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+
 
 @pytest.fixture(scope="session")
 def config():
@@ -31,38 +110,138 @@ def config():
 
 @pytest.fixture(scope="session")
 def api_client(config):
-    """Base API client fixture"""
-    return BookingAPIClient(config)
+    """Base API client fixture, dumping per-endpoint latency percentiles at teardown"""
+    client = BookingAPIClient(config, **Config.get_cache_settings())
+    yield client
+
+    snapshot = client.latency_snapshot()
+    if snapshot:
+        worker = os.getenv('PYTEST_XDIST_WORKER', 'main')
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        filename = f"reports/latency_{worker}_{timestamp}.json"
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+        for bucket, stats in snapshot.items():
+            logger.info(f"{bucket}: n={stats['count']} p50={stats['p50_ms']}ms "
+                        f"p99={stats['p99_ms']}ms p99.9={stats['p99.9_ms']}ms")
+        logger.info(f"Latency snapshot written to {filename}")
+    if client.cache:
+        logger.info(f"Booking cache: {client.cache_stats()}")
+    client.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def health_gate(api_client):
+    """Probe /ping once per session; if it fails, open the circuit so requests fail fast"""
+    settings = Config.get_health_settings()
+    if not settings['gate']:
+        return None
+
+    healthy = api_client.ping_health_check(timeout=settings['deadline'])
+    if not healthy:
+        api_client.circuit_breaker.trip(f"health check of {api_client.base_url}/ping failed")
+        logger.error(f"Backend {api_client.base_url} is unhealthy - requests will fail fast")
+    return healthy
+
+
+@pytest.fixture(scope="session")
+def session_booking_ids():
+    """Ids of every booking the factories created in this session (this worker, under xdist)"""
+    return set()
+
+
+@pytest.fixture(scope="session")
+def booking_mirror(api_client, session_booking_ids, request):
+    """Indexed local copy of this session's bookings (all bookings with --mirror-all), synced by tests"""
+    tracked_ids = None if request.config.getoption("--mirror-all") else session_booking_ids
+    mirror = BookingMirror(api_client, tracked_ids=tracked_ids)
+    mirror.sync()
+    return mirror
+
+
+@pytest.fixture(scope="session")
+def booking_sweeper(api_client):
+    """Retries failed booking deletes at the end of the session and reports leaks"""
+    sweeper = BookingSweeper(api_client, max_workers=api_client.DEFAULT_BULK_WORKERS)
+    yield sweeper
+
+    stats = sweeper.sweep()
+    if stats['leaked']:
+        logger.warning(f"{stats['leaked']} bookings could not be cleaned up")
 
 
 @pytest.fixture
-def booking_factory(api_client):
-    """Factory fixture for creating bookings with automatic cleanup"""
+def created_booking_ids(booking_sweeper):
+    """Booking IDs created by the current test, deleted in parallel afterwards"""
     created_bookings = []
 
+    yield created_bookings
+
+    # Failed deletes are queued for the session-end sweep
+    booking_sweeper.delete(created_bookings)
+
+
+@pytest.fixture
+def booking_factory(api_client, created_booking_ids, session_booking_ids):
+    """Factory fixture for creating bookings with automatic cleanup"""
+
     def _create_booking(booking_data=None):
         if booking_data is None:
             booking_data = BookingTestData.valid_booking()
 
         booking_response = api_client.create_booking(booking_data)
         booking_id = booking_response.bookingid
-        created_bookings.append(booking_id)
+        created_booking_ids.append(booking_id)
+        session_booking_ids.add(booking_id)
         return booking_response, booking_data
 
-    yield _create_booking
+    return _create_booking
+
+
+@pytest.fixture
+def booking_batch_factory(api_client, created_booking_ids, session_booking_ids):
+    """Factory fixture for seeding many bookings in parallel with automatic cleanup"""
+
+    def _create_bookings(payloads):
+        results = api_client.create_bookings(payloads)
+        booking_ids = [r.result.bookingid for r in results if r.ok]
+        created_booking_ids.extend(booking_ids)
+        session_booking_ids.update(booking_ids)
+        failures = [r.error for r in results if not r.ok]
+        if failures:
+            raise Exception(f"Failed to seed {len(failures)} of {len(results)} bookings: {failures[0]}")
+        return [(r.result, r.item) for r in results]
+
+    return _create_bookings
 
-    # Cleanup all created bookings
-    for booking_id in created_bookings:
-        try:
-            api_client.delete_booking(booking_id)
-        except Exception:
-            pass  # Ignore cleanup errors
+
+@pytest.fixture(scope="session")
+def booking_pool(api_client, booking_sweeper):
+    """Session pool of pre-created bookings leased to tests instead of create/delete per test"""
+    # Cassette runs give each test a booking of its own: a shared pool ties a test's
+    # recorded requests to whichever tests (and xdist worker) leased the booking before
+    size = 0 if Config.get_cassette_settings()['mode'] else int(os.getenv('BOOKING_POOL_SIZE', '8'))
+    pool = BookingLeasePool(api_client, size=size,
+                            booking_data_factory=BookingTestData.valid_booking,
+                            sweeper=booking_sweeper)
+    pool.fill()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def leased_booking(booking_pool):
+    """Pooled booking; call mark_dirty() or mark_deleted() if the test changes it"""
+    lease = booking_pool.lease()
+    yield lease
+    booking_pool.release(lease)
 
 
 @pytest.fixture
-def standard_booking(booking_factory):
-    """Standard booking for tests"""
-    return booking_factory()
+def standard_booking(leased_booking):
+    """Standard read-only booking for tests, leased from the session pool"""
+    return leased_booking.booking_response, leased_booking.booking_data
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -1,12 +1,58 @@
+import os
+import random
+import uuid
 from datetime import datetime, timedelta
+from typing import Optional
+
+_rng = None
+
+
+def reseed(scope: str) -> Optional[random.Random]:
+    """Start a separate id stream for one test or fixture; returns the previous stream.
+
+    With one stream per scope, a test generates the same data whether it runs alone,
+    in the full suite or on any xdist worker, so its recorded requests replay.
+    """
+    global _rng
+    previous = _rng
+    seed = os.getenv('TEST_DATA_SEED')
+    _rng = random.Random(f"{seed}|{scope}") if seed is not None else None
+    return previous
+
+
+def restore(rng: Optional[random.Random]):
+    """Switch back to a stream returned by reseed()"""
+    global _rng
+    _rng = rng
+
+
+def _unique_id(length: int = 8) -> str:
+    """Random id fragment, reproducible when TEST_DATA_SEED is set (cassette runs)"""
+    global _rng
+    seed = os.getenv('TEST_DATA_SEED')
+    if seed is None:
+        return str(uuid.uuid4())[:length]
+    if _rng is None:
+        _rng = random.Random(seed)
+    return str(uuid.UUID(int=_rng.getrandbits(128)))[:length]
+
+
+def _now() -> datetime:
+    """Current time, pinned by TEST_DATA_TODAY so recorded runs replay on any day"""
+    today = os.getenv('TEST_DATA_TODAY')
+    return datetime.fromisoformat(today) if today else datetime.now()
 
 
 class BookingTestData:
+    @staticmethod
+    def today() -> datetime:
+        """Reference 'now' for date-relative test data"""
+        return _now()
+
     @staticmethod
     def valid_booking():
         """Generate valid booking data with future dates"""
-        import uuid
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = _unique_id(8)
         dates = BookingTestData.future_booking_dates()
         return {
             "firstname": f"John{unique_id}",
@@ -19,8 +65,8 @@ class BookingTestData:
 
     @staticmethod
     def valid_booking_future_dates():
-        checkin = datetime.now() + timedelta(days=1)
-        checkout = datetime.now() + timedelta(days=3)
+        checkin = _now() + timedelta(days=1)
+        checkout = _now() + timedelta(days=3)
 
         booking = BookingTestData.valid_booking().copy()
         booking['bookingdates'].update({
@@ -75,8 +121,7 @@ class BookingTestData:
     @staticmethod
     def non_matching_names():
         """Names that should not match any existing bookings"""
-        import uuid
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = _unique_id(8)
         return {
             "firstname": f"NonExistent{unique_id}",
             "lastname": f"Person{unique_id}"
@@ -85,8 +130,7 @@ class BookingTestData:
     @staticmethod
     def future_booking_dates():
         """Generate future booking dates (next week + 5 days)"""
-        from datetime import datetime, timedelta
-        checkin = datetime.now() + timedelta(days=7)  # Next week
+        checkin = _now() + timedelta(days=7)  # Next week
         checkout = checkin + timedelta(days=5)  # 5 days later
         return {
             "checkin": checkin.strftime("%Y-%m-%d"),
@@ -96,15 +140,12 @@ class BookingTestData:
     @staticmethod
     def updated_booking_data(original_data):
         """Generate updated booking data with different dates and details"""
-        from datetime import datetime, timedelta
-        import uuid
-
         # Parse original checkin date and add extra days to ensure difference
         original_checkin = datetime.strptime(original_data['bookingdates']['checkin'], "%Y-%m-%d")
         new_checkin = original_checkin + timedelta(days=10)  # 10 days later than original
         new_checkout = new_checkin + timedelta(days=7)  # 7 days stay
 
-        unique_id = str(uuid.uuid4())[:6]
+        unique_id = _unique_id(6)
 
         return {
             "firstname": f"Updated{unique_id}",
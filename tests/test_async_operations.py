@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from clients.async_booking_client import AsyncBookingAPIClient
+from tests.data.test_data import BookingTestData
+from utils.assertions import APIAssertions
+from utils.concurrency import ConcurrencyUtils
+
+
+@pytest.mark.concurrent
+class TestAsyncOperations:
+    """Test high fan-out booking operations through the asyncio client"""
+
+    def test_async_concurrent_create_read_delete(self, config):
+        """Test many bookings can be created, read and deleted concurrently"""
+
+        async def scenario():
+            async with AsyncBookingAPIClient(config) as client:
+                payloads = [BookingTestData.valid_booking() for _ in range(20)]
+                created = await ConcurrencyUtils.run_async_operations(
+                    [lambda data=data: client.create_booking(data) for data in payloads]
+                )
+                booking_ids = [response.bookingid for response in created]
+
+                try:
+                    retrieved = await ConcurrencyUtils.run_async_operations(
+                        [lambda bid=bid: client.get_booking_by_id(bid) for bid in booking_ids]
+                    )
+                finally:
+                    deleted = await ConcurrencyUtils.run_async_operations(
+                        [lambda bid=bid: client.delete_booking(bid) for bid in booking_ids]
+                    )
+                return payloads, booking_ids, retrieved, deleted
+
+        payloads, booking_ids, retrieved, deleted = asyncio.run(scenario())
+
+        assert len(set(booking_ids)) == len(payloads), f"Expected {len(payloads)} unique IDs, got {booking_ids}"
+        for booking_id in booking_ids:
+            APIAssertions.assert_booking_id(booking_id)
+        for original, booking in zip(payloads, retrieved):
+            APIAssertions.assert_booking_structure(booking)
+            APIAssertions.assert_booking_equality(original, booking)
+        assert all(deleted), f"Not all bookings were deleted: {deleted}"
+
+    def test_async_health_check(self, config):
+        """Test the /ping health check through the asyncio client"""
+
+        async def scenario():
+            async with AsyncBookingAPIClient(config) as client:
+                return await client.ping_health_check()
+
+        assert asyncio.run(scenario()), "API health check failed - service may be down"
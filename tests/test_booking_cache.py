@@ -0,0 +1,90 @@
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from config.environments import Config
+from tests.data.test_data import BookingTestData
+from utils.assertions import APIAssertions
+
+
+class TimeoutAfterWriteAdapter(BaseAdapter):
+    """Wraps the real adapter, applying PUT and PATCH requests but raising a read timeout instead of answering"""
+
+    def __init__(self, inner):
+        super().__init__()
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        response = self.inner.send(request, **kwargs)
+        if request.method in ('PUT', 'PATCH'):
+            raise requests.exceptions.ReadTimeout("Read timed out after the write was applied", request=request)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.fixture
+def cached_client(config):
+    """Booking client with the read cache enabled"""
+    client = BookingAPIClient(config, cache_size=64, cache_ttl=60)
+    yield client
+    client.close()
+
+
+@pytest.mark.booking
+class TestBookingCache:
+    """Test the client-side booking read cache"""
+
+    def test_repeated_reads_hit_cache(self, cached_client, booking_factory):
+        """Test re-reading a booking is served from the cache"""
+        booking_response, original_data = booking_factory()
+        booking_id = booking_response.bookingid
+
+        first = cached_client.get_booking_by_id(booking_id)
+        second = cached_client.get_booking_by_id(booking_id)
+
+        APIAssertions.assert_booking_equality(original_data, second)
+        stats = cached_client.cache_stats()
+        assert (stats['hits'], stats['misses']) == (1, 1), f"Unexpected cache counters: {stats}"
+
+        first.firstname = "Mutated"
+        assert cached_client.get_booking_by_id(booking_id) == second, \
+            "Mutating a returned booking should not change the cached copy"
+
+    def test_writes_keep_cache_coherent(self, cached_client, booking_factory):
+        """Test update writes through and delete invalidates the cached booking"""
+        booking_response, original_data = booking_factory()
+        booking_id = booking_response.bookingid
+        cached_client.get_booking_by_id(booking_id)
+
+        updated_data = BookingTestData.updated_booking_data(original_data)
+        cached_client.update_booking(booking_id, updated_data)
+        APIAssertions.assert_booking_equality(updated_data, cached_client.get_booking_by_id(booking_id))
+
+        cached_client.delete_booking(booking_id)
+        with pytest.raises(Exception):
+            cached_client.get_booking_by_id(booking_id)
+
+    @pytest.mark.skipif(Config.get_transport() != 'memory',
+                        reason="The lost response is injected into the in-memory stand-in")
+    @pytest.mark.parametrize("method", ["update_booking", "partial_update_booking"])
+    def test_failed_write_invalidates_cache(self, config, booking_factory, method):
+        """Test a write whose response is lost does not leave the old booking cached"""
+        client = BookingAPIClient(config, cache_size=64, cache_ttl=60, retry_policy=None, limiter=None,
+                                  circuit_breaker=None)
+        try:
+            booking_response, original_data = booking_factory()
+            booking_id = booking_response.bookingid
+            client.get_booking_by_id(booking_id)
+            client.mount(client.base_url, TimeoutAfterWriteAdapter(client.session.get_adapter(client.base_url)))
+
+            updated_data = BookingTestData.updated_booking_data(original_data)
+            payload = updated_data if method == "update_booking" else {'firstname': updated_data['firstname']}
+            with pytest.raises(requests.exceptions.Timeout):
+                getattr(client, method)(booking_id, payload)
+
+            assert client.get_booking_by_id(booking_id).firstname == updated_data['firstname'], \
+                "A read after the lost write should fetch the booking the server now holds"
+        finally:
+            client.close()
@@ -35,10 +35,20 @@ class TestBookingCRUD:
             retrieved_booking = api_client.get_booking_by_id(booking_id)
             APIAssertions.assert_booking_structure(retrieved_booking)
 
-    def test_update_booking(self, api_client, standard_booking):
+    def test_stream_booking_ids(self, api_client, standard_booking):
+        """Test streamed booking IDs match the regular listing"""
+        booking_response, _ = standard_booking
+
+        streamed_ids = api_client.collect_booking_ids(into='array')
+        listed_ids = api_client.get_all_booking_ids()
+
+        assert sorted(streamed_ids) == sorted(listed_ids), f"Streamed {len(streamed_ids)} IDs, listed {len(listed_ids)}"
+        assert booking_response.bookingid in api_client.collect_booking_ids(into='set')
+
+    def test_update_booking(self, api_client, leased_booking):
         """Test updating a complete booking"""
-        booking_response, original_data = standard_booking
-        booking_id = booking_response.bookingid
+        leased_booking.mark_dirty()
+        booking_id = leased_booking.booking_id
 
         updated_data = BookingTestData.valid_booking_future_dates()
         api_client.update_booking(booking_id, updated_data)
@@ -47,10 +57,11 @@ class TestBookingCRUD:
         APIAssertions.assert_booking_structure(retrieved)
         APIAssertions.assert_booking_equality(updated_data, retrieved)
 
-    def test_partial_update_booking(self, api_client, standard_booking):
+    def test_partial_update_booking(self, api_client, leased_booking):
         """Test partially updating a booking"""
-        booking_response, original_data = standard_booking
-        booking_id = booking_response.bookingid
+        leased_booking.mark_dirty()
+        booking_id = leased_booking.booking_id
+        original_data = leased_booking.booking_data
 
         # Create partial update with modified original values
         partial_data = {
@@ -68,10 +79,10 @@ class TestBookingCRUD:
 
         APIAssertions.assert_booking_equality(expected_data, retrieved)
 
-    def test_delete_booking(self, api_client, standard_booking):
+    def test_delete_booking(self, api_client, leased_booking):
         """Test deleting a booking"""
-        booking_response, _ = standard_booking
-        booking_id = booking_response.bookingid
+        leased_booking.mark_deleted()
+        booking_id = leased_booking.booking_id
 
         retrieved = api_client.get_booking_by_id(booking_id)
         assert retrieved is not None
@@ -3,6 +3,7 @@ import logging
 from datetime import datetime, timedelta
 from clients.booking_client import BookingAPIClient
 from tests.data.test_data import BookingTestData
+from utils.filter_oracle import FilterOracle
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +14,7 @@ class TestBookingFilters:
     """Test booking filtering functionality"""
 
     @pytest.mark.parametrize("checkin_date", BookingTestData.filter_test_dates()["checkin_dates"])
-    def test_filter_by_checkin_date(self, api_client, booking_factory, checkin_date):
+    def test_filter_by_checkin_date(self, api_client, booking_factory, booking_mirror, checkin_date):
         """Test filtering bookings by check-in date - exposes API inconsistencies"""
         # Create booking with the parameterized checkin date
         booking_data = BookingTestData.filter_test_booking_data()
@@ -25,6 +26,12 @@ class TestBookingFilters:
         filtered_ids = api_client.filter_bookings_by_dates(checkin=checkin_date)
         assert isinstance(filtered_ids, list), f"Expected list, got {type(filtered_ids).__name__}: {filtered_ids}"
 
+        # Compare the whole result with the mirror's answer, not just our booking
+        booking_mirror.sync()
+        missing, unexpected = booking_mirror.diff(filtered_ids, checkin=checkin_date)
+        assert not missing, f"Checkin filter for {checkin_date} omitted {len(missing)} matching bookings, e.g. {sorted(missing)[:5]}"
+        assert not unexpected, f"Checkin filter for {checkin_date} returned {len(unexpected)} earlier bookings, e.g. {sorted(unexpected)[:5]}"
+
 
     @pytest.mark.parametrize("checkout_date", BookingTestData.filter_test_dates()["checkout_dates"])
     def test_filter_by_checkout_date(self, api_client, booking_factory, checkout_date):
@@ -117,8 +124,9 @@ class TestBookingFilters:
     @pytest.mark.critical
     def test_filter_date_boundary_conditions(self, api_client, booking_factory):
         """Test date filtering with boundary conditions"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        now = BookingTestData.today()
+        today = now.strftime("%Y-%m-%d")
+        tomorrow = (now + timedelta(days=1)).strftime("%Y-%m-%d")
 
         booking_data = BookingTestData.booking_with_specific_dates(today, tomorrow)
         booking_response, _ = booking_factory(booking_data)
@@ -142,7 +150,7 @@ class TestBookingFilters:
 
         assert len(all_bookings) == len(none_filtered), f"Empty filter inconsistency: all_bookings={len(all_bookings)} vs none_filtered={len(none_filtered)}"
 
-    def test_filter_should_exclude_booking_by_checkin(self, api_client, booking_factory):
+    def test_filter_should_exclude_booking_by_checkin(self, api_client, booking_factory, booking_mirror):
         """Test that bookings are excluded when they don't match checkin filter"""
         booking_data = BookingTestData.past_date_booking_data()
         booking_response, _ = booking_factory(booking_data)
@@ -159,6 +167,11 @@ class TestBookingFilters:
         assert booking_id not in filtered_ids, ("Booking with past checkin found in future-date "
                                                 "filter - filtering broken")
 
+        booking_mirror.sync()
+        missing, unexpected = booking_mirror.diff(filtered_ids, checkin=future_checkin)
+        assert not missing and not unexpected, (f"Checkin filter for {future_checkin} disagrees with local mirror: "
+                                                f"missing={sorted(missing)[:5]} unexpected={sorted(unexpected)[:5]}")
+
     def test_filter_should_exclude_booking_by_checkout(self, api_client, booking_factory):
         """Test that bookings are excluded when they don't match checkout filter"""
         booking_data = BookingTestData.past_date_booking_data()
@@ -190,3 +203,29 @@ class TestBookingFilters:
         assert isinstance(filtered_ids, list), f"Expected list, got {type(filtered_ids).__name__}: {filtered_ids}"
         assert booking_id not in filtered_ids, ("Booking found in filter results for different "
                                                 "names - name filtering broken")
+
+    @pytest.mark.oracle
+    def test_filter_combinations_match_oracle(self, api_client, booking_batch_factory, booking_mirror, request):
+        """Test many filter combinations against a vectorized oracle over the mirrored bookings"""
+        query_count = request.config.getoption("--filter-oracle")
+        if not query_count:
+            pytest.skip("Differential filter oracle disabled - enable with --filter-oracle=N")
+
+        filter_dates = BookingTestData.filter_test_dates()
+        booking_batch_factory([BookingTestData.booking_with_specific_dates(checkin, checkout)
+                               for checkin, checkout in filter_dates["date_pairs"]])
+        booking_mirror.sync()
+
+        oracle = FilterOracle.from_mirror(booking_mirror)
+        extra_dates = filter_dates["checkin_dates"] + filter_dates["checkout_dates"]
+        queries = oracle.generate_queries(query_count, seed=query_count, extra_dates=extra_dates)
+        mismatches = oracle.diff_against(api_client, queries)
+
+        if mismatches:
+            # Re-check once against fresh data so concurrent edits by others are not reported
+            booking_mirror.refresh(set().union(*(m.missing | m.unexpected for m in mismatches)))
+            oracle = FilterOracle.from_mirror(booking_mirror)
+            mismatches = oracle.diff_against(api_client, [m.query for m in mismatches])
+
+        assert not mismatches, (f"{len(mismatches)} of {len(queries)} filter combinations disagree with the oracle, "
+                                f"first: {mismatches[0]}")
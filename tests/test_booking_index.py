@@ -0,0 +1,84 @@
+import pytest
+from utils.booking_index import BookingIndex
+
+
+def booking(firstname, lastname, checkin, checkout):
+    return {'firstname': firstname, 'lastname': lastname,
+            'bookingdates': {'checkin': checkin, 'checkout': checkout}}
+
+
+@pytest.fixture
+def index():
+    """Index of four bookings spread over January 2024"""
+    index = BookingIndex()
+    index.put_many([
+        (1, booking("Sally", "Brown", "2024-01-01", "2024-01-05")),
+        (2, booking("Sally", "Green", "2024-01-10", "2024-01-12")),
+        (3, booking("Jim", "Brown", "2024-01-10", "2024-01-20")),
+        (4, booking("Mark", "Wilson", "2024-01-20", "2024-01-21")),
+    ])
+    return index
+
+
+@pytest.mark.regression
+class TestBookingIndex:
+    """Test the indexed booking store behind the in-memory transport's filters"""
+
+    @pytest.mark.parametrize("filters, expected", [
+        ({'checkin': "2024-01-10"}, [2, 3, 4]),
+        ({'checkin': "2024-01-11"}, [4]),
+        ({'checkin': "2023-12-31"}, [1, 2, 3, 4]),
+        ({'checkin': "2024-02-01"}, []),
+        ({'checkout': "2024-01-12"}, [2, 3, 4]),
+        ({'checkout': "2024-01-21"}, [4]),
+        ({'checkin': "2024-01-10", 'checkout': "2024-01-13"}, [3, 4]),
+        ({'checkin': "2024-01-02", 'checkout': "2024-01-21"}, [4]),
+    ])
+    def test_date_range_queries(self, index, filters, expected):
+        """Test date filters return bookings on or after the date, inclusive, and combine with AND"""
+        assert index.query(**filters) == expected
+
+    @pytest.mark.parametrize("filters, expected", [
+        ({'firstname': "Sally"}, [1, 2]),
+        ({'lastname': "Brown"}, [1, 3]),
+        ({'firstname': "Sally", 'lastname': "Brown"}, [1]),
+        ({'firstname': "Sally", 'checkin': "2024-01-05"}, [2]),
+        ({'lastname': "Brown", 'checkout': "2024-01-06"}, [3]),
+        ({'firstname': "Nobody"}, []),
+        ({}, [1, 2, 3, 4]),
+    ])
+    def test_name_queries(self, index, filters, expected):
+        """Test names match exactly and narrow date filters"""
+        assert index.query(**filters) == expected
+
+    def test_put_matches_put_many(self, index):
+        """Test inserting one by one builds the same answers as the bulk load"""
+        single = BookingIndex()
+        for booking_id in sorted(index.ids()):
+            single.put(booking_id, index.get(booking_id))
+
+        for filters in ({'checkin': "2024-01-10"}, {'checkout': "2024-01-12"}, {'firstname': "Sally"}):
+            assert single.query(**filters) == index.query(**filters)
+
+    def test_update_moves_booking_between_keys(self, index):
+        """Test replacing a booking removes it from its old name and date keys"""
+        index.put(1, booking("Jim", "Wilson", "2024-01-15", "2024-01-25"))
+
+        assert index.query(firstname="Sally") == [2]
+        assert index.query(lastname="Brown") == [3]
+        assert index.query(firstname="Jim") == [1, 3]
+        assert index.query(checkin="2024-01-15") == [1, 4]
+        assert index.query(checkout="2024-01-22") == [1]
+        assert index.query(checkin="2024-01-01", checkout="2024-01-05") == [1, 2, 3, 4]
+        assert len(index) == 4
+
+    def test_remove_drops_every_key(self, index):
+        """Test a removed booking disappears from all indexes and empty name keys are dropped"""
+        assert index.remove(4)['lastname'] == "Wilson"
+        assert index.remove(4) is None
+
+        assert 4 not in index
+        assert index.query(checkin="2024-01-20") == []
+        assert index.query(lastname="Wilson") == []
+        assert "Wilson" not in index._by_lastname
+        assert index.ids() == {1, 2, 3}
@@ -0,0 +1,80 @@
+import pytest
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from clients.in_memory_transport import build_response
+from config.environments import Config
+from tests.data.test_data import BookingTestData
+from utils.booking_mirror import BookingMirror
+
+pytestmark = pytest.mark.skipif(Config.get_transport() != 'memory',
+                                reason="Mirror bookkeeping is checked against the in-memory stand-in")
+
+
+class RejectGetsAdapter(BaseAdapter):
+    """Wraps the real adapter, answering every GET of one booking with 500"""
+
+    def __init__(self, inner, booking_id: int):
+        super().__init__()
+        self.inner = inner
+        self.path = f"/booking/{booking_id}"
+
+    def send(self, request, **kwargs):
+        if request.method == 'GET' and request.path_url == self.path:
+            return build_response(request, 500, {'Content-Type': 'text/plain'}, b'Internal Server Error', self)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.fixture
+def mirror_client(config):
+    """Booking client with its own circuit breaker state, so injected failures stay local"""
+    client = BookingAPIClient(config, circuit_breaker=None)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def two_bookings(mirror_client):
+    """Two fresh booking ids, deleted afterwards"""
+    booking_ids = [mirror_client.create_booking(BookingTestData.valid_booking()).bookingid for _ in range(2)]
+    yield booking_ids
+    mirror_client.delete_bookings(booking_ids)
+
+
+@pytest.mark.booking
+class TestBookingMirror:
+    """Test the mirror only fetches what it tracks and never forgets a booking on a transient error"""
+
+    def test_sync_limited_to_tracked_ids(self, mirror_client, two_bookings):
+        """Test a tracked mirror ignores other bookings and drops tracked ones once deleted"""
+        tracked, untracked = two_bookings
+        tracked_ids = {tracked}
+        mirror = BookingMirror(mirror_client, tracked_ids=tracked_ids)
+
+        mirror.sync()
+        assert mirror.index.ids() == {tracked}, f"Mirror should hold only the tracked booking: {mirror.index.ids()}"
+
+        tracked_ids.add(untracked)
+        assert mirror.sync()['added'] == 1
+        assert mirror.index.ids() == {tracked, untracked}
+
+        assert mirror_client.delete_booking(tracked)
+        assert mirror.sync()['removed'] == 1
+        assert mirror.index.ids() == {untracked}
+
+    def test_refresh_keeps_stale_booking_on_fetch_error(self, mirror_client, two_bookings):
+        """Test a failed re-fetch keeps the old entry and reports the error, while a 404 drops it"""
+        failing, deleted = two_bookings
+        mirror = BookingMirror(mirror_client, tracked_ids=set(two_bookings))
+        mirror.sync()
+
+        assert mirror_client.delete_booking(deleted)
+        mirror_client.mount(mirror_client.base_url,
+                            RejectGetsAdapter(mirror_client.session.get_adapter(mirror_client.base_url), failing))
+        errors = mirror.refresh(two_bookings)
+
+        assert set(errors) == {failing}, f"Only the failed fetch should be reported: {errors}"
+        assert "500" in str(errors[failing])
+        assert mirror.index.ids() == {failing}, f"Stale booking should be kept, deleted one dropped: {mirror.index.ids()}"
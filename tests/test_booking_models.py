@@ -0,0 +1,52 @@
+from datetime import date, datetime
+import pytest
+from models.booking import Booking, BookingDates, FrozenBooking
+from tests.data.test_data import BookingTestData
+
+
+@pytest.mark.regression
+class TestBookingDates:
+    """Test booking dates are validated, immutable and safe to hash"""
+
+    def test_dates_and_strings_are_equal(self):
+        """Test a date and its ISO string build equal dates with equal hashes"""
+        parsed = BookingDates(date(2024, 1, 1), datetime(2024, 1, 5, 12, 30))
+        raw = BookingDates("2024-01-01", "2024-01-05")
+
+        assert parsed == raw and hash(parsed) == hash(raw)
+        assert raw.checkout == date(2024, 1, 5)
+        assert parsed.to_dict() == {'checkin': "2024-01-01", 'checkout': "2024-01-05"}
+
+    @pytest.mark.parametrize("checkin, checkout", [(None, "2024-01-05"), ("2024-01-01", 20240105)])
+    def test_invalid_types_rejected(self, checkin, checkout):
+        """Test anything but a date or a string is rejected up front with a TypeError"""
+        with pytest.raises(TypeError, match="must be a date or an ISO date string"):
+            BookingDates(checkin, checkout)
+
+    def test_malformed_string_fails_on_access(self):
+        """Test a malformed server date is kept as sent and only fails when parsed"""
+        dates = BookingDates("0NaN-aN-aN", "2024-01-05")
+
+        assert dates.to_dict()['checkin'] == "0NaN-aN-aN"
+        with pytest.raises(ValueError):
+            dates.checkin
+
+    def test_dates_cannot_be_reassigned(self):
+        """Test hashed dates cannot change under a set or dict that holds them"""
+        data = BookingTestData.booking_with_specific_dates("2024-01-01", "2024-01-05")
+        booking = FrozenBooking.from_dict(data)
+        held = {booking}
+
+        with pytest.raises(AttributeError):
+            booking.bookingdates.checkin = "2025-01-01"
+        assert FrozenBooking.from_dict(data) in held
+
+    def test_copy_is_independent(self):
+        """Test a copied booking can be changed without touching the original"""
+        booking = Booking.from_dict(BookingTestData.valid_booking())
+        copy = booking.copy()
+        copy.firstname = "Changed"
+        copy.bookingdates = BookingDates("2030-01-01", "2030-01-02")
+
+        assert booking.firstname != "Changed"
+        assert booking.bookingdates != copy.bookingdates
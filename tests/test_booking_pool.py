@@ -0,0 +1,106 @@
+import pytest
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from clients.in_memory_transport import build_response
+from config.environments import Config
+from tests.data.test_data import BookingTestData
+from utils.booking_pool import BookingLeasePool
+from utils.cleanup import BookingSweeper
+
+pytestmark = pytest.mark.skipif(Config.get_transport() != 'memory',
+                                reason="Pool bookkeeping is checked against the in-memory stand-in")
+
+
+class RejectUpdatesAdapter(BaseAdapter):
+    """Wraps the real adapter, answering every PUT with 500 so pool resets fail"""
+
+    def __init__(self, inner):
+        super().__init__()
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        if request.method == 'PUT':
+            return build_response(request, 500, {'Content-Type': 'text/plain'}, b'Internal Server Error', self)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.fixture
+def pool_client(config):
+    """Booking client with its own circuit breaker state, so injected failures stay local"""
+    client = BookingAPIClient(config, circuit_breaker=None)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def pool(pool_client):
+    """One-booking pool cleaned up through its own sweeper"""
+    pool = BookingLeasePool(pool_client, size=1, booking_data_factory=BookingTestData.valid_booking,
+                            sweeper=BookingSweeper(pool_client))
+    pool.fill()
+    yield pool
+    pool.close()
+
+
+@pytest.mark.booking
+class TestBookingLeasePool:
+    """Test the pool never loses track of a booking it created"""
+
+    def test_clean_lease_returns_to_pool(self, pool):
+        """Test an unchanged booking is leased again without being recreated"""
+        lease = pool.lease()
+        pool.release(lease)
+
+        assert pool.lease().booking_id == lease.booking_id
+        assert pool.stats['created'] == 1, f"Unexpected pool stats: {pool.stats}"
+
+    def test_failed_reset_deletes_booking(self, pool, pool_client):
+        """Test a dirty booking that cannot be reset is deleted instead of reused"""
+        lease = pool.lease()
+        lease.mark_dirty()
+        adapter = RejectUpdatesAdapter(pool_client.session.get_adapter(pool_client.base_url))
+        pool_client.mount(pool_client.base_url, adapter)
+
+        pool.release(lease)
+
+        assert not pool_client.booking_exists(lease.booking_id), "Unresettable booking should be deleted"
+        assert pool.stats['dropped'] == 1, f"Unexpected pool stats: {pool.stats}"
+        assert pool.lease().booking_id != lease.booking_id
+
+    def test_deleted_lease_cleaned_up_if_test_did_not_delete(self, pool, pool_client):
+        """Test a lease marked deleted is still deleted when the test failed before its own DELETE"""
+        lease = pool.lease()
+        lease.mark_deleted()
+
+        pool.release(lease)
+
+        assert not pool_client.booking_exists(lease.booking_id), "Booking marked deleted should not leak"
+        assert not pool.sweeper.pending, f"Nothing should be left for the sweep: {pool.sweeper.pending}"
+
+    def test_deleted_lease_already_gone(self, pool, pool_client):
+        """Test a booking the test already deleted counts as cleaned up without a second DELETE"""
+        lease = pool.lease()
+        lease.mark_deleted()
+        assert pool_client.delete_booking(lease.booking_id)
+
+        pool.release(lease)
+        stats = pool.sweeper.sweep()
+
+        assert pool.stats['dropped'] == 1, f"Unexpected pool stats: {pool.stats}"
+        assert (stats['queued'], stats['leaked']) == (0, 0), f"Unexpected sweep stats: {stats}"
+
+    def test_partial_fill_keeps_created_bookings(self, pool_client):
+        """Test bookings created alongside a failed one are still owned and deleted on close"""
+        payloads = iter([BookingTestData.valid_booking(), {'firstname': 'Broken'}, BookingTestData.valid_booking()])
+        pool = BookingLeasePool(pool_client, size=3, booking_data_factory=lambda: next(payloads))
+
+        with pytest.raises(Exception, match="1 of 3"):
+            pool.fill()
+        created = [pool.lease().booking_id for _ in range(2)]
+        pool.close()
+
+        assert not any(pool_client.booking_exists(booking_id) for booking_id in created), \
+            "Bookings from a partly failed fill should be deleted on close"
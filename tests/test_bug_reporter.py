@@ -0,0 +1,83 @@
+import json
+import pytest
+from utils.bug_reporter import BugReporter
+
+FILTER_TEST = "test_filter_by_firstname"
+
+
+def filter_failure(booking_id: int, status: int = 404) -> str:
+    return (f"Exception: Failed to get booking {booking_id}: {status} - Not Found "
+            f"at 2026-01-0{booking_id % 9 + 1}T10:00:00Z (request {booking_id:08x}-1234-5678-9abc-def012345678)")
+
+
+@pytest.mark.regression
+class TestBugFingerprints:
+    """Test repeat failures group into one bug while distinct failures stay apart"""
+
+    @pytest.mark.parametrize("first, second", [
+        (filter_failure(12), filter_failure(4031)),
+        ("GET /booking/12 returned 500", "GET /booking/13 returned 500"),
+        ("{'bookingid': 12, 'booking': {}}", "{'bookingid': 4031, 'booking': {}}"),
+        ("DELETE with booking_id=12 failed", "DELETE with booking_id=13 failed"),
+        ("AssertionError: Booking 12 not found in results\nassert 12 in [1, 2, 3]",
+         "AssertionError: Booking 7 not found in results\nassert 7 in [4, 5, 6, 8, 9]"),
+    ])
+    def test_volatile_parts_grouped(self, first, second):
+        """Test messages differing only in ids, UUIDs and timestamps share a fingerprint"""
+        assert BugReporter.fingerprint("Data Filtering", first) == BugReporter.fingerprint("Data Filtering", second)
+
+    @pytest.mark.parametrize("first, second", [
+        ("assert 3 == 5", "assert 0 == 5"),
+        (filter_failure(12, 404), filter_failure(12, 500)),
+        ("Expected 3 bookings, got 2", "Expected 3 bookings, got 0"),
+        ("Exception: Failed to create booking: 500 - Internal Server Error",
+         "Exception: Failed to create booking: 400 - Internal Server Error"),
+        ("Exception: Failed to get booking IDs: 500 - Error", "Exception: Failed to get booking IDs: 404 - Error"),
+    ])
+    def test_distinct_failures_not_grouped(self, first, second):
+        """Test status codes, counts and assertion operands keep failures apart"""
+        assert BugReporter.fingerprint("Data Filtering", first) != BugReporter.fingerprint("Data Filtering", second)
+
+    def test_repeats_counted_on_one_bug(self):
+        """Test a repeated failure updates the existing bug instead of adding a row"""
+        reporter = BugReporter()
+        first_id = reporter.add_auto_detected_bug(f"{FILTER_TEST}[a]", filter_failure(12))
+        second_id = reporter.add_auto_detected_bug(f"{FILTER_TEST}[b]", filter_failure(13))
+        reporter.add_auto_detected_bug(FILTER_TEST, "assert 3 == 5")
+
+        assert first_id == second_id
+        assert len(reporter.bugs) == 2, f"Expected two bugs, got {[bug['actual'] for bug in reporter.bugs]}"
+        assert reporter.bugs[0]["occurrences"] == 2
+        assert reporter.bugs[0]["sample_tests"] == [f"{FILTER_TEST}[a]", f"{FILTER_TEST}[b]"]
+
+
+@pytest.mark.regression
+class TestBugShards:
+    """Test per-worker bug shards merge into one grouped report"""
+
+    def test_merge_shards(self, tmp_path):
+        """Test shards merge with regrouped bugs, summed occurrences and fresh sequential ids"""
+        gw0 = BugReporter(shard_path=str(tmp_path / "gw0.jsonl"))
+        gw1 = BugReporter(shard_path=str(tmp_path / "gw1.jsonl"))
+        gw0.add_auto_detected_bug(FILTER_TEST, filter_failure(12))
+        gw1.add_auto_detected_bug(FILTER_TEST, filter_failure(13))
+        gw1.add_auto_detected_bug(FILTER_TEST, "assert 3 == 5")
+
+        merged = BugReporter.merge_shards(str(tmp_path))
+
+        assert [bug["id"] for bug in merged.bugs] == ["BUG-001", "BUG-002"]
+        assert [bug["occurrences"] for bug in merged.bugs] == [2, 1]
+
+    def test_merge_skips_truncated_last_line(self, tmp_path):
+        """Test a worker that died mid-write does not break the merge"""
+        shard = tmp_path / "gw0.jsonl"
+        worker = BugReporter(shard_path=str(shard))
+        worker.add_auto_detected_bug(FILTER_TEST, filter_failure(12))
+        record = json.dumps(worker.bugs[0])
+        with open(shard, "a", encoding="utf-8") as f:
+            f.write(record[:len(record) // 2])
+
+        merged = BugReporter.merge_shards(str(tmp_path))
+
+        assert len(merged.bugs) == 1
+        assert merged.bugs[0]["occurrences"] == 1
@@ -0,0 +1,45 @@
+import pytest
+from tests.data.test_data import BookingTestData
+from utils.assertions import APIAssertions
+
+
+@pytest.mark.booking
+@pytest.mark.concurrent
+class TestBulkOperations:
+    """Test bulk booking operations with bounded parallelism"""
+
+    def test_bulk_create_and_get_preserve_order(self, api_client, booking_batch_factory):
+        """Test bulk create and get return results in input order"""
+        payloads = [BookingTestData.valid_booking() for _ in range(12)]
+        created = booking_batch_factory(payloads)
+
+        booking_ids = [booking_response.bookingid for booking_response, _ in created]
+        results = api_client.get_bookings(booking_ids)
+
+        assert [r.item for r in results] == booking_ids, "Bulk get results are not in input order"
+        for result, payload in zip(results, payloads):
+            assert result.ok, f"Bulk get failed for booking {result.item}: {result.error}"
+            APIAssertions.assert_booking_equality(payload, result.result)
+
+    def test_bulk_update(self, api_client, booking_batch_factory):
+        """Test bulk update applies every payload"""
+        created = booking_batch_factory([BookingTestData.valid_booking() for _ in range(5)])
+        updates = [(booking_response.bookingid, BookingTestData.updated_booking_data(original))
+                   for booking_response, original in created]
+
+        results = api_client.update_bookings(updates)
+
+        for result, (_, updated_data) in zip(results, updates):
+            assert result.ok, f"Bulk update failed for booking {result.item[0]}: {result.error}"
+            APIAssertions.assert_booking_equality(updated_data, result.result)
+
+    def test_bulk_errors_are_reported_per_item(self, api_client, booking_batch_factory):
+        """Test one missing booking does not fail the whole batch"""
+        created = booking_batch_factory([BookingTestData.valid_booking() for _ in range(3)])
+        booking_ids = [booking_response.bookingid for booking_response, _ in created]
+        missing_id = max(api_client.get_all_booking_ids()) + 1_000_000
+
+        results = api_client.get_bookings(booking_ids[:1] + [missing_id] + booking_ids[1:])
+
+        assert [r.ok for r in results] == [True, False, True, True], f"Unexpected per-item outcome: {results}"
+        assert "Failed to get booking" in str(results[1].error), f"Unexpected error: {results[1].error}"
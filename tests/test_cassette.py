@@ -0,0 +1,47 @@
+import pytest
+from clients.cassette import Cassette, request_key, shard_path
+
+
+@pytest.fixture
+def scope():
+    """Restore the cassette scope the test ran in after switching it"""
+    previous = Cassette.scope
+    yield Cassette.set_scope
+    Cassette.set_scope(previous)
+
+
+@pytest.mark.regression
+class TestCassette:
+    """Test cassette storage and scoped replay without any HTTP traffic"""
+
+    def test_scoped_replay_ignores_other_tests(self, tmp_path, scope):
+        """Test a test replays its own responses for a key other tests also requested"""
+        key = request_key('GET', 'http://booker/booking/1', None)
+        cassette = Cassette(str(tmp_path / "c.jsonl.gz"))
+        for test, status in (("test_a", 200), ("test_b", 404)):
+            scope(test)
+            cassette.record(key, status, {}, b'{}')
+        cassette.save()
+
+        replay = Cassette.load(cassette.path)
+        scope("test_b")
+        assert replay.replay(key)[0] == 404
+        scope("test_c")
+        assert replay.replay(key)[0] == 200, "Unknown scopes fall back to the whole cassette in order"
+
+    def test_merge_worker_shards(self, tmp_path, scope):
+        """Test per-worker shards merge into one cassette and are removed"""
+        path = str(tmp_path / "prod.jsonl.gz")
+        shards = [shard_path(path, worker) for worker in ("gw0", "gw1")]
+        assert shards[0].endswith("prod.gw0.jsonl.gz")
+        for index, shard in enumerate(shards):
+            scope(f"test_{index}")
+            cassette = Cassette(shard)
+            cassette.record(request_key('GET', f'http://booker/booking/{index}', None), 200, {}, b'{}')
+            cassette.save()
+
+        merged = Cassette.merge(path, shards, {'test_data_seed': '1'})
+
+        assert len(Cassette.load(path)) == len(merged) == 2
+        assert Cassette.read_metadata(path) == {'test_data_seed': '1'}
+        assert not any((tmp_path / name).exists() for name in ("prod.gw0.jsonl.gz", "prod.gw1.jsonl.gz"))
@@ -0,0 +1,74 @@
+import pytest
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from clients.in_memory_transport import build_response
+from config.environments import Config
+from tests.data.test_data import BookingTestData
+from utils.cleanup import BookingSweeper
+
+pytestmark = pytest.mark.skipif(Config.get_transport() != 'memory',
+                                reason="Sweeper bookkeeping is checked against the in-memory stand-in")
+
+
+class CountingDeletesAdapter(BaseAdapter):
+    """Wraps the real adapter, recording the path of every DELETE and failing the first `failures` with 500"""
+
+    def __init__(self, inner, failures: int = 0):
+        super().__init__()
+        self.inner = inner
+        self.failures = failures
+        self.deletes = []
+
+    def send(self, request, **kwargs):
+        if request.method == 'DELETE':
+            self.deletes.append(request.path_url)
+            if len(self.deletes) <= self.failures:
+                return build_response(request, 500, {'Content-Type': 'text/plain'}, b'Internal Server Error', self)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.fixture
+def sweeper_client(config):
+    """Booking client with its own circuit breaker state, counting the DELETEs it sends"""
+    client = BookingAPIClient(config, circuit_breaker=None)
+    client.mount(client.base_url, CountingDeletesAdapter(client.session.get_adapter(client.base_url)))
+    yield client
+    client.close()
+
+
+@pytest.mark.booking
+class TestBookingSweeper:
+    """Test cleanup deletes each booking once and only queues real failures"""
+
+    def test_bookings_deleted_by_the_test_are_skipped(self, config, sweeper_client):
+        """Test a booking the test already deleted, through any client, gets no second DELETE"""
+        own, other, elsewhere = (sweeper_client.create_booking(BookingTestData.valid_booking()).bookingid
+                                 for _ in range(3))
+        assert sweeper_client.delete_booking(own)
+        other_client = BookingAPIClient(config, circuit_breaker=None)
+        try:
+            assert other_client.delete_booking(elsewhere)
+        finally:
+            other_client.close()
+        sweeper = BookingSweeper(sweeper_client)
+
+        assert sweeper.delete([own, other, elsewhere]) == 0
+        assert sweeper.pending == set()
+        adapter = sweeper_client.session.get_adapter(sweeper_client.base_url)
+        assert adapter.deletes == [f"/booking/{own}", f"/booking/{other}"]
+        assert sweeper.sweep() == {'queued': 0, 'deleted': 0, 'already_gone': 0, 'leaked': 0}
+
+    def test_failed_delete_is_swept(self, sweeper_client):
+        """Test a rejected delete is queued and retried by the sweep"""
+        booking_id = sweeper_client.create_booking(BookingTestData.valid_booking()).bookingid
+        sweeper_client.mount(sweeper_client.base_url,
+                             CountingDeletesAdapter(sweeper_client.session.get_adapter(sweeper_client.base_url),
+                                                    failures=1))
+        sweeper = BookingSweeper(sweeper_client, backoff=0.01)
+
+        assert sweeper.delete([booking_id]) == 1
+        assert sweeper.sweep() == {'queued': 1, 'deleted': 1, 'already_gone': 0, 'leaked': 0}
+        assert not sweeper_client.booking_exists(booking_id)
@@ -1,9 +1,42 @@
 import pytest
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import BaseAdapter
 from clients.booking_client import BookingAPIClient
+from clients.in_memory_transport import build_response
+from clients.limiter import AIMDLimiter, RequestLimiter
+from clients.retry import RetryPolicy
+from config.environments import Config
 from tests.data.test_data import BookingTestData
 from utils.assertions import APIAssertions
-from utils.concurrency import ConcurrencyUtils
+from utils.concurrency import ConcurrencyUtils, LoadPhase
+
+
+class LimitedCapacityAdapter(BaseAdapter):
+    """Simulated backend answering 503 while more than `capacity` requests are in flight"""
+
+    def __init__(self, capacity: int):
+        super().__init__()
+        self.capacity = capacity
+        self.inflight = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.inflight += 1
+            overloaded = self.inflight > self.capacity
+        try:
+            time.sleep(0.002)
+            if overloaded:
+                return build_response(request, 503, {'Content-Type': 'text/plain'}, b'Service Unavailable', self)
+            return build_response(request, 201, {'Content-Type': 'text/plain'}, b'Created', self)
+        finally:
+            with self._lock:
+                self.inflight -= 1
+
+    def close(self):
+        pass
 
 
 @pytest.mark.concurrent
@@ -70,3 +103,43 @@ class TestConcurrentOperations:
         assert final_booking is not None
         APIAssertions.assert_booking_structure(final_booking)
         APIAssertions.assert_booking_equality(final_booking, updated_data)
+
+    @pytest.mark.load
+    def test_open_model_booking_mix(self, api_client, booking_batch_factory, request):
+        """Test a short ramped load of mixed booking operations completes without errors"""
+        if Config.get_transport() != 'memory' and not request.config.getoption("--load-test"):
+            pytest.skip("Load test against a real backend disabled - enable with --load-test")
+        seeded = booking_batch_factory([BookingTestData.valid_booking() for _ in range(5)])
+        booking_ids = [booking_response.bookingid for booking_response, _ in seeded]
+
+        operations = {
+            'get_booking': (6, lambda: api_client.get_booking_by_id(booking_ids[0])),
+            'filter_by_name': (2, lambda: api_client.filter_bookings_by_name(firstname=seeded[1][1]['firstname'])),
+            'update_booking': (1, lambda: api_client.update_booking(booking_ids[2], seeded[2][1])),
+            'ping': (1, api_client.ping_health_check),
+        }
+        phases = [LoadPhase(1, 0, 10), LoadPhase(2, 10), LoadPhase(1, 10, 0)]
+
+        report = ConcurrencyUtils.run_load(operations, phases, max_workers=16, seed=42)
+        summary = report.summary()
+
+        completed = sum(stats['count'] for stats in summary.values())
+        assert completed + sum(report.errors.values()) == report.scheduled, f"Lost requests: {summary}"
+        assert not report.errors, f"Errors under load: {report.errors}"
+
+    def test_adaptive_limiter_backs_off_overloaded_backend(self, config):
+        """Test the AIMD limiter settles near backend capacity instead of flooding it"""
+        limiter = RequestLimiter(AIMDLimiter(initial=16, max_limit=32))
+        client = BookingAPIClient(config, retry_policy=RetryPolicy(retries=0), limiter=limiter,
+                                  circuit_breaker=None)
+        client.mount(client.base_url, LimitedCapacityAdapter(capacity=4))
+
+        try:
+            results = ConcurrencyUtils.run_bounded(lambda _: client.get('/ping').status_code,
+                                                   range(600), max_workers=32)
+        finally:
+            client.close()
+
+        statuses = [r.result for r in results]
+        assert statuses.count(201) > len(statuses) * 0.6, f"Too many rejected requests: {statuses.count(503)}"
+        assert limiter.concurrency.limit <= 8, f"Limit did not back off: {limiter.concurrency.limit}"
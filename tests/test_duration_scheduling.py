@@ -0,0 +1,151 @@
+from collections import OrderedDict
+import pytest
+import plugins.duration_scheduling as duration_scheduling
+from plugins.duration_scheduling import (CACHE_KEY, DurationStore, base_nodeid,
+                                         pytest_collection_modifyitems, pytest_xdist_make_scheduler)
+
+
+class FakeCache:
+    """Dict-backed stand-in for config.cache"""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+
+    def get(self, key, default):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+class FakePluginManager:
+    def __init__(self):
+        self.plugins = {}
+
+    def get_plugin(self, name):
+        return self.plugins.get(name)
+
+
+class FakeConfig:
+    """Just enough of pytest's config for the plugin: options, ini, cache and plugins"""
+
+    def __init__(self, durations=None, worker=False):
+        self.cache = FakeCache({CACHE_KEY: durations} if durations else {})
+        self.pluginmanager = FakePluginManager()
+        if worker:
+            self.workerinput = {'workerid': 'gw0'}
+
+    def getoption(self, name):
+        return name == "dist_durations"
+
+    def getvalue(self, name):
+        return ["2*popen"] if name == "tx" else None
+
+    def getini(self, name):
+        return ["booking_mirror"] if name == "duration_group_fixtures" else []
+
+
+class FakeItem:
+    def __init__(self, nodeid, fixturenames=(), group=None):
+        self._nodeid = nodeid
+        self.fixturenames = list(fixturenames)
+        self.group = group
+
+    @property
+    def nodeid(self):
+        return self._nodeid
+
+    def get_closest_marker(self, name):
+        return pytest.mark.xdist_group(self.group).mark if name == "xdist_group" and self.group else None
+
+
+class FakeReport:
+    def __init__(self, nodeid, duration):
+        self.nodeid = nodeid
+        self.duration = duration
+
+
+class FakeNode:
+    """Worker node recording which collection indexes it was told to run"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_runtest_some(self, indexes):
+        self.sent.append(indexes)
+
+
+@pytest.mark.regression
+class TestDurationScheduling:
+    """Test duration bookkeeping and longest-first ordering without starting xdist"""
+
+    @pytest.mark.parametrize("nodeid, expected", [
+        ("tests/t.py::test_a@booking_mirror", "tests/t.py::test_a"),
+        ("tests/t.py::test_b[x@y]", "tests/t.py::test_b[x@y]"),
+        ("tests/t.py::test_b[x@y]@slow", "tests/t.py::test_b[x@y]"),
+        ("tests/t.py::test_c", "tests/t.py::test_c"),
+    ])
+    def test_base_nodeid(self, nodeid, expected):
+        """Test only a group suffix after the parameter brackets is stripped"""
+        assert base_nodeid(nodeid) == expected
+
+    def test_grouped_items_are_tagged(self):
+        """Test tests using a group fixture or xdist_group mark get an '@group' suffix, once"""
+        items = [FakeItem("t.py::test_mirror", fixturenames=["api_client", "booking_mirror"]),
+                 FakeItem("t.py::test_marked", group="slow"),
+                 FakeItem("t.py::test_plain", fixturenames=["api_client"])]
+        config = FakeConfig(worker=True)
+
+        pytest_collection_modifyitems(None, config, items)
+        pytest_collection_modifyitems(None, config, items)
+
+        assert [item.nodeid for item in items] == ["t.py::test_mirror@booking_mirror",
+                                                   "t.py::test_marked@slow",
+                                                   "t.py::test_plain"]
+
+    def test_store_blends_new_durations(self):
+        """Test a rerun test moves halfway to its new duration and a new test is stored as measured"""
+        config = FakeConfig(durations={"t.py::test_a": 4.0})
+        store = DurationStore(config)
+        for report in (FakeReport("t.py::test_a@grp", 0.5), FakeReport("t.py::test_a@grp", 1.5),
+                       FakeReport("t.py::test_b", 1.5)):
+            store.pytest_runtest_logreport(report)
+
+        store.pytest_sessionfinish(None)
+
+        assert config.cache.values[CACHE_KEY] == {"t.py::test_a": 3.0, "t.py::test_b": 1.5}
+
+    def test_unknown_tests_estimated_at_median(self, monkeypatch):
+        """Test unseen tests get the median known duration, computed once rather than per lookup"""
+        calls = []
+
+        def counting_median(values):
+            calls.append(1)
+            return sorted(values)[len(values) // 2]
+
+        monkeypatch.setattr(duration_scheduling, "median", counting_median)
+        store = DurationStore(FakeConfig(durations={"a": 1.0, "b": 2.0, "c": 9.0}))
+
+        assert [store.estimate(f"new_{i}") for i in range(50)] == [2.0] * 50
+        assert store.estimate("c@grp") == 9.0
+        assert len(calls) == 1
+
+    def test_units_assigned_longest_first(self):
+        """Test the scheduler hands out the unit with the largest summed estimate first"""
+        config = FakeConfig(durations={"t.py::test_a": 1.0, "t.py::test_b": 2.0,
+                                       "t.py::test_c": 2.5, "t.py::test_d": 3.0})
+        config.pluginmanager.plugins["duration_store"] = DurationStore(config)
+        scheduler = pytest_xdist_make_scheduler(config, None)
+
+        collection = ["t.py::test_a", "t.py::test_b@booking_mirror", "t.py::test_c@booking_mirror", "t.py::test_d"]
+        node = FakeNode()
+        scheduler.registered_collections[node] = collection
+        for nodeid in collection:
+            scope = scheduler._split_scope(nodeid)
+            scheduler.workqueue.setdefault(scope, OrderedDict())[nodeid] = False
+
+        while scheduler.workqueue:
+            scheduler._assign_work_unit(node)
+
+        assert list(scheduler.assigned_work[node]) == ["booking_mirror", "t.py::test_d", "t.py::test_a"]
+        assert node.sent == [[1, 2], [3], [0]]
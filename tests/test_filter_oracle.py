@@ -0,0 +1,50 @@
+import pytest
+from utils.filter_oracle import FilterOracle
+
+
+def booking(firstname, lastname, checkin, checkout):
+    return {'firstname': firstname, 'lastname': lastname,
+            'bookingdates': {'checkin': checkin, 'checkout': checkout}}
+
+
+@pytest.fixture
+def oracle():
+    """Small snapshot with one malformed checkin and one booking without a firstname"""
+    return FilterOracle.from_bookings([
+        (1, booking('Ann', 'Lee', '2026-01-01', '2026-01-05')),
+        (2, booking('Bob', 'Lee', '2026-02-01', '2026-02-03')),
+        (3, booking('Ann', 'Kim', 'not-a-date', '2026-03-02')),
+        (4, booking(None, 'Kim', '2026-03-01', '2026-03-04')),
+    ])
+
+
+@pytest.mark.regression
+class TestFilterOracle:
+    """Test the vectorized filter oracle against hand-computed answers"""
+
+    def test_malformed_stored_date_never_matches(self, oracle):
+        """Test a booking with an unparseable checkin only matches queries without a checkin"""
+        results = oracle.expected_many([{'checkin': '2026-01-15'}, {'lastname': 'Kim'}, {'firstname': 'Ann'}])
+
+        assert [r.tolist() for r in results] == [[2, 4], [3, 4], [1, 3]]
+
+    def test_malformed_query_date_keeps_batch(self, oracle):
+        """Test one unparseable checkin in a batch still yields an answer for every query"""
+        results = oracle.expected_many([{'checkin': '2026-01-15'}, {'checkin': '15/01/2026'}, {'lastname': 'Lee'}])
+
+        assert [r.tolist() for r in results] == [[2, 4], [], [1, 2]]
+
+    def test_name_and_date_filters_combine(self, oracle):
+        """Test names match exactly and dates match on or after the filter"""
+        assert oracle.expected(lastname='Lee', checkout='2026-01-10').tolist() == [2]
+        assert oracle.expected(firstname='Ann', checkin='2026-01-01').tolist() == [1]
+
+    def test_malformed_query_date_matches_nothing(self, oracle):
+        """Test an unparseable query date behaves like an unparseable stored date"""
+        assert oracle.expected(checkout='2026-13-45').tolist() == []
+        assert oracle.expected(checkin='garbage').tolist() == []
+
+    def test_missing_name_is_not_the_string_none(self, oracle):
+        """Test a booking without a firstname is not matched by firstname='None'"""
+        assert oracle.expected(firstname='None').tolist() == []
+        assert 'None' not in {q.get('firstname') for q in oracle.generate_queries(50, seed=1)}
@@ -1,4 +1,36 @@
+import time
 import pytest
+import requests
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class RaisingAdapter(BaseAdapter):
+    """Wraps the real adapter, raising `error` for the first request only"""
+
+    def __init__(self, inner, error: Exception):
+        super().__init__()
+        self.inner = inner
+        self.error = error
+
+    def send(self, request, **kwargs):
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.fixture
+def breaker_client(config):
+    """Booking client with its own circuit breaker, so tripping it does not affect other tests"""
+    client = BookingAPIClient(config, circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.2))
+    yield client
+    client.close()
+
 
 @pytest.mark.smoke
 @pytest.mark.health
@@ -9,3 +41,33 @@ class TestHealthEndpoint:
         """Test the /ping health check endpoint"""
         is_healthy = api_client.ping_health_check()
         assert is_healthy, "API health check failed - service may be down"
+
+    def test_open_circuit_fails_fast(self, breaker_client):
+        """Test requests fail immediately while the circuit is open, then recover after the reset timeout"""
+        breaker_client.circuit_breaker.trip("simulated outage")
+
+        started = time.perf_counter()
+        with pytest.raises(CircuitOpenError):
+            breaker_client.get_booking_ids()
+        assert time.perf_counter() - started < 0.05, "Open circuit should fail without a network call"
+        assert not breaker_client.ping_health_check(), "Health check should report the open circuit"
+
+        time.sleep(0.25)
+        assert breaker_client.ping_health_check(), "Probe after the reset timeout should close the circuit"
+        assert breaker_client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.parametrize("error", [requests.exceptions.TooManyRedirects("redirect loop"),
+                                       RuntimeError("client bug")],
+                             ids=["too-many-redirects", "non-requests-error"])
+    def test_inconclusive_probe_does_not_wedge_circuit(self, breaker_client, error):
+        """Test a half-open probe that fails with a non-connection error lets a later probe through"""
+        breaker_client.circuit_breaker.trip("simulated outage")
+        time.sleep(0.25)
+        inner = breaker_client.session.get_adapter(breaker_client.base_url)
+        breaker_client.mount(breaker_client.base_url, RaisingAdapter(inner, error))
+
+        with pytest.raises(type(error)):
+            breaker_client.get_booking_ids()
+
+        assert breaker_client.ping_health_check(), "Next request should be let through as the probe"
+        assert breaker_client.circuit_breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,84 @@
+import pytest
+from clients.limiter import AIMDLimiter, RequestLimiter, TokenBucket
+
+
+def settle(limiter: AIMDLimiter, key: str, latency: float, status, count: int):
+    """Send `count` sequential requests that all end with the same outcome"""
+    for _ in range(count):
+        limiter.acquire()
+        limiter.release(key, latency, status)
+
+
+@pytest.mark.concurrent
+class TestAIMDLimiter:
+    """Test the additive-increase / multiplicative-decrease concurrency limit"""
+
+    def test_successes_grow_limit_additively(self):
+        """Test fast successful responses raise the limit by about one per window"""
+        limiter = AIMDLimiter(initial=4, max_limit=32)
+        settle(limiter, "GET /booking", 0.01, 200, 4)
+        assert limiter.limit == 4
+        settle(limiter, "GET /booking", 0.01, 200, 40)
+        assert 8 <= limiter.limit < 12, f"Unexpected limit after 44 successes: {limiter.limit}"
+
+    @pytest.mark.parametrize("status", [429, 503, None], ids=["429", "503", "error"])
+    def test_overload_halves_limit(self, status):
+        """Test an overload response or a connection error cuts the limit by the backoff ratio"""
+        limiter = AIMDLimiter(initial=16, max_limit=32)
+        settle(limiter, "GET /booking", 0.01, status, 1)
+        assert limiter.limit == 8
+
+    def test_one_cut_per_window(self):
+        """Test responses to requests sent before the last cut do not cut again"""
+        limiter = AIMDLimiter(initial=16, max_limit=32)
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release("GET /booking", 10.0, 503)
+        assert limiter.limit == 8
+
+    def test_limit_stays_within_bounds(self):
+        """Test the limit never leaves [min_limit, max_limit]"""
+        limiter = AIMDLimiter(initial=4, min_limit=2, max_limit=6)
+        settle(limiter, "GET /booking", 0.01, 200, 200)
+        assert limiter.limit == 6
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release("GET /booking", 0.0, 503)
+        assert limiter.limit == 2
+
+    def test_latency_shift_is_rebaselined(self):
+        """Test a lasting latency shift cuts the limit briefly, then becomes the new baseline"""
+        limiter = AIMDLimiter(initial=10, max_limit=32, min_samples=5)
+        settle(limiter, "GET /booking", 0.1, 200, 20)
+        before = limiter.limit
+
+        settle(limiter, "GET /booking", 0.5, 200, 200)
+
+        assert limiter.limit > before, f"Limit should grow again at the new latency, got {limiter.limit}"
+
+    def test_server_errors_do_not_grow_or_cut(self):
+        """Test 5xx responses other than 503 leave the limit unchanged"""
+        limiter = AIMDLimiter(initial=4)
+        settle(limiter, "GET /booking", 0.01, 500, 20)
+        assert limiter.limit == 4
+
+
+@pytest.mark.concurrent
+class TestRequestLimiter:
+    """Test the combined concurrency and rate controls"""
+
+    def test_try_acquire_respects_concurrency(self):
+        """Test try_acquire admits up to the limit and never waits"""
+        limiter = RequestLimiter(AIMDLimiter(initial=2, max_limit=2))
+        assert limiter.try_acquire() and limiter.try_acquire()
+        assert not limiter.try_acquire()
+        limiter.release("GET /booking", 0.01, 200)
+        assert limiter.try_acquire()
+
+    def test_try_acquire_gives_slot_back_when_rate_capped(self):
+        """Test a request refused by the rate cap does not hold a concurrency slot"""
+        limiter = RequestLimiter(AIMDLimiter(initial=2, max_limit=2), TokenBucket(rate=0.001, burst=1))
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.concurrency.inflight == 1
@@ -0,0 +1,119 @@
+import threading
+from types import SimpleNamespace
+import pytest
+import utils.metrics as metrics
+from utils.metrics import BusyClock, LatencyHistogram, LatencyRecorder, endpoint_template, network_clock
+
+
+class FakeClock:
+    """perf_counter stand-in moved by hand"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace perf_counter inside utils.metrics only"""
+    fake = FakeClock()
+    monkeypatch.setattr(metrics, "time", SimpleNamespace(perf_counter=fake))
+    return fake
+
+
+@pytest.mark.regression
+class TestLatencyMetrics:
+    """Test latency bucketing, endpoint templating and busy-time accounting"""
+
+    @pytest.mark.parametrize("endpoint, template", [
+        ("/booking/12", "/booking/{id}"),
+        ("/booking/12?firstname=Sally", "/booking/{id}"),
+        ("/booking/1/items/3f2b6c1e-0d4a-4b7e-9c2d-5e6f7a8b9c0d", "/booking/{id}/items/{id}"),
+        ("/booking?checkin=2024-01-01", "/booking"),
+        ("/v2/booking", "/v2/booking"),
+    ])
+    def test_endpoint_template(self, endpoint, template):
+        """Test numeric and UUID path segments collapse to {id}, and nothing else does"""
+        assert endpoint_template(endpoint) == template
+
+    def test_percentiles_within_bucket_error(self):
+        """Test percentiles land within one bucket (~2%) of the exact value"""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        for pct, exact in ((50, 0.5), (90, 0.9), (99, 0.99)):
+            assert histogram.percentile(pct) == pytest.approx(exact, rel=LatencyHistogram.GROWTH - 1)
+        assert histogram.percentile(100) == histogram.max == 1.0
+        assert histogram.percentile(0.01) == histogram.min == 0.001
+        assert histogram.summary()['count'] == 1000
+
+    def test_out_of_range_values_are_clamped(self):
+        """Test tiny and huge values fall into the edge buckets and report their real extremes"""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(10_000.0)
+
+        assert histogram.counts[0] == 1 and histogram.counts[-1] == 1
+        assert histogram.percentile(50) == 0.0
+        assert histogram.percentile(100) == 10_000.0
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_merge_adds_counts(self):
+        """Test merging two histograms matches recording everything into one"""
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i, value in enumerate((0.01, 0.02, 0.2, 0.5, 1.5)):
+            (left if i % 2 else right).record(value)
+            combined.record(value)
+
+        left.merge(right)
+
+        assert left.counts == combined.counts
+        assert left.summary() == combined.summary()
+
+    def test_recorder_buckets_by_method_and_template(self):
+        """Test ids share one histogram per method, thread-safely"""
+        recorder = LatencyRecorder()
+        threads = [threading.Thread(target=recorder.record, args=(method, f"/booking/{i}", 0.01))
+                   for i in range(20) for method in ("get", "PUT")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorder.record("GET", "/booking", 0.05)
+
+        snapshot = recorder.snapshot()
+        assert list(snapshot) == ["GET /booking", "GET /booking/{id}", "PUT /booking/{id}"]
+        assert snapshot["GET /booking/{id}"]["count"] == 20
+        assert recorder.histogram("get", "/booking/99").count == 20
+        recorder.reset()
+        assert recorder.snapshot() == {}
+
+    def test_busy_clock_counts_overlap_once(self, clock):
+        """Test overlapping operations add their union, not their sum"""
+        busy = BusyClock()
+        busy.enter()
+        clock.now += 1.0
+        busy.enter()
+        clock.now += 2.0
+        busy.exit()
+        clock.now += 1.0
+        assert busy.elapsed() == pytest.approx(4.0), "An operation still in flight counts up to now"
+        busy.exit()
+        clock.now += 5.0
+        busy.enter()
+        clock.now += 0.5
+        busy.exit()
+
+        assert busy.elapsed() == pytest.approx(4.5)
+
+    def test_network_clock_tracks_client_requests(self, api_client):
+        """Test the shared clock advances while a client request is in flight and stops after"""
+        before = network_clock.elapsed()
+        api_client.get_booking_ids()
+        after = network_clock.elapsed()
+
+        assert after > before
+        assert network_clock.elapsed() == after
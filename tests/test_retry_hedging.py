@@ -0,0 +1,170 @@
+import threading
+import time
+import pytest
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from clients.cassette import Cassette
+from clients.in_memory_transport import build_response
+from clients.limiter import AIMDLimiter, RequestLimiter
+from clients.retry import HedgePolicy, RetryPolicy
+from config.environments import Config
+from tests.data.test_data import BookingTestData
+from utils.assertions import APIAssertions
+
+
+class FaultyAdapter(BaseAdapter):
+    """Wraps the real adapter, answering the first `failures` requests with 503 and delaying the first `slow` ones"""
+
+    def __init__(self, inner, failures: int = 0, slow: int = 0, delay: float = 0.0):
+        super().__init__()
+        self.inner = inner
+        self.failures = failures
+        self.slow = slow
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call <= self.failures:
+            return build_response(request, 503, {'Content-Type': 'text/plain'}, b'Service Unavailable', self)
+        if call <= self.slow:
+            time.sleep(self.delay)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+requires_hedging = pytest.mark.skipif(bool(Config.get_cassette_settings()['mode']),
+                                      reason="Hedging is off while a cassette records or replays")
+
+
+class SlowThenFailingAdapter(BaseAdapter):
+    """Wraps the real adapter, delaying the first request and answering every later one with 503"""
+
+    def __init__(self, inner, delay: float):
+        super().__init__()
+        self.inner = inner
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call > 1:
+            return build_response(request, 503, {'Content-Type': 'text/plain'}, b'Service Unavailable', self)
+        time.sleep(self.delay)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.fixture
+def resilient_client(config):
+    """Booking client with fast retries and a fixed hedge delay; injected faults stay off the shared breaker"""
+    client = BookingAPIClient(config, retry_policy=RetryPolicy(retries=2, backoff=0.01),
+                              hedge_policy=HedgePolicy(delay=0.2), circuit_breaker=None)
+    yield client
+    client.close()
+
+
+def inject_faults(client, **faults) -> FaultyAdapter:
+    adapter = FaultyAdapter(client.session.get_adapter(client.base_url), **faults)
+    client.mount(client.base_url, adapter)
+    return adapter
+
+
+@pytest.mark.booking
+class TestRetryAndHedging:
+    """Test retries with backoff and hedged reads"""
+
+    def test_get_retried_after_unavailable(self, resilient_client, standard_booking):
+        """Test an idempotent read succeeds after transient 503 responses"""
+        booking_response, booking_data = standard_booking
+        adapter = inject_faults(resilient_client, failures=2)
+
+        booking = resilient_client.get_booking_by_id(booking_response.bookingid)
+
+        APIAssertions.assert_booking_equality(booking_data, booking)
+        assert adapter.calls == 3, f"Expected two retries, saw {adapter.calls} calls"
+
+    def test_post_not_retried(self, resilient_client):
+        """Test non-idempotent requests are sent once and surface the failure"""
+        adapter = inject_faults(resilient_client, failures=1)
+
+        with pytest.raises(Exception, match="503"):
+            resilient_client.create_booking(BookingTestData.valid_booking())
+        assert adapter.calls == 1, f"POST should not be retried, saw {adapter.calls} calls"
+
+    def test_retry_budget_stops_retries(self, config, standard_booking):
+        """Test an exhausted retry budget turns retries off"""
+        client = BookingAPIClient(config, retry_policy=RetryPolicy(retries=2, backoff=0.01), circuit_breaker=None)
+        while client.retry_policy.budget.withdraw():
+            pass
+        adapter = inject_faults(client, failures=1)
+        try:
+            with pytest.raises(Exception, match="503"):
+                client.get_booking_by_id(standard_booking[0].bookingid)
+            assert adapter.calls == 1, f"Budget should block retries, saw {adapter.calls} calls"
+        finally:
+            client.close()
+
+    @requires_hedging
+    def test_slow_get_is_hedged(self, resilient_client, standard_booking):
+        """Test a GET stuck behind a slow response is answered by the hedged copy"""
+        booking_response, booking_data = standard_booking
+        adapter = inject_faults(resilient_client, slow=1, delay=2.0)
+
+        started = time.perf_counter()
+        booking = resilient_client.get_booking_by_id(booking_response.bookingid)
+        elapsed = time.perf_counter() - started
+
+        APIAssertions.assert_booking_equality(booking_data, booking)
+        assert adapter.calls == 2, f"Expected a hedged second request, saw {adapter.calls} calls"
+        assert elapsed < 1.5, f"Hedged read took {elapsed:.2f}s"
+
+    @pytest.mark.parametrize("settings", [
+        {'retry_policy': None},
+        {'limiter': RequestLimiter(AIMDLimiter(initial=1, max_limit=1))},
+    ], ids=["no-retry-budget", "limiter-full"])
+    def test_hedge_skipped_without_capacity(self, config, standard_booking, settings):
+        """Test no hedged copy is sent without a retry budget or a free limiter slot"""
+        policies = {'retry_policy': RetryPolicy(retries=2, backoff=0.01), 'hedge_policy': HedgePolicy(delay=0.1),
+                    'circuit_breaker': None}
+        policies.update(settings)
+        client = BookingAPIClient(config, **policies)
+        adapter = inject_faults(client, slow=1, delay=0.5)
+        try:
+            client.get_booking_by_id(standard_booking[0].bookingid)
+            assert adapter.calls == 1, f"Hedge should be skipped, saw {adapter.calls} calls"
+        finally:
+            client.close()
+
+    @requires_hedging
+    def test_hedged_failure_does_not_beat_slow_success(self, resilient_client, standard_booking):
+        """Test a fast 503 from the hedged copy loses to the slower successful primary"""
+        booking_response, booking_data = standard_booking
+        adapter = SlowThenFailingAdapter(resilient_client.session.get_adapter(resilient_client.base_url), delay=0.5)
+        resilient_client.mount(resilient_client.base_url, adapter)
+
+        booking = resilient_client.get_booking_by_id(booking_response.bookingid)
+
+        APIAssertions.assert_booking_equality(booking_data, booking)
+        assert adapter.calls == 2, f"Primary should win without a retry, saw {adapter.calls} calls"
+
+    def test_no_hedging_while_recording(self, resilient_client, standard_booking, tmp_path):
+        """Test a cassette records one interaction per read instead of both hedged copies"""
+        adapter = inject_faults(resilient_client, slow=1, delay=0.5)
+        cassette = Cassette(str(tmp_path / "hedge.jsonl.gz"))
+        resilient_client.use_cassette(cassette, 'record')
+
+        resilient_client.get_booking_by_id(standard_booking[0].bookingid)
+
+        assert adapter.calls == 1, f"Hedging should be off while recording, saw {adapter.calls} calls"
+        assert len(cassette) == 1
@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+import pytest
+from requests.adapters import BaseAdapter
+from clients.booking_client import BookingAPIClient
+from clients.in_memory_transport import build_response
+from config.environments import Config
+from utils.token_cache import TokenCache
+
+
+class CountingFetch:
+    """Token source handing out token-1, token-2, ... and counting calls"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            return f"token-{self.calls}"
+
+
+class RejectFirstTokenAdapter(BaseAdapter):
+    """Wraps the real adapter, answering requests carrying one token with 403"""
+
+    def __init__(self, inner, token: str):
+        super().__init__()
+        self.inner = inner
+        self.token = token
+        self.rejected = 0
+
+    def send(self, request, **kwargs):
+        if f"token={self.token}" in request.headers.get('Cookie', ''):
+            self.rejected += 1
+            return build_response(request, 403, {'Content-Type': 'text/plain'}, b'Forbidden', self)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+@pytest.mark.auth
+class TestTokenCache:
+    """Test the shared auth token: one fetch per expiry, across threads and processes"""
+
+    def test_concurrent_callers_share_one_fetch(self, tmp_path):
+        """Test threads racing for an empty cache trigger a single fetch"""
+        cache = TokenCache(str(tmp_path / "token.json"))
+        fetch = CountingFetch(delay=0.05)
+        tokens = []
+
+        threads = [threading.Thread(target=lambda: tokens.append(cache.get(fetch))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetch.calls == 1
+        assert tokens == ["token-1"] * 8
+
+    def test_file_lock_shares_token_between_caches(self, tmp_path):
+        """Test a second cache on the same file (another xdist worker) reuses the stored token"""
+        path = str(tmp_path / "token.json")
+        fetch = CountingFetch()
+
+        assert TokenCache(path).get(fetch) == "token-1"
+        assert TokenCache(path).get(fetch) == "token-1"
+        assert fetch.calls == 1
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_expired_token_is_refetched(self, tmp_path):
+        """Test a token past its TTL is replaced, in memory and on disk"""
+        path = str(tmp_path / "token.json")
+        fetch = CountingFetch()
+        cache = TokenCache(path, ttl=0.05)
+
+        assert cache.get(fetch) == "token-1"
+        time.sleep(0.1)
+        assert cache.get(fetch) == "token-2"
+        assert TokenCache(path).get(fetch) == "token-2"
+
+    def test_invalidate_only_drops_the_rejected_token(self, tmp_path):
+        """Test invalidating a token someone already replaced keeps the replacement"""
+        path = str(tmp_path / "token.json")
+        fetch = CountingFetch()
+        cache = TokenCache(path)
+
+        cache.get(fetch)
+        cache.invalidate("token-1")
+        assert not os.path.exists(path)
+        assert cache.get(fetch) == "token-2"
+
+        cache.invalidate("token-1")
+        assert cache.get(fetch) == "token-2"
+        assert fetch.calls == 2
+
+    def test_shared_refuses_directory_open_to_others(self, tmp_path):
+        """Test an existing token directory is only used when we own it and it is 0700"""
+        directory = tmp_path / "tokens"
+        directory.mkdir(mode=0o755)
+        os.chmod(directory, 0o755)
+        with pytest.raises(PermissionError, match="mode 755"):
+            TokenCache.shared(f"{tmp_path}|open", directory=str(directory))
+
+        link = tmp_path / "link"
+        link.symlink_to(directory, target_is_directory=True)
+        os.chmod(directory, 0o700)
+        with pytest.raises(PermissionError, match="not a directory"):
+            TokenCache.shared(f"{tmp_path}|link", directory=str(link))
+
+        cache = TokenCache.shared(f"{tmp_path}|private", directory=str(directory))
+        assert os.path.dirname(cache.path) == str(directory)
+
+    @pytest.mark.skipif(Config.get_transport() != 'memory',
+                        reason="Token rejection is injected into the in-memory stand-in")
+    def test_request_retried_with_fresh_token_after_403(self, config, leased_booking):
+        """Test a write rejected with 403 invalidates the shared token and succeeds with a new one"""
+        client = BookingAPIClient(config, circuit_breaker=None)
+        try:
+            stale = client.token_cache.get(client._fetch_auth_token)
+            adapter = RejectFirstTokenAdapter(client.session.get_adapter(client.base_url), stale)
+            client.mount(client.base_url, adapter)
+
+            updated = client.partial_update_booking(leased_booking.booking_id, {'additionalneeds': 'Late checkout'})
+            leased_booking.mark_dirty()
+
+            assert updated.additionalneeds == 'Late checkout'
+            assert adapter.rejected == 1, f"Only the stale token should be rejected, saw {adapter.rejected}"
+            assert client.token_cache.get(client._fetch_auth_token) != stale
+        finally:
+            client.close()
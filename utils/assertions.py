@@ -1,10 +1,10 @@
 from typing import Dict, Any, Union
-from models.booking import Booking
+from models.booking import BookingBase
 
 
 class APIAssertions:
     @staticmethod
-    def assert_booking_structure(booking_data: Booking):
+    def assert_booking_structure(booking_data: BookingBase):
         """Validate booking data has required structure"""
         assert booking_data.firstname is not None
         assert booking_data.lastname is not None
@@ -15,13 +15,13 @@ class APIAssertions:
         assert booking_data.bookingdates.checkout is not None
 
     @staticmethod
-    def assert_booking_equality(booking1: Union[Dict[str, Any], Booking], booking2: Union[Dict[str, Any], Booking], ignore_fields: list = None):
+    def assert_booking_equality(booking1: Union[Dict[str, Any], BookingBase], booking2: Union[Dict[str, Any], BookingBase], ignore_fields: list = None):
         """Compare two booking objects for equality, optionally ignoring certain fields"""
         ignore_fields = ignore_fields or []
 
         # Convert models to dicts for comparison
-        dict1 = booking1.to_dict() if isinstance(booking1, Booking) else booking1
-        dict2 = booking2.to_dict() if isinstance(booking2, Booking) else booking2
+        dict1 = booking1.to_dict() if isinstance(booking1, BookingBase) else booking1
+        dict2 = booking2.to_dict() if isinstance(booking2, BookingBase) else booking2
 
         for key, value in dict1.items():
             if key not in ignore_fields:
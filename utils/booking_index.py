@@ -0,0 +1,115 @@
+"""In-memory booking store indexed for Restful Booker style filtering"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class BookingIndex:
+    """Bookings keyed by id with indexes on firstname, lastname, checkin and checkout.
+
+    Filters follow the Restful Booker API: names match exactly, and the checkin and
+    checkout filters return bookings whose date is on or after the requested date.
+    Dates are ISO 'YYYY-MM-DD' strings, so they sort and compare lexicographically.
+    """
+
+    def __init__(self):
+        self._bookings: Dict[int, Dict[str, Any]] = {}
+        self._by_firstname: Dict[str, Set[int]] = {}
+        self._by_lastname: Dict[str, Set[int]] = {}
+        self._checkins: List[tuple] = []
+        self._checkouts: List[tuple] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._bookings)
+
+    def __contains__(self, booking_id: int) -> bool:
+        return booking_id in self._bookings
+
+    def ids(self) -> Set[int]:
+        with self._lock:
+            return set(self._bookings)
+
+    def get(self, booking_id: int) -> Optional[Dict[str, Any]]:
+        return self._bookings.get(booking_id)
+
+    def put(self, booking_id: int, booking: Dict[str, Any]):
+        """Insert or replace a booking, keeping every index in step"""
+        with self._lock:
+            self.remove(booking_id)
+            self._bookings[booking_id] = booking
+            self._by_firstname.setdefault(booking.get('firstname'), set()).add(booking_id)
+            self._by_lastname.setdefault(booking.get('lastname'), set()).add(booking_id)
+            dates = booking.get('bookingdates') or {}
+            insort(self._checkins, (str(dates.get('checkin')), booking_id))
+            insort(self._checkouts, (str(dates.get('checkout')), booking_id))
+
+    def put_many(self, bookings: Iterable[tuple]):
+        """Bulk load (booking_id, booking) pairs, sorting the date indexes once"""
+        with self._lock:
+            for booking_id, booking in bookings:
+                self.remove(booking_id)
+                self._bookings[booking_id] = booking
+                self._by_firstname.setdefault(booking.get('firstname'), set()).add(booking_id)
+                self._by_lastname.setdefault(booking.get('lastname'), set()).add(booking_id)
+                dates = booking.get('bookingdates') or {}
+                self._checkins.append((str(dates.get('checkin')), booking_id))
+                self._checkouts.append((str(dates.get('checkout')), booking_id))
+            self._checkins.sort()
+            self._checkouts.sort()
+
+    def remove(self, booking_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            booking = self._bookings.pop(booking_id, None)
+            if booking is None:
+                return None
+            self._discard(self._by_firstname, booking.get('firstname'), booking_id)
+            self._discard(self._by_lastname, booking.get('lastname'), booking_id)
+            dates = booking.get('bookingdates') or {}
+            self._remove_sorted(self._checkins, (str(dates.get('checkin')), booking_id))
+            self._remove_sorted(self._checkouts, (str(dates.get('checkout')), booking_id))
+            return booking
+
+    def query(self, firstname: Optional[str] = None, lastname: Optional[str] = None,
+              checkin: Optional[str] = None, checkout: Optional[str] = None) -> List[int]:
+        """Booking ids matching every given filter, in ascending order"""
+        with self._lock:
+            candidates = None
+            for index, value in ((self._by_firstname, firstname), (self._by_lastname, lastname)):
+                if value is not None:
+                    ids = index.get(value, set())
+                    candidates = ids if candidates is None else candidates & ids
+
+            date_filters = [(dates, value, field) for dates, value, field in
+                            ((self._checkins, checkin, 'checkin'), (self._checkouts, checkout, 'checkout'))
+                            if value is not None]
+
+            if candidates is None and date_filters:
+                # Start from the narrower date range, then check the other date per booking
+                ranges = [(dates[bisect_left(dates, (value,)):], field) for dates, value, field in date_filters]
+                ranges.sort(key=lambda item: len(item[0]))
+                candidates = {booking_id for _, booking_id in ranges[0][0]}
+                date_filters = [f for f in date_filters if f[2] != ranges[0][1]]
+            elif candidates is None:
+                candidates = self._bookings.keys()
+
+            if date_filters:
+                candidates = [booking_id for booking_id in candidates
+                              if all(str(self._bookings[booking_id]['bookingdates'].get(field)) >= value
+                                     for _, value, field in date_filters)]
+            return sorted(candidates)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[int]], key, booking_id: int):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(booking_id)
+            if not ids:
+                del index[key]
+
+    @staticmethod
+    def _remove_sorted(entries: List[tuple], entry: tuple):
+        pos = bisect_left(entries, entry)
+        if pos < len(entries) and entries[pos] == entry:
+            del entries[pos]
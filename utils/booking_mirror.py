@@ -0,0 +1,107 @@
+"""Local, indexed mirror of the server's bookings for verifying filter results"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.booking_index import BookingIndex
+
+logger = logging.getLogger(__name__)
+
+
+class BookingMirror:
+    """Bookings on the server, pulled through a BookingAPIClient and kept in a BookingIndex.
+
+    The first sync fetches the bookings with bounded concurrency; later syncs diff the
+    server's id set against the mirror and only fetch new ids or drop deleted ones.
+    Filter answers then come from the index: hash lookups for names and a bisect over
+    the sorted dates, instead of another round trip to the server.
+
+    With tracked_ids, only those bookings (typically the ones this session created) are
+    mirrored; the set is read on every sync, so ids added to it later are picked up.
+    Without it every booking on the server is fetched.
+    """
+
+    def __init__(self, client, max_workers: int = 16, tracked_ids: Optional[Set[int]] = None):
+        self.client = client
+        self.max_workers = max_workers
+        self.tracked_ids = tracked_ids
+        self.index = BookingIndex()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def sync(self) -> Dict[str, int]:
+        """Bring the mirror up to date with the server's id set"""
+        server_ids = self.client.collect_booking_ids(into='set')
+        if self.tracked_ids is not None:
+            server_ids &= set(self.tracked_ids)
+        known_ids = self.index.ids()
+
+        removed = known_ids - server_ids
+        for booking_id in removed:
+            self.index.remove(booking_id)
+
+        added = sorted(server_ids - known_ids)
+        fetched, failed = self._fetch(added)
+        self.index.put_many(fetched)
+
+        stats = {'added': len(fetched), 'removed': len(removed), 'failed': failed, 'total': len(self.index)}
+        logger.info(f"Booking mirror synced: {stats}")
+        return stats
+
+    def refresh(self, booking_ids: Iterable[int]) -> Dict[int, Exception]:
+        """Re-fetch specific bookings from the server, bypassing any read cache, dropping ones that are gone.
+
+        A booking whose fetch fails for any other reason keeps its stale entry; the
+        errors are logged and returned by booking id.
+        """
+        booking_ids = list(booking_ids)
+        errors = {}
+        for result in self.client.get_bookings(booking_ids, self.max_workers, use_cache=False):
+            if result.ok:
+                self.index.put(result.item, result.result.to_dict())
+                continue
+            try:
+                if not self.client.booking_exists(result.item):
+                    self.index.remove(result.item)
+                    continue
+            except Exception as e:
+                logger.debug(f"Could not check whether booking {result.item} still exists: {e}")
+            errors[result.item] = result.error
+
+        if errors:
+            logger.warning(f"Booking mirror kept {len(errors)} stale bookings it could not re-fetch, "
+                           f"e.g. {next(iter(errors.items()))}")
+        return errors
+
+    def expected_ids(self, firstname: str = None, lastname: str = None,
+                     checkin: str = None, checkout: str = None) -> List[int]:
+        """Booking ids the server should return for these filters"""
+        return self.index.query(firstname=firstname, lastname=lastname, checkin=checkin, checkout=checkout)
+
+    def diff(self, server_ids: Iterable[int], **filters) -> Tuple[Set[int], Set[int]]:
+        """(missing, unexpected) ids in a server filter response, limited to ids the mirror knows.
+
+        Discrepancies are re-fetched once before being reported, so bookings changed by
+        other clients since the last sync do not show up as false positives.
+        """
+        server_ids = set(server_ids)
+        missing, unexpected = self._compare(server_ids, filters)
+        if missing or unexpected:
+            self.refresh(missing | unexpected)
+            missing, unexpected = self._compare(server_ids, filters)
+        return missing, unexpected
+
+    def _compare(self, server_ids: Set[int], filters) -> Tuple[Set[int], Set[int]]:
+        expected = set(self.expected_ids(**filters))
+        known = self.index.ids()
+        return expected - server_ids, (server_ids & known) - expected
+
+    def _fetch(self, booking_ids: List[int]):
+        fetched, failed = [], 0
+        for result in self.client.get_bookings(booking_ids, self.max_workers):
+            if result.ok:
+                fetched.append((result.item, result.result.to_dict()))
+            else:
+                failed += 1
+        return fetched, failed
@@ -0,0 +1,117 @@
+"""Pre-provisioned bookings leased to tests that only need "some valid booking\""""
+
+import copy
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from models.booking import BookingResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BookingLease:
+    booking_response: BookingResponse
+    booking_data: Dict[str, Any]
+    dirty: bool = False
+    deleted: bool = False
+    _original: Dict[str, Any] = field(default=None, repr=False)
+
+    @property
+    def booking_id(self) -> int:
+        return self.booking_response.bookingid
+
+    def mark_dirty(self):
+        """The test changed the booking; it is reset with a PUT when returned"""
+        self.dirty = True
+
+    def mark_deleted(self):
+        """The test deletes the booking; it is dropped from the pool and deleted when returned"""
+        self.deleted = True
+
+
+class BookingLeasePool:
+    """Bulk-creates bookings once and leases them out, resetting changed ones on return.
+
+    With size 0 nothing is pooled: every lease is a fresh booking, deleted on return.
+    """
+
+    def __init__(self, client, size: int, booking_data_factory: Callable[[], Dict[str, Any]], sweeper=None):
+        self.client = client
+        self.size = size
+        self.booking_data_factory = booking_data_factory
+        self.sweeper = sweeper
+        self._available: 'queue.SimpleQueue[BookingLease]' = queue.SimpleQueue()
+        self._owned: List[int] = []
+        self._lock = threading.Lock()
+        self.stats = {'leases': 0, 'created': 0, 'resets': 0, 'dropped': 0}
+
+    def fill(self):
+        """Create the pool's bookings in one parallel batch"""
+        self._add(self.size)
+
+    def lease(self) -> BookingLease:
+        """Take a booking from the pool, creating one if all are leased"""
+        try:
+            lease = self._available.get_nowait()
+        except queue.Empty:
+            self._add(1)
+            lease = self._available.get_nowait()
+        with self._lock:
+            self.stats['leases'] += 1
+        lease.booking_data = copy.deepcopy(lease._original)
+        return lease
+
+    def release(self, lease: BookingLease):
+        """Return a lease, restoring the original booking first if the test changed it"""
+        if not lease.deleted and lease.dirty and self.size:
+            try:
+                self.client.update_booking(lease.booking_id, lease._original)
+                with self._lock:
+                    self.stats['resets'] += 1
+            except Exception as e:
+                logger.warning(f"Could not reset pooled booking {lease.booking_id}: {e}")
+                lease.deleted = True
+
+        if lease.deleted or not self.size:
+            with self._lock:
+                self._owned.remove(lease.booking_id)
+                self.stats['dropped'] += 1
+            # The test may have failed before its own delete; one that is already gone counts as deleted
+            self._delete([lease.booking_id])
+            return
+        lease.dirty = False
+        self._available.put(lease)
+
+    def close(self):
+        """Delete every booking the pool still owns"""
+        with self._lock:
+            owned, self._owned = self._owned, []
+        self._delete(owned)
+        logger.info(f"Booking pool: {self.stats}")
+
+    def _delete(self, booking_ids: List[int]):
+        if self.sweeper:
+            self.sweeper.delete(booking_ids)
+        else:
+            self.client.delete_bookings(booking_ids)
+
+    def _add(self, count: int):
+        payloads = [self.booking_data_factory() for _ in range(count)]
+        results = self.client.create_bookings(payloads)
+        # Register every booking that was created before reporting failures, so none leak
+        for result in results:
+            if not result.ok:
+                continue
+            lease = BookingLease(result.result, copy.deepcopy(result.item), _original=result.item)
+            with self._lock:
+                self._owned.append(lease.booking_id)
+                self.stats['created'] += 1
+            self._available.put(lease)
+
+        failures = [result.error for result in results if not result.ok]
+        if failures:
+            raise Exception(f"Failed to provision {len(failures)} of {len(results)} pooled bookings: {failures[0]}")
@@ -1,10 +1,15 @@
 import os
+import re
 import json
+import glob
+import hashlib
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
 
 logger = logging.getLogger(__name__)
 
@@ -27,29 +32,165 @@ SEVERITY_MARKERS = {
 DEFAULT_TEST_AREA = 'General'
 DEFAULT_SEVERITY = 'Medium'
 
+# Volatile parts of failure messages, replaced before fingerprinting so repeats group together.
+# Plain numbers are only replaced in id positions; status codes, counts and assertion
+# operands stay, so e.g. a 404 and a 500 from the same call remain separate bugs.
+FINGERPRINT_PATTERNS = [
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.I), '<uuid>'),
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?'), '<ts>'),
+    (re.compile(r'\b0x[0-9a-f]+\b', re.I), '<addr>'),
+    (re.compile(r'\b[0-9a-f]*\d[0-9a-f]*[a-f][0-9a-f]*\b', re.I), '<hex>'),
+    # "/booking/12", "Booking 12", "booking #12", "bookingid': 12", "booking_id=12", "id=12".
+    # A colon only counts after an explicit id key: "booking: 500" is a status code.
+    (re.compile(r'(/booking/)\d+', re.I), r'\1<id>'),
+    (re.compile(r'(\bbooking #?)\d+', re.I), r'\1<id>'),
+    (re.compile(r'''(\bbooking[ _]?id['"]?\s*[:=]\s*)\d+''', re.I), r'\1<id>'),
+    (re.compile(r'(\bids?=)\d+(?:,\d+)*', re.I), r'\1<id>'),
+    # Membership checks and id lists in pytest's assertion output: "assert 12 in [3, 4, ...]"
+    (re.compile(r'\b\d+(?= (?:not )?in [\[{])'), '<id>'),
+    (re.compile(r'(?:(?<=in )[\[{]\d+|[\[{]\d+(?:,\s*\d+)+)(?:,\s*\.\.\.)?[\]}]'), '<ids>'),
+    (re.compile(r'\s+'), ' '),
+]
+
+MAX_SAMPLE_TESTS = 5
+
+# Excel report layout: (header, bug field) per column
+REPORT_COLUMNS = [
+    ("Bug ID", "id"),
+    ("Test Name", "test_name"),
+    ("Test Area", "test_area"),
+    ("Severity", "severity"),
+    ("Bug Type", "bug_type"),
+    ("Expected", "expected"),
+    ("Actual", "actual"),
+    ("Environment", "environment"),
+    ("Status", "status"),
+    ("Occurrences", "occurrences"),
+    ("First Seen", "timestamp"),
+    ("Last Seen", "last_seen"),
+    ("Sample Tests", "sample_tests"),
+    ("Fingerprint", "fingerprint"),
+]
+
+SEVERITY_COLORS = {
+    "High": "FFCCCC",
+    "Medium": "FFFFCC",
+    "Low": "CCFFCC"
+}
+
+MAX_COLUMN_WIDTH = 50
+
 
 class BugReporter:
-    def __init__(self):
+    def __init__(self, shard_path: str = None):
         self.bugs: List[Dict[str, Any]] = []
+        # Append-only JSONL file this reporter mirrors its bugs to (one per xdist worker)
+        self.shard_path = shard_path
+        # Fingerprint -> bug, so repeat failures update one row instead of adding another
+        self._by_fingerprint: Dict[str, Dict[str, Any]] = {}
+        # Column widths are tracked as bugs arrive so the streamed report can size them up front
+        self._column_widths = [len(header) for header, _ in REPORT_COLUMNS]
     
     def add_bug(self, expected: str, actual: str, severity: str = "Medium", 
-                test_name: str = "", bug_type: str = "Auto-detected"):
-        """Add a bug report"""
+                test_name: str = "", bug_type: str = "Auto-detected", fingerprint: str = None):
+        """Add a bug report; bugs sharing a fingerprint are grouped into one"""
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
         bug = {
-            "id": f"BUG-{len(self.bugs) + 1:03d}",
             "test_name": test_name,
             "test_area": self.get_test_area_from_name(test_name),
             "expected": expected,
             "actual": actual,
             "severity": severity,
             "bug_type": bug_type,
-            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
             "environment": os.getenv('TEST_ENV', 'prod'),
-            "status": "Open"
+            "status": "Open",
+            "fingerprint": fingerprint,
+            "occurrences": 1,
+            "last_seen": timestamp,
+            "sample_tests": [test_name]
         }
+        return self._store(bug)
+
+    def _store(self, bug: Dict[str, Any]) -> str:
+        # Shards record every occurrence; grouping is redone when they are merged
+        if self.shard_path:
+            with open(self.shard_path, 'a', encoding='utf-8') as shard:
+                shard.write(json.dumps(bug) + '\n')
+
+        existing = self._by_fingerprint.get(bug.get("fingerprint"))
+        if existing is not None:
+            existing["occurrences"] += bug["occurrences"]
+            existing["timestamp"] = min(existing["timestamp"], bug["timestamp"])
+            existing["last_seen"] = max(existing["last_seen"], bug["last_seen"])
+            for test_name in bug["sample_tests"]:
+                if len(existing["sample_tests"]) >= MAX_SAMPLE_TESTS:
+                    break
+                if test_name not in existing["sample_tests"]:
+                    existing["sample_tests"].append(test_name)
+            self._track_widths(existing)
+            return existing["id"]
+
+        bug = dict(bug, id=f"BUG-{len(self.bugs) + 1:03d}", sample_tests=list(bug["sample_tests"]))
         self.bugs.append(bug)
+        if bug.get("fingerprint"):
+            self._by_fingerprint[bug["fingerprint"]] = bug
+        self._track_widths(bug)
         return bug["id"]
+
+    @staticmethod
+    def fingerprint(test_area: str, failure_message: str) -> str:
+        """Hash of the test area and the failure message with ids, UUIDs and timestamps stripped"""
+        normalized = failure_message
+        for pattern, placeholder in FINGERPRINT_PATTERNS:
+            normalized = pattern.sub(placeholder, normalized)
+        return hashlib.sha1(f"{test_area}|{normalized.strip()}".encode()).hexdigest()[:12]
+
+    @classmethod
+    def merge_shards(cls, shard_dir: str) -> 'BugReporter':
+        """Combine per-worker shards into one reporter with globally unique bug ids"""
+        bugs = []
+        for path in sorted(glob.glob(os.path.join(shard_dir, '*.jsonl'))):
+            with open(path, encoding='utf-8') as shard:
+                for line in shard:
+                    if not line.strip():
+                        continue
+                    try:
+                        bugs.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A worker that died mid-write leaves a truncated last line
+                        logger.warning(f"Skipping unreadable bug record in {path}")
+
+        merged = cls()
+        for bug in sorted(bugs, key=lambda bug: bug["timestamp"]):
+            merged._store(bug)
+        return merged
     
+    @staticmethod
+    def _clean_text(text: Any) -> str:
+        """Truncate long text and remove characters Excel cannot store"""
+        text = str(text)
+        if len(text) > 500:
+            text = text[:500] + "..."
+        return text.replace('\x00', '').replace('\n', ' ').replace('\r', ' ')
+
+    def _report_row(self, bug: Dict[str, Any]) -> List[Any]:
+        row = []
+        for _, field in REPORT_COLUMNS:
+            value = bug.get(field)
+            if field == "actual":
+                value = self._clean_text(value)
+            elif field == "sample_tests":
+                value = ", ".join(value)
+            row.append(value)
+        return row
+
+    def _track_widths(self, bug: Dict[str, Any]):
+        for col, value in enumerate(self._report_row(bug)):
+            length = len(str(value))
+            if length > self._column_widths[col]:
+                self._column_widths[col] = length
+
     def get_test_area_from_name(self, test_name: str) -> str:
         """Extract test area from test name using constants"""
         test_name_lower = test_name.lower()
@@ -79,17 +220,17 @@ class BugReporter:
         if not expected_behavior:
             expected_behavior = self.get_test_description(test_item) or "Test should pass"
         
-        # Clean up failure message
-        if len(failure_message) > 500:
-            failure_message = failure_message[:500] + "..."
-        failure_message = failure_message.replace('\x00', '').replace('\n', ' ').replace('\r', ' ')
+        # Fingerprint the full message, then clean it up for storage
+        fingerprint = self.fingerprint(self.get_test_area_from_name(test_name), failure_message)
+        failure_message = self._clean_text(failure_message)
         
         return self.add_bug(
             expected=expected_behavior,
             actual=failure_message,
             severity=severity,
             test_name=test_name,
-            bug_type="Auto-detected"
+            bug_type="Auto-detected",
+            fingerprint=fingerprint
         )
     
     def get_test_description(self, test_item):
@@ -110,76 +251,49 @@ class BugReporter:
         return f"{readable_name} should work correctly"
     
     def generate_excel_report(self, filename: str = None):
-        """Generate Excel bug report"""
+        """Generate Excel bug report, streaming rows through a write-only workbook"""
         if not filename:
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             filename = f"reports/bug_report_{timestamp}.xlsx"
         
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Bug Report"
-        
-        # Headers
-        headers = ["Bug ID", "Test Name", "Test Area", "Severity", "Bug Type", 
-                  "Expected", "Actual", "Environment", "Status", "Timestamp"]
-        
-        # Style headers
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Bug Report")
+
+        # Write-only sheets need column widths before any row is written
+        for col, width in enumerate(self._column_widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = min(width + 2, MAX_COLUMN_WIDTH)
+
+        # Style objects are created once and shared by every cell
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
+        header_alignment = Alignment(horizontal="center")
+        severity_fills = {severity: PatternFill(start_color=color, end_color=color, fill_type="solid")
+                          for severity, color in SEVERITY_COLORS.items()}
+
+        header_cells = []
+        for header, _ in REPORT_COLUMNS:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = header_font
             cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
-        
-        # Add bug data
-        for row, bug in enumerate(self.bugs, 2):
-            ws.cell(row=row, column=1, value=bug["id"])
-            ws.cell(row=row, column=2, value=bug["test_name"])
-            ws.cell(row=row, column=3, value=bug["test_area"])
-            ws.cell(row=row, column=4, value=bug["severity"])
-            ws.cell(row=row, column=5, value=bug["bug_type"])
-            ws.cell(row=row, column=6, value=bug["expected"])
-            
-            # Truncate long actual text and clean it
-            actual_text = str(bug["actual"])
-            if len(actual_text) > 500:
-                actual_text = actual_text[:500] + "..."
-            # Remove problematic characters
-            actual_text = actual_text.replace('\x00', '').replace('\n', ' ').replace('\r', ' ')
-            ws.cell(row=row, column=7, value=actual_text)
-            
-            ws.cell(row=row, column=8, value=bug["environment"])
-            ws.cell(row=row, column=9, value=bug["status"])
-            ws.cell(row=row, column=10, value=bug["timestamp"])
-            
-            # Color code by severity
-            severity_colors = {
-                "High": "FFCCCC",
-                "Medium": "FFFFCC", 
-                "Low": "CCFFCC"
-            }
-            if bug["severity"] in severity_colors:
-                fill = PatternFill(start_color=severity_colors[bug["severity"]], 
-                                 end_color=severity_colors[bug["severity"]], fill_type="solid")
-                for col in range(1, len(headers) + 1):
-                    ws.cell(row=row, column=col).fill = fill
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Add bug data, color coded by severity
+        for bug in self.bugs:
+            row = self._report_row(bug)
+            fill = severity_fills.get(bug["severity"])
+            if fill is None:
+                ws.append(row)
+                continue
+            cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.fill = fill
+                cells.append(cell)
+            ws.append(cells)
         
         wb.save(filename)
         logger.info(f"Excel bug report generated: {filename}")
@@ -0,0 +1,93 @@
+"""Client-side caches"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar('V')
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe LRU cache with a per-entry TTL and hit/miss counters.
+
+    Writers stamp the key with a new version; fill() only stores a value read
+    under the current version, so a slow read racing a write cannot resurrect
+    stale data. At most `maxsize` stamps are kept: a dropped stamp raises the
+    version every unstamped key reports, so an older read is still rejected.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: 'OrderedDict[Hashable, Tuple[float, V]]' = OrderedDict()
+        self._versions: 'OrderedDict[Hashable, int]' = OrderedDict()
+        self._write_seq = 0
+        self._pruned_version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def version(self, key: Hashable) -> int:
+        with self._lock:
+            return self._versions.get(key, self._pruned_version)
+
+    def fill(self, key: Hashable, value: V, version: int):
+        """Store a value read from the source, unless the key was written since version"""
+        with self._lock:
+            if self._versions.get(key, self._pruned_version) == version:
+                self._store(key, value)
+
+    def put(self, key: Hashable, value: V):
+        """Write-through a value that is now authoritative"""
+        with self._lock:
+            self._stamp(key)
+            self._store(key, value)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._stamp(key)
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _stamp(self, key: Hashable):
+        self._write_seq += 1
+        self._versions[key] = self._write_seq
+        self._versions.move_to_end(key)
+        while len(self._versions) > self.maxsize:
+            _, version = self._versions.popitem(last=False)
+            self._pruned_version = max(self._pruned_version, version)
+
+    def _store(self, key: Hashable, value: V):
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,71 @@
+"""Cleanup of bookings created during a test session"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Set
+
+from utils.concurrency import ConcurrencyUtils
+
+logger = logging.getLogger(__name__)
+
+
+class BookingSweeper:
+    """Deletes bookings in parallel and queues failed deletes for a retry at session end"""
+
+    def __init__(self, client, max_workers: int = 8, attempts: int = 3, backoff: float = 0.5):
+        self.client = client
+        self.max_workers = max_workers
+        self.attempts = attempts
+        self.backoff = backoff
+        self._pending: Set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> Set[int]:
+        with self._lock:
+            return set(self._pending)
+
+    def delete(self, booking_ids: Iterable[int]) -> int:
+        """Delete bookings through a bounded pool; returns how many were queued for the sweep.
+
+        Bookings the client already deleted successfully (e.g. a test deleting its own
+        booking) are skipped rather than sent a second DELETE.
+        """
+        already_deleted = self.client.deleted_booking_ids
+        booking_ids = [booking_id for booking_id in booking_ids if booking_id not in already_deleted]
+        if not booking_ids:
+            return 0
+        results = self.client.delete_bookings(booking_ids, self.max_workers)
+        failed = [r.item for r in results if not r.ok]
+        if failed:
+            with self._lock:
+                self._pending.update(failed)
+            logger.debug(f"Queued {len(failed)} bookings for end-of-session cleanup")
+        return len(failed)
+
+    def sweep(self) -> Dict[str, int]:
+        """Retry queued deletes with backoff; bookings that still exist afterwards are leaked"""
+        with self._lock:
+            pending = sorted(self._pending)
+            self._pending.clear()
+        queued = len(pending)
+
+        for attempt in range(self.attempts):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            results = self.client.delete_bookings(pending, self.max_workers)
+            pending = [r.item for r in results if not r.ok]
+
+        # A failed delete may just mean the test already deleted the booking itself
+        checks = ConcurrencyUtils.run_bounded(self.client.booking_exists, pending, self.max_workers)
+        leaked = [r.item for r in checks if not r.ok or r.result]
+
+        stats = {'queued': queued, 'deleted': queued - len(pending), 'already_gone': len(pending) - len(leaked),
+                 'leaked': len(leaked)}
+        if leaked:
+            logger.warning(f"Booking sweeper leaked {len(leaked)} bookings: {leaked[:20]}")
+        logger.info(f"Booking sweeper: {stats}")
+        return stats
@@ -1,6 +1,71 @@
 """Concurrency utilities for test execution"""
 
+import asyncio
 import concurrent.futures
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from models.booking import BulkItemResult
+
+
+@dataclass
+class LoadPhase:
+    """One phase of an open-model load profile, ramping linearly from start_rps to end_rps"""
+    duration: float
+    start_rps: float
+    end_rps: Optional[float] = None
+
+    def __post_init__(self):
+        if self.end_rps is None:
+            self.end_rps = self.start_rps
+
+    def send_offsets(self) -> List[float]:
+        """Intended send times within the phase, spaced so the rate follows the ramp"""
+        a = self.start_rps
+        b = (self.end_rps - self.start_rps) / self.duration if self.duration else 0.0
+        total = int(a * self.duration + b * self.duration ** 2 / 2)
+        offsets = []
+        for n in range(total):
+            # Invert N(t) = a*t + b*t^2/2 to find when the n-th request is due
+            if b:
+                offsets.append((-a + math.sqrt(a * a + 2 * b * n)) / b)
+            else:
+                offsets.append(n / a)
+        return offsets
+
+
+@dataclass
+class LoadReport:
+    """Latencies per operation, measured from each request's intended send time"""
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    scheduled: int = 0
+    elapsed: float = 0.0
+    max_dispatch_lag: float = 0.0
+
+    def percentile(self, operation: str, pct: float) -> float:
+        values = sorted(self.latencies.get(operation, []))
+        if not values:
+            return 0.0
+        rank = max(0, math.ceil(pct / 100 * len(values)) - 1)
+        return values[rank]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for operation in sorted(set(self.latencies) | set(self.errors)):
+            count = len(self.latencies.get(operation, []))
+            summary[operation] = {
+                'count': count,
+                'errors': self.errors.get(operation, 0),
+                'p50': self.percentile(operation, 50),
+                'p90': self.percentile(operation, 90),
+                'p99': self.percentile(operation, 99),
+                'max': self.percentile(operation, 100),
+            }
+        return summary
 
 
 class ConcurrencyUtils:
@@ -12,3 +77,84 @@ class ConcurrencyUtils:
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = [executor.submit(op) for op in operations]
             return [future.result() for future in concurrent.futures.as_completed(futures)]
+
+    @staticmethod
+    def run_bounded(func, items, max_workers=8):
+        """Apply func to each item on a bounded pool, returning BulkItemResults in input order"""
+        def _run(item):
+            try:
+                return BulkItemResult(item=item, result=func(item))
+            except Exception as e:
+                return BulkItemResult(item=item, error=e)
+
+        items = list(items)
+        if not items:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(_run, items))
+
+    @staticmethod
+    async def run_async_operations(operations, max_concurrency=100):
+        """Await coroutine factories with at most max_concurrency in flight, results in input order"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(op):
+            async with semaphore:
+                return await op()
+
+        return await asyncio.gather(*(_bounded(op) for op in operations))
+
+    @staticmethod
+    def ramp_hold_ramp(peak_rps: float, ramp_up: float, hold: float, ramp_down: float) -> List[LoadPhase]:
+        """Standard ramp-up, hold and ramp-down profile around a target rate"""
+        phases = [LoadPhase(ramp_up, 0, peak_rps), LoadPhase(hold, peak_rps), LoadPhase(ramp_down, peak_rps, 0)]
+        return [phase for phase in phases if phase.duration > 0]
+
+    @staticmethod
+    def run_load(operations: Dict[str, Tuple[float, Callable]], phases: List[LoadPhase],
+                 max_workers: int = 256, seed: Optional[int] = None) -> LoadReport:
+        """Drive a weighted operation mix at the profile's request rate (open model).
+
+        Requests are released on a fixed schedule regardless of how fast earlier ones
+        complete, and latency is taken from the intended send time, so queueing behind a
+        stalled backend or a saturated worker pool is counted instead of omitted.
+        """
+        names = list(operations)
+        weights = [operations[name][0] for name in names]
+        rng = random.Random(seed)
+
+        schedule = []
+        phase_start = 0.0
+        for phase in phases:
+            schedule.extend(phase_start + offset for offset in phase.send_offsets())
+            phase_start += phase.duration
+        picks = rng.choices(names, weights=weights, k=len(schedule))
+
+        report = LoadReport(latencies={name: [] for name in names}, scheduled=len(schedule))
+        lock = threading.Lock()
+
+        def _fire(name, intended):
+            error = False
+            try:
+                operations[name][1]()
+            except Exception:
+                error = True
+            latency = time.perf_counter() - intended
+            with lock:
+                if error:
+                    report.errors[name] = report.errors.get(name, 0) + 1
+                else:
+                    report.latencies[name].append(latency)
+
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for offset, name in zip(schedule, picks):
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    report.max_dispatch_lag = max(report.max_dispatch_lag, -delay)
+                executor.submit(_fire, name, intended)
+        report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,180 @@
+"""Vectorized differential oracle for the /booking filter parameters"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from utils.concurrency import ConcurrencyUtils
+
+FILTER_NAMES = ('firstname', 'lastname', 'checkin', 'checkout')
+
+
+@dataclass
+class FilterMismatch:
+    query: Dict[str, str]
+    missing: Set[int] = field(default_factory=set)
+    unexpected: Set[int] = field(default_factory=set)
+    error: Optional[Exception] = None
+
+
+def _to_day(value: Optional[str]) -> np.datetime64:
+    """One ISO date as datetime64[D]; a missing or unparseable date becomes NaT"""
+    try:
+        return np.datetime64(value, 'D') if value is not None else np.datetime64('NaT')
+    except ValueError:
+        return np.datetime64('NaT')
+
+
+def _to_days(values: Iterable[str]) -> np.ndarray:
+    """ISO dates as datetime64[D]; unparseable dates become NaT and never match"""
+    values = list(values)
+    try:
+        return np.array(values, dtype='datetime64[D]')
+    except ValueError:
+        return np.array([_to_day(value) for value in values], dtype='datetime64[D]')
+
+
+def _encode_names(values) -> Tuple[Dict[str, int], np.ndarray]:
+    """Dictionary-encode names; a missing name gets code -1 and never matches"""
+    values = np.asarray(values, dtype=object)
+    present = np.array([value is not None for value in values], dtype=bool)
+    codes = np.full(len(values), -1, dtype=np.int64)
+    vocab, codes[present] = np.unique(values[present].astype(str), return_inverse=True)
+    return {value: i for i, value in enumerate(vocab)}, codes
+
+
+class FilterOracle:
+    """Columnar snapshot of bookings that answers get_booking_ids filters with NumPy.
+
+    Columns are kept in id order. Names are dictionary-encoded into integer codes with
+    a CSR-style grouping and bookings are pre-sorted by checkin, so a query starts from
+    its name group or checkin suffix and the remaining predicates are vector masks;
+    broad date-only queries use a single mask over the whole snapshot.
+    Filter semantics match BookingIndex: exact names, dates on or after the filter.
+    """
+
+    def __init__(self, ids, firstnames, lastnames, checkins, checkouts):
+        # Keep every column in id order so positions taken in order map to sorted ids
+        ids = np.asarray(ids, dtype=np.int64)
+        by_id = np.argsort(ids, kind='stable')
+        self.ids = ids[by_id]
+        self.checkin = _to_days(checkins)[by_id]
+        self.checkout = _to_days(checkouts)[by_id]
+        self._names = {}
+        for name, values in (('firstname', firstnames), ('lastname', lastnames)):
+            vocab, codes = _encode_names(values)
+            codes = codes[by_id]
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(vocab) + 1))
+            self._names[name] = (vocab, codes, order, bounds)
+        self._checkin_order = np.argsort(self.checkin, kind='stable')
+        self._checkin_sorted = self.checkin[self._checkin_order]
+        # NaT sorts last; bookings without a valid checkin never match a checkin filter
+        self._checkin_valid = len(self.checkin) - int(np.count_nonzero(np.isnat(self.checkin)))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_bookings(cls, bookings: Iterable[Tuple[int, Dict]]) -> 'FilterOracle':
+        ids, firstnames, lastnames, checkins, checkouts = [], [], [], [], []
+        for booking_id, booking in bookings:
+            ids.append(booking_id)
+            firstnames.append(booking.get('firstname'))
+            lastnames.append(booking.get('lastname'))
+            dates = booking.get('bookingdates') or {}
+            checkins.append(str(dates.get('checkin')))
+            checkouts.append(str(dates.get('checkout')))
+        return cls(ids, firstnames, lastnames, checkins, checkouts)
+
+    @classmethod
+    def from_mirror(cls, mirror) -> 'FilterOracle':
+        index = mirror.index
+        return cls.from_bookings((booking_id, index.get(booking_id)) for booking_id in sorted(index.ids()))
+
+    def expected(self, firstname: str = None, lastname: str = None,
+                 checkin: str = None, checkout: str = None) -> np.ndarray:
+        """Sorted booking ids matching one filter combination"""
+        return self.expected_many([{'firstname': firstname, 'lastname': lastname,
+                                    'checkin': checkin, 'checkout': checkout}])[0]
+
+    def expected_many(self, queries: List[Dict[str, str]]) -> List[np.ndarray]:
+        """Expected ids for many filter combinations, with all checkin lookups in one pass"""
+        checkin_days = _to_days(q.get('checkin') or '1970-01-01' for q in queries)
+        starts = np.searchsorted(self._checkin_sorted, checkin_days, side='left')
+
+        results = []
+        for query, start, checkin_day in zip(queries, starts, checkin_days):
+            candidates = None
+            for name in ('firstname', 'lastname'):
+                value = query.get(name)
+                if value is None:
+                    continue
+                vocab, codes, order, bounds = self._names[name]
+                code = vocab.get(value)
+                if code is None:
+                    candidates = np.empty(0, dtype=np.int64)
+                    break
+                if candidates is None:
+                    candidates = order[bounds[code]:bounds[code + 1]]
+                else:
+                    candidates = candidates[codes[candidates] == code]
+
+            checkout_day = _to_day(query['checkout']) if query.get('checkout') is not None else None
+            if candidates is None:
+                if query.get('checkin') is not None and self._checkin_valid - start < len(self.ids) // 16:
+                    # Narrow checkin suffix: take it from the sorted order
+                    candidates = np.sort(self._checkin_order[start:self._checkin_valid])
+                    if checkout_day is not None:
+                        candidates = candidates[self.checkout[candidates] >= checkout_day]
+                else:
+                    # Broad query: one vectorized mask over the whole snapshot
+                    mask = np.ones(len(self.ids), dtype=bool)
+                    if query.get('checkin') is not None:
+                        mask &= self.checkin >= checkin_day
+                    if checkout_day is not None:
+                        mask &= self.checkout >= checkout_day
+                    candidates = np.flatnonzero(mask)
+            else:
+                if query.get('checkin') is not None:
+                    candidates = candidates[self.checkin[candidates] >= checkin_day]
+                if checkout_day is not None:
+                    candidates = candidates[self.checkout[candidates] >= checkout_day]
+            results.append(self.ids[candidates])
+        return results
+
+    def generate_queries(self, count: int, seed: int = None,
+                         extra_dates: Iterable[str] = ()) -> List[Dict[str, str]]:
+        """Random filter combinations drawn from values present in the data"""
+        rng = random.Random(seed)
+        dates = sorted({str(d) for d in np.concatenate([self.checkin, self.checkout]) if not np.isnat(d)}
+                       | set(extra_dates))
+        firstnames = list(self._names['firstname'][0])
+        lastnames = list(self._names['lastname'][0])
+        pools = {'firstname': firstnames, 'lastname': lastnames, 'checkin': dates, 'checkout': dates}
+
+        queries = []
+        for _ in range(count):
+            chosen = [name for name in FILTER_NAMES if rng.random() < 0.5] or [rng.choice(FILTER_NAMES)]
+            queries.append({name: rng.choice(pools[name]) for name in chosen if pools[name]})
+        return queries
+
+    def diff_against(self, client, queries: List[Dict[str, str]], max_workers: int = 8) -> List[FilterMismatch]:
+        """Run every query against the live API and report disagreements on ids the oracle knows"""
+        known = set(self.ids.tolist())
+        expected = self.expected_many(queries)
+        responses = ConcurrencyUtils.run_bounded(lambda q: client.get_booking_ids(**q), queries, max_workers)
+
+        mismatches = []
+        for query, want, response in zip(queries, expected, responses):
+            if not response.ok:
+                mismatches.append(FilterMismatch(query, error=response.error))
+                continue
+            got = set(response.result)
+            want = set(want.tolist())
+            missing, unexpected = want - got, (got & known) - want
+            if missing or unexpected:
+                mismatches.append(FilterMismatch(query, missing, unexpected))
+        return mismatches
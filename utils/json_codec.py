@@ -0,0 +1,65 @@
+"""Pluggable JSON codecs for request and response bodies"""
+
+import json
+import os
+from typing import Any, Callable, Dict
+
+
+class JSONCodec:
+    """Encodes to and decodes from bytes with one JSON backend"""
+
+    def __init__(self, name: str, loads: Callable[[bytes], Any], dumps: Callable[[Any], bytes]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return f"JSONCodec({self.name!r})"
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+    return JSONCodec('orjson', orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return JSONCodec('msgspec', decoder.decode, encoder.encode)
+
+
+def _stdlib_codec() -> JSONCodec:
+    encoder = json.JSONEncoder(separators=(',', ':'))
+    return JSONCodec('json', json.loads, lambda obj: encoder.encode(obj).encode())
+
+
+# Preference order for 'auto'; native codecs are used only when installed
+CODEC_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    'orjson': _orjson_codec,
+    'msgspec': _msgspec_codec,
+    'json': _stdlib_codec,
+}
+
+
+def available_codecs() -> Dict[str, JSONCodec]:
+    codecs = {}
+    for name, factory in CODEC_FACTORIES.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            pass
+    return codecs
+
+
+def get_codec(name: str = None) -> JSONCodec:
+    """Codec by name, or the fastest installed one for 'auto' (default: JSON_CODEC env var)"""
+    name = (name or os.getenv('JSON_CODEC', 'auto')).lower()
+    if name == 'auto':
+        return next(iter(available_codecs().values()))
+    if name not in CODEC_FACTORIES:
+        raise ValueError(f"Unknown JSON codec: {name}. Available: {list(CODEC_FACTORIES.keys())}")
+    try:
+        return CODEC_FACTORIES[name]()
+    except ImportError as e:
+        raise ValueError(f"JSON codec '{name}' is not installed") from e
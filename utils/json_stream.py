@@ -0,0 +1,26 @@
+"""Incremental extraction of values from streamed JSON array responses"""
+
+import re
+from typing import Iterable, Iterator
+
+
+def iter_int_field(chunks: Iterable[bytes], field: str) -> Iterator[int]:
+    """Yield every integer value of field from a streamed array of flat JSON objects.
+
+    Only complete objects (everything up to the last '}' seen so far) are scanned,
+    so memory stays bounded by the chunk size however long the array is.
+    """
+    pattern = re.compile(rb'"' + re.escape(field.encode()) + rb'"\s*:\s*(\d+)')
+    buffer = b''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        end = buffer.rfind(b'}')
+        if end < 0:
+            continue
+        for match in pattern.finditer(buffer, 0, end):
+            yield int(match.group(1))
+        buffer = buffer[end + 1:]
+    for match in pattern.finditer(buffer):
+        yield int(match.group(1))
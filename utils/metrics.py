@@ -0,0 +1,157 @@
+"""Latency metrics recorded by the API clients"""
+
+import math
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+_ID_SEGMENT = re.compile(r'/(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)')
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapse ids in a path so /booking/123 and /booking/456 share /booking/{id}"""
+    path = endpoint.split('?', 1)[0]
+    return _ID_SEGMENT.sub('/{id}', path)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with fixed memory and ~1% relative error.
+
+    Buckets grow geometrically by GROWTH from MIN_VALUE up to MAX_VALUE seconds;
+    values outside the range are clamped into the first or last bucket.
+    """
+
+    MIN_VALUE = 1e-5
+    MAX_VALUE = 600.0
+    GROWTH = 1.02
+
+    _LOG_GROWTH = math.log(GROWTH)
+    BUCKETS = int(math.ceil(math.log(MAX_VALUE / MIN_VALUE) / _LOG_GROWTH)) + 1
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= self.MIN_VALUE:
+            return 0
+        return min(int(math.log(value / self.MIN_VALUE) / self._LOG_GROWTH) + 1, self.BUCKETS - 1)
+
+    def record(self, value: float):
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: 'LatencyHistogram'):
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """Value at the given percentile, reported as the geometric middle of its bucket"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                # The edge buckets also hold clamped values; report the real extremes for them
+                if i == 0:
+                    return self.min
+                if i == self.BUCKETS - 1:
+                    return self.max
+                lower = self.MIN_VALUE * self.GROWTH ** (i - 1)
+                return min(max(lower * math.sqrt(self.GROWTH), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Percentiles in milliseconds"""
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p90_ms': round(self.percentile(90) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'p99.9_ms': round(self.percentile(99.9) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+class LatencyRecorder:
+    """Thread-safe latency histograms keyed by HTTP method and endpoint template"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, endpoint: str, seconds: float):
+        key = (method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def histogram(self, method: str, endpoint: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get((method.upper(), endpoint_template(endpoint)))
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Summary per 'METHOD /template' bucket"""
+        with self._lock:
+            return {f"{method} {template}": histogram.summary()
+                    for (method, template), histogram in sorted(self._histograms.items())}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+class BusyClock:
+    """Wall time during which at least one tracked operation is in flight.
+
+    Overlapping operations (threads or coroutines) are counted once, so the
+    elapsed value never exceeds real time and can be compared with wall time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self._busy = 0.0
+        self._since = 0.0
+
+    def enter(self):
+        with self._lock:
+            if not self._inflight:
+                self._since = time.perf_counter()
+            self._inflight += 1
+
+    def exit(self):
+        with self._lock:
+            self._inflight -= 1
+            if not self._inflight:
+                self._busy += time.perf_counter() - self._since
+
+    def elapsed(self) -> float:
+        """Busy seconds so far, including any operation still in flight"""
+        with self._lock:
+            busy = self._busy
+            if self._inflight:
+                busy += time.perf_counter() - self._since
+            return busy
+
+
+# Time spent inside the API clients' _make_request, shared by every client in the process
+network_clock = BusyClock()
@@ -0,0 +1,129 @@
+"""Auth token cache shared across threads and pytest-xdist workers"""
+
+import getpass
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+
+def default_directory() -> str:
+    """Per-user directory under the system temp dir, so other users cannot read the token"""
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = str(os.getuid()) if hasattr(os, 'getuid') else 'default'
+    return os.path.join(tempfile.gettempdir(), f"restful-booker-{user}")
+
+
+def _ensure_private_directory(directory: str):
+    """Create directory as 0700, refusing an existing one that is a symlink, not ours, or open to others"""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"Refusing to cache auth tokens in {directory}: not a directory")
+    mode = stat.S_IMODE(info.st_mode)
+    if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or mode != 0o700):
+        raise PermissionError(f"Refusing to cache auth tokens in {directory}: owner uid {info.st_uid}, "
+                              f"mode {mode:o}; expected uid {os.getuid()}, mode 700")
+
+
+class TokenCache:
+    """Expiring auth token with single-flight refresh.
+
+    Inside a process one lock makes concurrent callers wait for a single /auth call.
+    When a path is given the token is also persisted there under a file lock, so
+    every xdist worker reuses the token the first worker obtained. The file is
+    readable by its owner only and by default lives in a per-user directory.
+    """
+
+    _registry: Dict[str, 'TokenCache'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 600.0):
+        self.path = path
+        self.ttl = ttl
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{path}.lock") if path else None
+
+    @classmethod
+    def shared(cls, key: str, persist: bool = True, ttl: float = 600.0,
+               directory: Optional[str] = None) -> 'TokenCache':
+        """Process-wide cache for one key (base URL and username), optionally on disk"""
+        with cls._registry_lock:
+            cache = cls._registry.get(key)
+            if cache is None:
+                path = None
+                if persist:
+                    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+                    directory = directory or default_directory()
+                    _ensure_private_directory(directory)
+                    path = os.path.join(directory, f"restful-booker-token-{digest}.json")
+                cache = cls._registry[key] = cls(path, ttl)
+            return cache
+
+    def get(self, fetch: Callable[[], str]) -> str:
+        """Current token, calling fetch at most once across all waiting threads and workers"""
+        if self._valid():
+            return self._token
+
+        with self._lock:
+            if self._valid():
+                return self._token
+            if self._file_lock is None:
+                self._set(fetch(), time.time() + self.ttl)
+                return self._token
+
+            with self._file_lock:
+                token, expires_at = self._read()
+                if token and expires_at > time.time():
+                    self._set(token, expires_at)
+                else:
+                    self._set(fetch(), time.time() + self.ttl)
+                    self._write()
+            return self._token
+
+    def invalidate(self, token: str):
+        """Drop a token the server rejected, unless another caller already replaced it"""
+        with self._lock:
+            if self._token == token:
+                self._token = None
+                self._expires_at = 0.0
+            if self._file_lock is not None:
+                with self._file_lock:
+                    if self._read()[0] == token:
+                        os.remove(self.path)
+
+    def _valid(self) -> bool:
+        return self._token is not None and self._expires_at > time.time()
+
+    def _set(self, token: str, expires_at: float):
+        self._token = token
+        self._expires_at = expires_at
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return data.get('token'), float(data.get('expires_at', 0))
+        except (OSError, ValueError):
+            return None, 0.0
+
+    def _write(self):
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'token': self._token, 'expires_at': self._expires_at}, f)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Cached auth token in {self.path}")